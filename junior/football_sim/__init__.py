@@ -0,0 +1,23 @@
+"""Football match simulation engine.
+
+Importing the package only loads the engine: no terminal setup, no squad
+generation and no colorama import. Terminal output is initialized when a
+non-headless ``Match`` is simulated.
+"""
+from football_sim.export import ResultExporter
+from football_sim.match import Match
+from football_sim.stats import MatchResult, MatchStats
+from football_sim.team import FORMATIONS, Formation, Player, Team
+from football_sim.xg import XGModel
+
+__all__ = [
+    "FORMATIONS",
+    "Formation",
+    "Match",
+    "MatchResult",
+    "MatchStats",
+    "Player",
+    "ResultExporter",
+    "Team",
+    "XGModel",
+]
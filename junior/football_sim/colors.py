@@ -0,0 +1,44 @@
+"""ANSI color codes for the terminal renderer.
+
+The engine only needs the escape sequences, so they are defined here and
+colorama is imported lazily by ``init_terminal()`` when a match is actually
+rendered (it is still needed on Windows to translate the sequences).
+"""
+
+
+class Fore:
+    BLACK = "\033[30m"
+    RED = "\033[31m"
+    GREEN = "\033[32m"
+    YELLOW = "\033[33m"
+    BLUE = "\033[34m"
+    MAGENTA = "\033[35m"
+    CYAN = "\033[36m"
+    WHITE = "\033[37m"
+
+
+class Back:
+    BLACK = "\033[40m"
+    RED = "\033[41m"
+    GREEN = "\033[42m"
+    YELLOW = "\033[43m"
+    BLUE = "\033[44m"
+    MAGENTA = "\033[45m"
+    CYAN = "\033[46m"
+    WHITE = "\033[47m"
+
+
+class Style:
+    RESET_ALL = "\033[0m"
+
+
+_terminal_ready = False
+
+
+def init_terminal():
+    """Initialize colorama once, the first time a terminal renderer is used."""
+    global _terminal_ready
+    if not _terminal_ready:
+        from colorama import init
+        init()
+        _terminal_ready = True
@@ -0,0 +1,75 @@
+"""Match commentary lines."""
+import random
+
+from football_sim.colors import Fore, Style
+from football_sim.team import Player, Team
+
+
+class Commentator:
+    """Manages dynamic and entertaining match commentary."""
+    
+    def __init__(self):
+        self.goal_comments = [
+            "⚽ GOOOOAAAL! A rocket into the top corner! 🚀",
+            "⚽ WHAT A STRIKE! The stadium is on fire! 🔥",
+            "⚽ UNBELIEVABLE! A goal for the history books! 📚",
+            "⚽ THUNDERBOLT! The keeper is stunned! 😵",
+            "⚽ PURE CLASS! World-class finish! 🌟",
+            "⚽ MAGICAL MOMENT! The fans are ecstatic! 🎉",
+            "⚽ GOAL OF THE CENTURY! Absolute banger! 💥"
+        ]
+        
+        self.save_comments = [
+            "🧤 INCREDIBLE SAVE! The keeper is a fortress! 🏰",
+            "🧤 SUPERB STOP! Lightning reflexes! ⚡",
+            "🧤 WHAT A SAVE! The crowd is speechless! 😲",
+            "🧤 KEEPER'S MASTERCLASS! Denies a sure goal! 🛑",
+            "🧤 MIRACLE SAVE! The stadium erupts! 🌋"
+        ]
+        
+        self.action_comments = [
+            "🪄 Silky smooth combination play!",
+            "🏃 The wing is blazing!",
+            "⚙️ TIKI-TAKA perfection!",
+            "🔥 Intense pressing from the opposition!",
+            "⚽ The ball dances between players!",
+            "🚀 Epic run down the flank!",
+            "🎯 Pinpoint cross into the box!",
+            "💪 Titanic duel in the air!"
+        ]
+        
+        self.foul_comments = [
+            "😣 Ouch! That was a bone-crunching tackle!",
+            "⚠️ Rough challenge! The ref's eyes are sharp!",
+            "🔥 Heavy contact! Things are heating up!",
+            "🪓 Lumberjack tackle! Watch those shins!",
+            "😡 Heated moment! The crowd is buzzing!",
+            "🟨 Yellow card offense! The ref means business!"
+        ]
+        
+        self.crazy_comments = [
+            "😱 OH NO! A fan sprints across in their boxers! 🩳",
+            "🐦 A seagull snatches the ball! ⚽",
+            "📱 The ref's checking their messages mid-game!",
+            "🌭 A fan tosses a hot dog onto the pitch!",
+            "🤸 The keeper does a cartwheel before the kick!",
+            "🎤 The crowd's belting out a pop anthem!"
+        ]
+    
+    def comment_goal(self, scorer: Player, team: Team, goal_type: str, minute: int) -> str:
+        """Generate commentary for a goal scored."""
+        base = random.choice(self.goal_comments)
+        details = (
+            f" {scorer.name} with a {goal_type.upper()} at the {minute}th minute! "
+            f"Legendary strike for {team.name}! 🏆"
+        )
+        return f"{Fore.RED}{base}{Style.RESET_ALL}{details}"
+    
+    def comment_save(self, keeper: Player, shooter: Player) -> str:
+        """Generate commentary for a goalkeeper save."""
+        base = random.choice(self.save_comments)
+        return f"{base} {keeper.name} shuts down {shooter.name} like a boss! 💪"
+    
+    def comment_crazy(self) -> str:
+        """Generate a random entertaining comment."""
+        return random.choice(self.crazy_comments)
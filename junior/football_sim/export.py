@@ -0,0 +1,102 @@
+"""Streaming export of match results to column-oriented files."""
+import os
+from typing import Dict
+
+from football_sim.optional import get_numpy
+from football_sim.stats import MatchResult
+
+
+class ResultExporter:
+    """Stream match results to column-oriented files.
+    
+    Results are buffered as columns and flushed every ``row_group_size``
+    matches, so memory stays bounded however many matches are written.
+    With ``fmt="parquet"`` (requires pyarrow) each table goes to one
+    ``<prefix>_<table>.parquet`` file, one row group per flush. With
+    ``fmt="npz"`` (requires numpy) every flush writes
+    ``<prefix>_<part>.npz`` holding all tables as ``"<table>/<column>"``
+    arrays. Every row carries a ``match_id`` to join the tables.
+    """
+    
+    TABLES = ("matches", "teams", "players", "shots")
+    
+    def __init__(self, prefix: str, fmt: str = "npz", row_group_size: int = 10000):
+        if fmt == "parquet":
+            import pyarrow
+            import pyarrow.parquet
+            self._pa = pyarrow
+            self._writers = {}
+        elif fmt == "npz":
+            if get_numpy() is None:
+                raise ImportError("numpy is required for npz export")
+        else:
+            raise ValueError(f"Unknown export format: {fmt}")
+        os.makedirs(os.path.dirname(prefix) or ".", exist_ok=True)
+        self.prefix = prefix
+        self.fmt = fmt
+        self.row_group_size = row_group_size
+        self.matches_written = 0
+        self._part = 0
+        self._pending = 0
+        self._buffers = {table: {} for table in self.TABLES}
+    
+    def _extend(self, table: str, columns: Dict[str, list], match_id: int):
+        buffer = self._buffers[table]
+        rows = len(next(iter(columns.values()), []))
+        buffer.setdefault("match_id", []).extend([match_id] * rows)
+        for name, values in columns.items():
+            buffer.setdefault(name, []).extend(values)
+    
+    def write(self, result: MatchResult):
+        """Add one match result, flushing a row group when the buffer is full."""
+        match_id = self.matches_written
+        self._extend("matches", {k: [v] for k, v in result.match.items()}, match_id)
+        self._extend("teams", result.teams, match_id)
+        self._extend("players", result.players, match_id)
+        self._extend("shots", result.shots, match_id)
+        self.matches_written += 1
+        self._pending += 1
+        if self._pending >= self.row_group_size:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered rows to disk."""
+        if not self._pending:
+            return
+        if self.fmt == "parquet":
+            for table, columns in self._buffers.items():
+                if not columns.get("match_id"):
+                    continue
+                arrow_table = self._pa.table(columns)
+                writer = self._writers.get(table)
+                if writer is None:
+                    writer = self._pa.parquet.ParquetWriter(
+                        f"{self.prefix}_{table}.parquet", arrow_table.schema
+                    )
+                    self._writers[table] = writer
+                writer.write_table(arrow_table)
+        else:
+            np = get_numpy()
+            arrays = {
+                f"{table}/{name}": np.asarray(values)
+                for table, columns in self._buffers.items()
+                for name, values in columns.items()
+            }
+            np.savez_compressed(f"{self.prefix}_{self._part:05d}.npz", **arrays)
+        self._part += 1
+        self._pending = 0
+        self._buffers = {table: {} for table in self.TABLES}
+    
+    def close(self):
+        """Flush remaining rows and close any open files."""
+        self.flush()
+        if self.fmt == "parquet":
+            for writer in self._writers.values():
+                writer.close()
+            self._writers = {}
+    
+    def __enter__(self) -> "ResultExporter":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
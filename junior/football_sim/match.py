@@ -0,0 +1,1026 @@
+"""Match engine: event simulation, optional terminal rendering."""
+import os
+import random
+import time
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from football_sim.colors import Fore, Style, Back, init_terminal
+from football_sim.commentary import Commentator
+from football_sim.stats import MatchStats, MatchResult
+from football_sim.team import Player, Team
+
+
+class Shot(NamedTuple):
+    """Where a shot is taken from; drawn before the event plays out and scored as is."""
+    zone: str
+    distance: int
+    difficult_angle: bool
+
+
+class Match:
+    """Simulates a football match with field visualization and events."""
+    
+    # Shooting zones: distance range in metres and chance of a tight angle
+    SHOT_ZONES = {
+        "six_yard": (5, 7, 0.35),
+        "box": (8, 16, 0.30),
+        "edge_box": (17, 22, 0.20),
+        "long_range": (23, 35, 0.15),
+    }
+    
+    def __init__(
+        self,
+        team1: Team,
+        team2: Team,
+        stadium: str = "Municipal Stadium",
+        weather: str = "Sunny",
+        temperature: int = 22,
+        attendance: int = 45000,
+        headless: bool = False
+    ):
+        self.team1 = team1
+        self.team2 = team2
+        self.team1.set_opponent(self.team2)
+        self.team2.set_opponent(self.team1)
+        
+        self.stadium = stadium
+        self.weather = weather
+        self.temperature = temperature
+        self.attendance = attendance
+        self.referee = random.choice(["Mr. Dubois", "Mr. Martin", "Ms. Leroux", "Mr. García"])
+        
+        self.time = 0
+        self.halftime = False
+        self.match_duration = 90
+        self.first_half_added_time = 0
+        self.second_half_added_time = 0
+        
+        self.real_time_duration = 45  # Seconds for simulation
+        self.event_interval = 0.7
+        self.headless = headless  # No output and no pauses, for batch runs
+        
+        self.commentator = Commentator()
+        self.stats = MatchStats(team1, team2)
+        self.events = []
+        self.ball_x = 50
+        self.ball_y = 50
+        self.ball_holder_team = None
+    
+    def say(self, *args):
+        """Print match output unless running headless."""
+        if not self.headless:
+            print(*args)
+    
+    def pause(self, seconds: float):
+        """Wait between events unless running headless."""
+        if not self.headless:
+            time.sleep(seconds)
+    
+    def display_field(self):
+        """Display an ASCII field with player positions and ball."""
+        if self.headless:
+            return
+        os.system('cls' if os.name == 'nt' else 'clear')
+        field = [[" " for _ in range(40)] for _ in range(20)]
+        
+        # Draw field boundaries
+        field[0] = ["═" for _ in range(40)]
+        field[-1] = ["═" for _ in range(40)]
+        for i in range(1, 19):
+            field[i][0] = "║"
+            field[i][-1] = "║"
+        
+        # Place team1 players (blue)
+        for player in self.team1.players[:11]:
+            if not player.red_card and not player.injured:
+                x = int(player.x * 19 / 100)
+                y = int(player.y * 39 / 100)
+                emoji = Player.EMOJI_MAP.get(player.position, "⚽")
+                field[x][y] = f"{Fore.BLUE}{emoji}{Style.RESET_ALL}"
+                if player.has_ball:
+                    field[x][y] = f"{Fore.BLUE}⚽{Style.RESET_ALL}"
+        
+        # Place team2 players (yellow)
+        for player in self.team2.players[:11]:
+            if not player.red_card and not player.injured:
+                x = int((100 - player.x) * 19 / 100)
+                y = int((100 - player.y) * 39 / 100)
+                emoji = Player.EMOJI_MAP.get(player.position, "⚽")
+                field[x][y] = f"{Fore.YELLOW}{emoji}{Style.RESET_ALL}"
+                if player.has_ball:
+                    field[x][y] = f"{Fore.YELLOW}⚽{Style.RESET_ALL}"
+        
+        # Place the ball if no player has it
+        if not any(p.has_ball for p in self.team1.players + self.team2.players):
+            ball_x = int(self.ball_x * 19 / 100)
+            ball_y = int(self.ball_y * 39 / 100)
+            field[ball_x][ball_y] = "⚽"
+        
+        # Display the field
+        self.say(f"\n{Back.GREEN}{' ⚽ FIELD ⚽ ':^40}{Style.RESET_ALL}")
+        for line in field:
+            self.say("".join(line))
+        self.say(
+            f"{Fore.GREEN}Score: {self.team1.name} {self.team1.goals_scored} - "
+            f"{self.team2.goals_scored} {self.team2.name}{Style.RESET_ALL}"
+        )
+        self.say(
+            f"Time: {self.time}' | Possession: "
+            f"{self.team1.possession:.0f}% - {self.team2.possession:.0f}%"
+        )
+    
+    def display_prematch_info(self):
+        """Display pre-match information."""
+        if self.headless:
+            return
+        self.say(f"\n{Back.BLUE}{Fore.WHITE}{'═'*80}{Style.RESET_ALL}")
+        self.say(
+            f"{Back.BLUE}{Fore.WHITE}"
+            f"{'⚽ FOOTBALL SIMULATOR - LIVE MATCH':^80}"
+            f"{Style.RESET_ALL}"
+        )
+        self.say(f"{Back.BLUE}{Fore.WHITE}{'═'*80}{Style.RESET_ALL}")
+        
+        self.say(f"\n{Fore.CYAN}🏟️ Venue:{Style.RESET_ALL} {self.stadium}")
+        self.say(f"{Fore.CYAN}🌤️ Weather:{Style.RESET_ALL} {self.weather}, {self.temperature}°C")
+        self.say(f"{Fore.CYAN}👥 Attendance:{Style.RESET_ALL} {self.attendance:,} spectators")
+        self.say(f"{Fore.CYAN}🧑‍⚖️ Referee:{Style.RESET_ALL} {self.referee}")
+        self.say(f"{Fore.CYAN}🕐 Time:{Style.RESET_ALL} {datetime.now().strftime('%H:%M')}")
+        
+        self.say(f"\n{Back.GREEN}{Fore.WHITE} ⚽ TEAMS ⚽ {Style.RESET_ALL}")
+        self.say(f"\n{Fore.MAGENTA}🏠 {self.team1.name.upper()}{Style.RESET_ALL} ({self.team1.formation.name})")
+        self.say(f"   👨‍💼 Manager: {self.team1.manager}")
+        self.say(f"   👕 Kit: {self.team1.kit_color}")
+        
+        self.say(f"\n{Fore.YELLOW}✈️ {self.team2.name.upper()}{Style.RESET_ALL} ({self.team2.formation.name})")
+        self.say(f"   👨‍💼 Manager: {self.team2.manager}")
+        self.say(f"   👕 Kit: {self.team2.kit_color}")
+        
+        self.say(f"\n{Back.WHITE}{Fore.BLACK} ⚽ LINE-UPS ⚽ {Style.RESET_ALL}")
+        
+        self.say(f"\n{Fore.MAGENTA}{self.team1.name}:{Style.RESET_ALL}")
+        for i, player in enumerate(self.team1.players[:11], 1):
+            self.say(f"  {i:2d}. {player.name:15} ({player.position}) - Rating: {player.get_overall_rating()}")
+        
+        self.say(f"\n{Fore.YELLOW}{self.team2.name}:{Style.RESET_ALL}")
+        for i, player in enumerate(self.team2.players[:11], 1):
+            self.say(f"  {i:2d}. {player.name:15} ({player.position}) - Rating: {player.get_overall_rating()}")
+        
+        self.say(f"\n{Fore.GREEN}🎮 Press Enter to start the match...{Style.RESET_ALL}")
+        input()
+    
+    def calculate_probabilities(self, attacking_team: Team, action_type: str) -> float:
+        """Calculate event probabilities based on context."""
+        active_players = [p for p in attacking_team.players[:11] if not p.red_card and not p.injured]
+        if not active_players:
+            return 0.0
+        avg_rating = sum(p.get_overall_rating() for p in active_players) / len(active_players)
+        avg_fatigue = sum(p.fatigue for p in active_players) / len(active_players)
+        possession = attacking_team.possession / 100
+        
+        weather_factor = {
+            "Sunny": 1.0,
+            "Cloudy": 0.95,
+            "Rainy": 0.80,
+            "Windy": 0.85
+        }.get(self.weather, 1.0)
+        
+        fatigue_factor = max(0.65, 1 - avg_fatigue / 130)
+        
+        if self.time > 75:
+            fatigue_factor *= 0.80
+        if self.time > 85:
+            fatigue_factor *= 0.70
+            
+        base_multiplier = (avg_rating / 100) * weather_factor * fatigue_factor * possession
+        
+        probabilities = {
+            "goal": max(0.01, 0.05 * base_multiplier),
+            "shot_on_target": max(0.03, 0.10 * base_multiplier),
+            "shot_off_target": max(0.05, 0.15 * base_multiplier)
+        }
+        
+        return probabilities.get(action_type, base_multiplier)
+    
+    def move_ball(self, player: Player, action: str):
+        """Move the ball based on player action."""
+        if action == "attack":
+            self.ball_x = player.x + random.randint(1, 3)
+            self.ball_y = player.y + random.randint(-2, 2)
+        elif action == "pass":
+            self.ball_x += random.randint(-2, 2)
+            self.ball_y += random.randint(-3, 3)
+        elif action == "shot":
+            self.ball_x = 95 if player in self.team1.players else 5
+            self.ball_y = random.randint(40, 60)
+        self.ball_x = max(0, min(100, self.ball_x))
+        self.ball_y = max(0, min(100, self.ball_y))
+    
+    def assign_ball(self, team: Optional[Team], player: Optional[Player] = None):
+        """Assign the ball to a player or team."""
+        for p in self.team1.players + self.team2.players:
+            p.has_ball = False
+        if player:
+            player.has_ball = True
+            self.ball_holder_team = team
+            self.ball_x = player.x
+            self.ball_y = player.y
+        else:
+            self.ball_holder_team = team
+    
+    def draw_shot(self, shot_type: str, zone: Optional[str] = None) -> Shot:
+        """Draw the position of a shot: its zone (unless given), distance and angle."""
+        if shot_type == "penalty":
+            return Shot("penalty_spot", 11, False)
+        if zone is None:
+            if shot_type == "free_kick":
+                zone = random.choice(["edge_box", "long_range"])
+            elif shot_type == "header":
+                zone = random.choice(["six_yard", "box"])
+            else:
+                zone = random.choices(list(self.SHOT_ZONES), weights=[15, 45, 25, 15], k=1)[0]
+        low, high, angle_chance = self.SHOT_ZONES[zone]
+        return Shot(zone, random.randint(low, high), random.random() < angle_chance)
+    
+    def record_shot(self, team: Team, shooter: Player, shot_type: str, outcome: str, shot: Shot):
+        """Log a handled shot and its xG, from the position it was taken at."""
+        self.stats.record_shot(team, shooter, shot.distance, shot.difficult_angle, shot_type, outcome)
+    
+    def simulate_event(self):
+        """Simulate a match event with realistic visualization."""
+        self.stats.advance(self.time)
+        self.display_field()
+        
+        # Random entertaining event
+        if random.random() < 0.02:
+            self.say(f"{Fore.MAGENTA}{self.commentator.comment_crazy()}{Style.RESET_ALL}")
+            self.pause(2)
+        
+        # Check for substitutions
+        if random.random() < 0.05 and self.time > 60:
+            for team in [self.team1, self.team2]:
+                for tired_player, sub in team.auto_substitute():
+                    self.say(
+                        f"{Fore.YELLOW}{self.time}' - 🔄 Substitution for {team.name}: "
+                        f"{tired_player.name} OUT, {sub.name} IN{Style.RESET_ALL}"
+                    )
+                    self.pause(1)
+        
+        momentum = (self.team1.goals_scored - self.team2.goals_scored) * 0.06
+        possession_adj = self.team1.possession + momentum * 3
+        
+        attacking_team = random.choices(
+            [self.team1, self.team2],
+            weights=[possession_adj, 100 - possession_adj],
+            k=1
+        )[0]
+        defending_team = attacking_team.opponent
+        
+        possession_change = random.gauss(0, 1.2)
+        if random.random() < 0.06:
+            possession_change = random.gauss(0, 5)
+            
+        attacking_team.possession += possession_change
+        attacking_team.possession = max(35, min(65, attacking_team.possession))
+        defending_team.possession = 100 - attacking_team.possession
+        
+        base_weights = [1.5, 8, 6, 25, 8, 6, 3, 1, 2, 40]
+        
+        if self.time > 80:
+            base_weights[0] *= 1.5
+            base_weights[4] *= 1.3
+            
+        if abs(self.team1.goals_scored - self.team2.goals_scored) >= 3:
+            base_weights[0] *= 0.60
+            base_weights[-1] *= 1.5
+        
+        event = random.choices(
+            ["goal", "shot_on_target", "shot_off_target", "pass", "foul",
+             "corner", "card", "injury", "offside", "nothing"],
+            weights=base_weights,
+            k=1
+        )[0]
+        
+        time_str = f"{Fore.YELLOW}{self.time:2d}'{Style.RESET_ALL}"
+        
+        # Assign ball to a player if not already assigned
+        if not self.ball_holder_team:
+            self.assign_ball(attacking_team, attacking_team.get_random_player())
+        
+        if event == "goal":
+            self.handle_goal(attacking_team, defending_team, time_str)
+        elif event == "shot_on_target":
+            self.handle_shot_on_target(attacking_team, defending_team, time_str)
+        elif event == "shot_off_target":
+            self.handle_shot_off_target(attacking_team, time_str)
+        elif event == "pass":
+            self.handle_pass(attacking_team, time_str)
+        elif event == "foul":
+            self.handle_foul(attacking_team, defending_team, time_str)
+        elif event == "corner":
+            self.handle_corner(attacking_team, time_str)
+        elif event == "card":
+            self.handle_card(attacking_team, time_str)
+        elif event == "injury":
+            self.handle_injury(attacking_team, time_str)
+        elif event == "offside":
+            self.handle_offside(attacking_team, time_str)
+        
+        for player in attacking_team.players[:11]:
+            if not player.red_card and not player.injured:
+                player.fatigue += random.uniform(0.3, 0.5)
+                player.distance_covered += random.uniform(0.08, 0.20)
+    
+    def handle_goal(self, attacking_team: Team, defending_team: Team, time_str: str):
+        """Handle a goal event with realistic details."""
+        goal_types = ["strike", "header", "volley", "free_kick", "penalty", "lob", "counter_attack"]
+        type_weights = [35, 25, 10, 8, 5, 8, 15]
+        
+        goal_zone = random.choice(["box", "six_yard", "edge_box", "long_range"])
+        
+        if goal_zone == "long_range":
+            type_weights = [45, 2, 8, 20, 0, 15, 10]
+        elif goal_zone == "six_yard":
+            type_weights = [10, 50, 5, 0, 0, 5, 30]
+            
+        goal_type = random.choices(goal_types, weights=type_weights, k=1)[0]
+        shot = self.draw_shot(goal_type, goal_zone)
+        
+        if goal_type == "free_kick":
+            scorer = attacking_team.get_best_shooter()
+        elif goal_type == "penalty":
+            scorer = attacking_team.get_best_shooter()
+        elif goal_type == "header":
+            scorer = attacking_team.get_random_player(zone="attack") or attacking_team.get_random_player()
+        else:
+            scorer = (
+                attacking_team.get_random_player(zone="attack") or
+                attacking_team.get_random_player(zone="midfield")
+            )
+        
+        if not scorer:
+            return
+            
+        scorer.move("attack")
+        self.assign_ball(attacking_team, scorer)
+        
+        assister = None
+        if goal_type not in ["free_kick", "penalty"] and random.random() < 0.60:
+            assister = attacking_team.get_random_player()
+            if assister == scorer:
+                assister = None
+            else:
+                assister.move("pass")
+        
+        self.record_shot(attacking_team, scorer, goal_type, "goal", shot)
+        scorer.goals += 1
+        scorer.shots += 1
+        scorer.shots_on_target += 1
+        scorer.fatigue += random.randint(4, 8)
+        scorer.rating += random.uniform(0.7, 1.4)
+        
+        if assister:
+            assister.assists += 1
+            assister.passes += 1
+            assister.successful_passes += 1
+            assister.rating += random.uniform(0.4, 0.8)
+        
+        attacking_team.goals_scored += 1
+        attacking_team.shots += 1
+        attacking_team.shots_on_target += 1
+        defending_team.goals_conceded += 1
+        
+        keeper = defending_team.get_random_player(position="G")
+        if keeper:
+            keeper.rating -= random.uniform(0.5, 1.0)
+        
+        self.say(f"\n{time_str} ═══════════════════════════════════")
+        self.say(self.commentator.comment_goal(scorer, attacking_team, goal_type, self.time))
+        
+        if assister:
+            self.say(f"   🎯 {Fore.BLUE}Assist by {assister.name}{Style.RESET_ALL}")
+        
+        self.say(f"   📍 Zone: {shot.zone.replace('_', ' ').title()} ({shot.distance}m)")
+        self.say(
+            f"   ⚽ {Fore.GREEN}Score: {self.team1.name} {self.team1.goals_scored} - "
+            f"{self.team2.goals_scored} {self.team2.name}{Style.RESET_ALL}"
+        )
+        self.say(f"════════════════════════════════════")
+        
+        crowd_reactions = [
+            "🎉 The crowd is going ABSOLUTELY WILD!",
+            "😶 Stunned silence in the stands!",
+            "🎉 Fans are throwing confetti everywhere!",
+            "🎉 Pure ecstasy in the stadium!"
+        ]
+        self.say(f"   🎭 {random.choice(crowd_reactions)}")
+        
+        self.assign_ball(None, None)  # Reset ball to center
+        self.ball_x = 50
+        self.ball_y = 50
+        self.display_field()
+        self.pause(2)
+    
+    def handle_shot_on_target(self, attacking_team: Team, defending_team: Team, time_str: str):
+        """Handle shots on target with goalkeeper saves."""
+        shooter = (
+            attacking_team.get_random_player(zone="attack") or
+            attacking_team.get_random_player()
+        )
+        keeper = defending_team.get_random_player(position="G")
+        
+        if not shooter or not keeper:
+            return
+            
+        shooter.move("attack")
+        self.assign_ball(attacking_team, shooter)
+        shot_types = ["strike", "header", "volley", "lob"]
+        shot_type = random.choice(shot_types)
+        shot = self.draw_shot(shot_type)
+        
+        self.record_shot(attacking_team, shooter, shot_type, "save", shot)
+        shooter.shots += 1
+        shooter.shots_on_target += 1
+        shooter.fatigue += random.randint(2, 5)
+        attacking_team.shots += 1
+        attacking_team.shots_on_target += 1
+        
+        keeper.fatigue += random.randint(3, 6)
+        keeper.rating += random.uniform(0.2, 0.5)
+        
+        save_types = ["dive", "reflex", "block", "parry", "leap"]
+        save_type = random.choice(save_types)
+        
+        self.say(
+            f"{time_str} - 🎯 {Fore.CYAN}Shot by {shooter.name}{Style.RESET_ALL} ({attacking_team.name}) "
+            f"from {shot.distance}m"
+        )
+        self.say(f"   {self.commentator.comment_save(keeper, shooter)}")
+        self.say(f"   🧤 {save_type.title()} save by {keeper.name}")
+        
+        if random.random() < 0.10:
+            self.say(f"   ⚡ Rebound in the box! DANGER!")
+        
+        self.assign_ball(defending_team, keeper)
+        self.display_field()
+    
+    def handle_shot_off_target(self, attacking_team: Team, time_str: str):
+        """Handle shots off target."""
+        shooter = (
+            attacking_team.get_random_player(zone="attack") or
+            attacking_team.get_random_player()
+        )
+        if not shooter:
+            return
+            
+        shooter.move("attack")
+        self.assign_ball(attacking_team, shooter)
+        directions = ["wide", "over", "off the post", "off the bar"]
+        direction = random.choice(directions)
+        shot = self.draw_shot("strike")
+        
+        self.record_shot(attacking_team, shooter, "strike", "off_target", shot)
+        shooter.shots += 1
+        shooter.fatigue += random.randint(1, 3)
+        attacking_team.shots += 1
+        
+        if direction in ["off the post", "off the bar"]:
+            self.say(
+                f"{time_str} - 😱 {Fore.YELLOW}OH! {shooter.name}'s shot {direction}! "
+                f"So close!{Style.RESET_ALL}"
+            )
+            shooter.rating += 0.3
+        else:
+            self.say(f"{time_str} - 🎯 Shot {direction} by {shooter.name} ({attacking_team.name}) from {shot.distance}m")
+        
+        self.assign_ball(attacking_team.opponent, None)
+        self.display_field()
+    
+    def handle_pass(self, attacking_team: Team, time_str: str):
+        """Handle passes and build-up play."""
+        passer = attacking_team.get_random_player()
+        if not passer:
+            return
+            
+        passer.move("pass")
+        self.assign_ball(attacking_team, passer)
+        pass_types = ["short", "long", "cross", "one-two", "backheel"]
+        pass_weights = [45, 20, 15, 15, 5]
+        
+        if passer.position in ["CB", "DM"]:
+            pass_weights = [30, 35, 10, 20, 5]
+        elif passer.position in ["RW", "LW"]:
+            pass_weights = [20, 15, 45, 15, 5]
+            
+        pass_type = random.choices(pass_types, weights=pass_weights, k=1)[0]
+        
+        passer.passes += 1
+        success_rate = (passer.technique + passer.mental) / 140
+        is_successful = random.random() < success_rate
+        
+        if is_successful:
+            passer.successful_passes += 1
+            attacking_team.successful_passes += 1
+            passer.rating += 0.07
+            new_holder = attacking_team.get_random_player()
+            if new_holder and new_holder != passer:
+                self.assign_ball(attacking_team, new_holder)
+        
+        attacking_team.passes += 1
+        
+        if random.random() < 0.10:
+            adjective = random.choice(["BRILLIANT", "FANTASTIC", "PRECISE", "PINPOINT"])
+            if pass_type == "long" and is_successful:
+                self.say(f"{time_str} - 📐 {adjective} long pass by {passer.name}")
+            elif pass_type == "cross":
+                self.say(f"{time_str} - 🎯 Cross by {passer.name} into the DANGER ZONE!")
+                attacking_team.corners += random.choice([0, 0, 0, 1])
+        
+        if not is_successful:
+            self.assign_ball(attacking_team.opponent, None)
+        
+        self.display_field()
+    
+    def handle_foul(self, attacking_team: Team, defending_team: Team, time_str: str):
+        """Handle fouls with realistic outcomes."""
+        offender = attacking_team.get_random_player()
+        victim = defending_team.get_random_player()
+        
+        if not offender or not victim:
+            return
+        
+        offender.move("defense")
+        self.assign_ball(attacking_team, offender)
+        foul_types = ["tackle", "push", "charge", "kick", "handball", "unsportsmanlike"]
+        severities = ["minor", "moderate", "severe"]
+        
+        if offender.position in ["CB", "RB", "LB"]:
+            foul_type = random.choices(foul_types, weights=[40, 20, 20, 10, 5, 5], k=1)[0]
+        else:
+            foul_type = random.choices(foul_types, weights=[20, 30, 15, 15, 15, 5], k=1)[0]
+        
+        severity = random.choices(severities, weights=[70, 20, 10], k=1)[0]
+        
+        zones = ["attacking_box", "30m", "midfield", "defensive_box"]
+        zone = random.choice(zones)
+        
+        offender.fouls += 1
+        offender.fatigue += random.randint(1, 4)
+        attacking_team.fouls += 1
+        
+        sanction = "none"
+        if severity == "severe" or (severity == "moderate" and random.random() < 0.30):
+            if offender.yellow_cards == 1:
+                sanction = "red"
+                offender.red_card = True
+                attacking_team.red_cards += 1
+                offender.rating -= 2.5
+            elif random.random() < 0.70:
+                sanction = "yellow"
+                offender.yellow_cards += 1
+                attacking_team.yellow_cards += 1
+                offender.rating -= 0.6
+        elif severity == "moderate" and random.random() < 0.12:
+            sanction = "yellow"
+            offender.yellow_cards += 1
+            attacking_team.yellow_cards += 1
+            offender.rating -= 0.6
+        
+        if sanction == "red":
+            self.say(
+                f"{time_str} - 🟥 {Fore.RED}RED CARD! {offender.name} is sent off!"
+                f"{Style.RESET_ALL}"
+            )
+            self.say(f"   ⚡ {attacking_team.name} down to 10 men!")
+        elif sanction == "yellow":
+            self.say(
+                f"{time_str} - 🟨 Yellow card for {offender.name} ({attacking_team.name}) - "
+                f"{foul_type}"
+            )
+        elif severity == "severe":
+            self.say(f"{time_str} - ⚠️ Harsh foul by {offender.name} on {victim.name}")
+        elif random.random() < 0.20:
+            self.say(f"{time_str} - Foul by {offender.name} on {victim.name}")
+        
+        if zone == "attacking_box" and severity in ["moderate", "severe"]:
+            if random.random() < 0.10:
+                self.say(f"   ⚽ PENALTY for {defending_team.name}!")
+                self.pause(1)
+                self.handle_penalty(defending_team, attacking_team)
+        elif zone in ["30m", "attacking_box"]:
+            self.say(f"   🎯 Dangerous free kick for {defending_team.name}")
+            if random.random() < 0.07:
+                self.pause(0.5)
+                self.handle_free_kick(defending_team, attacking_team)
+        
+        self.assign_ball(defending_team, None)
+        self.display_field()
+    
+    def handle_penalty(self, shooting_team: Team, defending_team: Team):
+        """Handle a penalty sequence."""
+        shooter = shooting_team.get_best_shooter()
+        keeper = defending_team.get_random_player(position="G")
+        
+        if not shooter or not keeper:
+            return
+        
+        shooter.move("attack")
+        self.assign_ball(shooting_team, shooter)
+        self.say(f"   🎯 {shooter.name} vs {keeper.name}")
+        self.say(f"   🔥 The stadium holds its breath...")
+        self.pause(2)
+        
+        shot = self.draw_shot("penalty")
+        shooter_accuracy = shooter.attack + shooter.technique + shooter.mental
+        keeper_quality = keeper.defense + keeper.mental
+        
+        goal_chance = shooter_accuracy + random.randint(-20, 20)
+        save_chance = keeper_quality + random.randint(-10, 30)
+        
+        if goal_chance > save_chance + 25:
+            self.record_shot(shooting_team, shooter, "penalty", "goal", shot)
+            shooter.goals += 1
+            shooter.shots += 1
+            shooter.shots_on_target += 1
+            shooting_team.goals_scored += 1
+            defending_team.goals_conceded += 1
+            shooter.rating += 1.0
+            keeper.rating -= 0.4
+            self.say(f"   ⚽ {Fore.GREEN}GOAL! {shooter.name} smashes it!{Style.RESET_ALL}")
+            self.say(
+                f"   📊 Score: {self.team1.name} {self.team1.goals_scored} - "
+                f"{self.team2.goals_scored} {self.team2.name}"
+            )
+        elif save_chance > goal_chance:
+            self.record_shot(shooting_team, shooter, "penalty", "save", shot)
+            keeper.rating += 1.3
+            shooter.rating -= 0.7
+            shooter.shots += 1
+            shooter.shots_on_target += 1
+            self.say(f"   🧤 {Fore.YELLOW}EPIC SAVE! {keeper.name} stops the penalty!{Style.RESET_ALL}")
+            self.say(f"   🎭 The crowd goes wild!")
+        else:
+            self.record_shot(shooting_team, shooter, "penalty", "off_target", shot)
+            shooter.shots += 1
+            shooter.rating -= 0.9
+            self.say(f"   😱 {Fore.RED}MISSED! {shooter.name} blasts it over!{Style.RESET_ALL}")
+        
+        self.assign_ball(None, None)
+        self.ball_x = 50
+        self.ball_y = 50
+        self.display_field()
+    
+    def handle_free_kick(self, shooting_team: Team, defending_team: Team):
+        """Handle dangerous free kicks."""
+        shooter = shooting_team.get_best_shooter()
+        keeper = defending_team.get_random_player(position="G")
+        
+        if not shooter or not keeper:
+            return
+        
+        shooter.move("attack")
+        self.assign_ball(shooting_team, shooter)
+        self.say(f"   🎯 Free kick taken by {shooter.name}...")
+        
+        fk_types = ["direct", "curled", "powerful", "placed"]
+        fk_type = random.choice(fk_types)
+        
+        shot = self.draw_shot("free_kick")
+        # Every metre beyond the edge of the box makes it harder
+        goal_chance = (shooter.attack + shooter.technique) * 0.70 + random.randint(-10, 10) - (shot.distance - 17)
+        
+        if goal_chance > 80:
+            self.record_shot(shooting_team, shooter, "free_kick", "goal", shot)
+            shooter.goals += 1
+            shooting_team.goals_scored += 1
+            defending_team.goals_conceded += 1
+            shooter.rating += 1.4
+            self.say(f"   ⚽ {Fore.GREEN}STUNNING! {fk_type.title()} free kick in the top corner!{Style.RESET_ALL}")
+        elif goal_chance > 60:
+            self.record_shot(shooting_team, shooter, "free_kick", "save", shot)
+            self.say(f"   🧤 Great save by the keeper on the {fk_type} free kick")
+            keeper.rating += 0.4
+        else:
+            self.record_shot(shooting_team, shooter, "free_kick", "off_target", shot)
+            self.say(f"   📐 {fk_type.title()} free kick hits the wall or goes wide!")
+        
+        self.assign_ball(defending_team, None)
+        self.display_field()
+    
+    def handle_corner(self, attacking_team: Team, time_str: str):
+        """Handle corners."""
+        attacking_team.corners += 1
+        corner_taker = attacking_team.get_random_player()
+        
+        if corner_taker:
+            corner_taker.move("pass")
+            self.assign_ball(attacking_team, corner_taker)
+            corner_taker.corners_taken += 1
+            corner_taker.crosses += 1
+        
+        self.say(f"{time_str} - 📐 Corner for {Fore.CYAN}{attacking_team.name}{Style.RESET_ALL}")
+        
+        if random.random() < 0.12:
+            self.say(f"   🎯 Dangerous cross into the box!")
+            if random.random() < 0.10:
+                self.pause(0.5)
+                self.handle_corner_goal(attacking_team)
+        
+        self.assign_ball(attacking_team.opponent, None)
+        self.display_field()
+    
+    def handle_corner_goal(self, attacking_team: Team):
+        """Handle a goal from a corner."""
+        scorer = attacking_team.get_random_player(zone="attack") or attacking_team.get_random_player()
+        if not scorer:
+            return
+        
+        scorer.move("attack")
+        self.assign_ball(attacking_team, scorer)
+        self.record_shot(attacking_team, scorer, "header", "goal", self.draw_shot("header"))
+        scorer.goals += 1
+        attacking_team.goals_scored += 1
+        attacking_team.opponent.goals_conceded += 1
+        scorer.rating += 1.2
+        
+        self.say(f"   ⚽ {Fore.GREEN}GOAL FROM CORNER! {scorer.name} rises highest!{Style.RESET_ALL}")
+        self.say(
+            f"   📊 Score: {self.team1.name} {self.team1.goals_scored} - "
+            f"{self.team2.goals_scored} {self.team2.name}"
+        )
+        
+        self.assign_ball(None, None)
+        self.ball_x = 50
+        self.ball_y = 50
+        self.display_field()
+    
+    def handle_card(self, attacking_team: Team, time_str: str):
+        """Handle isolated card events."""
+        player = attacking_team.get_random_player()
+        if not player:
+            return
+        
+        player.move("defense")
+        self.assign_ball(attacking_team, player)
+        if random.random() < 0.08 and player.yellow_cards < 2:
+            player.yellow_cards += 1
+            player.rating -= 0.5
+            self.say(f"{time_str} - 🟨 Yellow card for {player.name} (dissent or sneaky tackle!)")
+        
+        self.assign_ball(attacking_team.opponent, None)
+        self.display_field()
+    
+    def handle_injury(self, attacking_team: Team, time_str: str):
+        """Handle injury events."""
+        player = attacking_team.get_random_player()
+        if not player:
+            return
+        
+        player.move("defense")
+        self.assign_ball(attacking_team, player)
+        if random.random() < player.get_injury_risk():
+            player.injured = True
+            player.rating -= 1.0
+            self.say(f"{time_str} - 🤕 INJURY! {player.name} is down and can't continue!")
+            sub = attacking_team.substitute(player)
+            if sub:
+                self.say(
+                    f"   🔄 Substitution for {attacking_team.name}: "
+                    f"{player.name} OUT, {sub.name} IN"
+                )
+        
+        self.assign_ball(attacking_team.opponent, None)
+        self.display_field()
+    
+    def handle_offside(self, attacking_team: Team, time_str: str):
+        """Handle offside events."""
+        attacking_team.offsides += 1
+        offside_player = attacking_team.get_random_player(zone="attack")
+        if offside_player:
+            offside_player.move("attack")
+            self.assign_ball(attacking_team, offside_player)
+            self.say(f"{time_str} - 🚩 Offside! {offside_player.name} caught napping!")
+        
+        self.assign_ball(attacking_team.opponent, None)
+        self.display_field()
+    
+    def display_halftime(self):
+        """Display halftime statistics."""
+        if self.headless:
+            return
+        self.say(f"\n{Back.YELLOW}{Fore.BLACK}{'⏸️ HALFTIME':^80}{Style.RESET_ALL}")
+        self.say(f"\n{Fore.GREEN}📊 FIRST HALF STATS:{Style.RESET_ALL}")
+        self.say(f"{'='*60}")
+        
+        self.say(f"{Fore.MAGENTA}{self.team1.name:20}{Style.RESET_ALL} | {Fore.YELLOW}{self.team2.name:20}{Style.RESET_ALL}")
+        self.say(f"{'-'*60}")
+        self.say(f"{'Goals:':15} {self.team1.goals_scored:^10} | {self.team2.goals_scored:^10}")
+        self.say(f"{'Shots:':15} {self.team1.shots:^10} | {self.team2.shots:^10}")
+        self.say(f"{'On Target:':15} {self.team1.shots_on_target:^10} | {self.team2.shots_on_target:^10}")
+        self.say(
+            f"{'Possession:':15} {self.stats.get_possession(self.team1):^8.0f}% | "
+            f"{self.stats.get_possession(self.team2):^8.0f}%"
+        )
+        self.say(f"{'Corners:':15} {self.team1.corners:^10} | {self.team2.corners:^10}")
+        self.say(f"{'Fouls:':15} {self.team1.fouls:^10} | {self.team2.fouls:^10}")
+        self.say(f"{'Yellow Cards:':15} {self.team1.yellow_cards:^10} | {self.team2.yellow_cards:^10}")
+        self.say(f"{'Red Cards:':15} {self.team1.red_cards:^10} | {self.team2.red_cards:^10}")
+        self.say(f"{'='*60}")
+        
+        self.say(f"\n⭐ {Fore.CYAN}STANDOUT PLAYERS:{Style.RESET_ALL}")
+        top_players = self.stats.get_top_performers(3, min_rating=7.0)
+        
+        for i, player in enumerate(top_players, 1):
+            self.say(f"   {i}. {player.name} ({player.team.name}) - Rating: {player.rating:.1f}")
+        
+        self.say(f"\n{Fore.GREEN}⚽ Halftime - Players refuel and regroup!{Style.RESET_ALL}")
+        self.pause(3)
+    
+    def display_final_stats(self):
+        """Display final match statistics."""
+        self.say(f"\n{Back.GREEN}{Fore.WHITE}{'🏁 MATCH ENDED - STATS':^80}{Style.RESET_ALL}")
+        
+        self.say(f"\n{Back.WHITE}{Fore.BLACK}{'FINAL SCORE':^80}{Style.RESET_ALL}")
+        self.say(
+            f"{Fore.MAGENTA}{self.team1.name:^25}{Style.RESET_ALL} "
+            f"{self.team1.goals_scored:^5} - {self.team2.goals_scored:^5} "
+            f"{Fore.YELLOW}{self.team2.name:^25}{Style.RESET_ALL}"
+        )
+        
+        if self.team1.goals_scored > self.team2.goals_scored:
+            self.say(f"\n🏆 {Fore.GREEN}EPIC VICTORY FOR {self.team1.name.upper()}!{Style.RESET_ALL}")
+        elif self.team2.goals_scored > self.team1.goals_scored:
+            self.say(f"\n🏆 {Fore.GREEN}EPIC VICTORY FOR {self.team2.name.upper()}!{Style.RESET_ALL}")
+        else:
+            self.say(f"\n🤝 {Fore.YELLOW}DRAMATIC DRAW!{Style.RESET_ALL}")
+        
+        self.say(f"\n{Back.BLUE}{Fore.WHITE}{'DETAILED STATS':^80}{Style.RESET_ALL}")
+        self.say(f"{'='*80}")
+        self.say(
+            f"{'Statistic':^20} | {self.team1.name:^25} | {self.team2.name:^25}"
+        )
+        self.say(f"{'-'*80}")
+        
+        stats = [
+            ("Goals", self.team1.goals_scored, self.team2.goals_scored),
+            ("Shots", self.team1.shots, self.team2.shots),
+            ("Shots on Target", self.team1.shots_on_target, self.team2.shots_on_target),
+            (
+                "Possession %",
+                f"{self.stats.get_possession(self.team1):.0f}",
+                f"{self.stats.get_possession(self.team2):.0f}"
+            ),
+            ("Passes", self.team1.passes, self.team2.passes),
+            (
+                "Pass Success %",
+                f"{self.stats.get_pass_accuracy(self.team1):.0f}",
+                f"{self.stats.get_pass_accuracy(self.team2):.0f}"
+            ),
+            (
+                "Expected Goals",
+                f"{self.stats.get_xg(self.team1):.2f}",
+                f"{self.stats.get_xg(self.team2):.2f}"
+            ),
+            ("Corners", self.team1.corners, self.team2.corners),
+            ("Offsides", self.team1.offsides, self.team2.offsides),
+            ("Fouls", self.team1.fouls, self.team2.fouls),
+            ("Yellow Cards", self.team1.yellow_cards, self.team2.yellow_cards),
+            ("Red Cards", self.team1.red_cards, self.team2.red_cards),
+        ]
+        
+        for stat, val1, val2 in stats:
+            self.say(f"{stat:^20} | {str(val1):^25} | {str(val2):^25}")
+        
+        self.say(f"{'='*80}")
+        
+        self.say(f"\n⚽ {Fore.GREEN}GOALSCORERS:{Style.RESET_ALL}")
+        all_scorers = [
+            (p, self.team1) for p in self.team1.players if p.goals > 0
+        ] + [
+            (p, self.team2) for p in self.team2.players if p.goals > 0
+        ]
+        
+        if all_scorers:
+            all_scorers.sort(key=lambda x: x[0].goals, reverse=True)
+            for player, team in all_scorers:
+                self.say(
+                    f"   🥅 {player.name} ({team.name}) - "
+                    f"{player.goals} goal{'s' if player.goals > 1 else ''}"
+                )
+        else:
+            self.say("   No goals scored in this match")
+        
+        self.say(f"\n⭐ {Fore.CYAN}PLAYER RATINGS:{Style.RESET_ALL}")
+        
+        for team in [self.team1, self.team2]:
+            self.say(f"\n{Fore.MAGENTA if team == self.team1 else Fore.YELLOW}{team.name}:{Style.RESET_ALL}")
+            rated_players = sorted(team.players[:11], key=lambda x: x.rating, reverse=True)
+            
+            for player in rated_players:
+                rating_color = (
+                    Fore.GREEN if player.rating >= 7.5 else
+                    Fore.YELLOW if player.rating >= 6.5 else
+                    Fore.RED
+                )
+                cards = (
+                    " 🟥" if player.red_card else
+                    f" 🟨x{player.yellow_cards}" if player.yellow_cards > 0 else
+                    ""
+                )
+                injury = " 🤕" if player.injured else ""
+                player_stats = (
+                    f"({player.goals}⚽, {player.shots}🎯, {player.fouls}⚠️)"
+                )
+                self.say(
+                    f"   {player.name:15} ({player.position:3}) - "
+                    f"Rating: {rating_color}{player.rating:4.1f}{Style.RESET_ALL} "
+                    f"{player_stats}{cards}{injury}"
+                )
+        
+        man_of_match = self.stats.get_top_performers(1)[0]
+        motm_team = man_of_match.team
+        
+        self.say(
+            f"\n🏅 {Fore.YELLOW}MAN OF THE MATCH: {man_of_match.name} ({motm_team.name}) - "
+            f"Rating: {man_of_match.rating:.1f}{Style.RESET_ALL}"
+        )
+        
+        self.say(f"\n{Back.BLACK}{Fore.WHITE}{'Thanks for following the live match!':^80}{Style.RESET_ALL}")
+        self.say(f"{Back.BLACK}{Fore.WHITE}{'⚽ FOOTBALL SIMULATOR - END':^80}{Style.RESET_ALL}")
+    
+    def award_points(self):
+        """Give league points to both teams based on the final score."""
+        if self.team1.goals_scored > self.team2.goals_scored:
+            self.team1.points += 3
+        elif self.team2.goals_scored > self.team1.goals_scored:
+            self.team2.points += 3
+        else:
+            self.team1.points += 1
+            self.team2.points += 1
+    
+    def get_result(self) -> "MatchResult":
+        """Snapshot the match outcome and statistics for export."""
+        return MatchResult(self)
+    
+    def simulate(self) -> "MatchResult":
+        """Simulate a full match with visualization and atmosphere."""
+        if not self.headless:
+            init_terminal()
+        self.display_prematch_info()
+        
+        self.say(f"\n{Fore.GREEN}🔴 LIVE - KICK-OFF!{Style.RESET_ALL}")
+        self.say(f"⚽ {self.referee} starts the match with authority!")
+        self.say(f"🌡️ Temperature: {self.temperature}°C - Conditions: {self.weather}")
+        self.assign_ball(self.team1, self.team1.get_random_player())
+        self.pause(1)
+        
+        while self.time < 45:
+            self.time += random.randint(1, 3)
+            if self.time > 45:
+                self.time = 45
+            self.simulate_event()
+            self.pause(self.event_interval)
+        
+        self.first_half_added_time = random.randint(1, 3)
+        self.say(
+            f"\n{Fore.YELLOW}⏱️ Added time: +{self.first_half_added_time} "
+            f"minute{'s' if self.first_half_added_time > 1 else ''}{Style.RESET_ALL}"
+        )
+        
+        for _ in range(random.randint(0, 2)):
+            self.time += 1
+            self.simulate_event()
+            self.pause(self.event_interval)
+        
+        self.display_halftime()
+        
+        self.say(f"\n{Fore.GREEN}🟢 SECOND HALF - IT'S ON!{Style.RESET_ALL}")
+        self.time = 45
+        self.assign_ball(self.team2, self.team2.get_random_player())
+        
+        while self.time < 90:
+            self.time += random.randint(1, 3)
+            if self.time > 90:
+                self.time = 90
+            self.simulate_event()
+            self.pause(self.event_interval)
+        
+        self.second_half_added_time = random.randint(2, 5)
+        self.say(
+            f"\n{Fore.YELLOW}⏱️ Added time: +{self.second_half_added_time} "
+            f"minutes{Style.RESET_ALL}"
+        )
+        
+        for _ in range(random.randint(1, 3)):
+            self.time += 1
+            self.simulate_event()
+            self.pause(self.event_interval)
+        
+        self.say(f"\n{Fore.RED}📯 FINAL WHISTLE! MATCH OVER!{Style.RESET_ALL}")
+        self.pause(2)
+        
+        self.award_points()
+        if not self.headless:
+            self.display_final_stats()
+        return self.get_result()
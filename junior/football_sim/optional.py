@@ -0,0 +1,16 @@
+"""Lazy access to optional dependencies, so importing the engine stays cheap."""
+
+_MISSING = object()
+_numpy = _MISSING
+
+
+def get_numpy():
+    """Return the numpy module, or None if it is not installed."""
+    global _numpy
+    if _numpy is _MISSING:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
@@ -0,0 +1,254 @@
+"""Squad data and realistic player generation.
+
+Squads are described as plain data and only turned into ``Player`` and
+``Team`` objects on demand, so importing this module generates nothing.
+"""
+import random
+from typing import Dict
+
+from football_sim.team import Player, Team
+
+
+def create_realistic_player(name: str, position: str, base_rating: int = 75) -> Player:
+    """Create a player with realistic stats based on position."""
+    base = base_rating + random.randint(-10, 10)
+    
+    if position == "G":
+        return Player(
+            name,
+            position,
+            attack=random.randint(15, 35),
+            defense=base + random.randint(5, 15),
+            speed=random.randint(45, 75),
+            technique=random.randint(65, 85),
+            physical=random.randint(75, 90),
+            mental=random.randint(75, 95),
+            age=random.randint(22, 36)
+        )
+    
+    elif position in ["CB", "RB", "LB"]:
+        return Player(
+            name,
+            position,
+            attack=random.randint(35, 65),
+            defense=base + random.randint(5, 15),
+            speed=random.randint(60, 85),
+            technique=random.randint(55, 80),
+            physical=random.randint(80, 95),
+            mental=random.randint(70, 90),
+            age=random.randint(22, 34)
+        )
+    
+    elif position in ["DM", "CM", "AM"]:
+        return Player(
+            name,
+            position,
+            attack=random.randint(55, 85),
+            defense=random.randint(50, 80),
+            speed=random.randint(65, 90),
+            technique=base + random.randint(5, 15),
+            physical=random.randint(70, 90),
+            mental=random.randint(75, 95),
+            age=random.randint(20, 32)
+        )
+    
+    else:
+        return Player(
+            name,
+            position,
+            attack=base + random.randint(5, 15),
+            defense=random.randint(30, 55),
+            speed=random.randint(75, 95),
+            technique=random.randint(75, 95),
+            physical=random.randint(65, 85),
+            mental=random.randint(70, 90),
+            age=random.randint(19, 31)
+        )
+
+
+def build_team(spec: Dict) -> Team:
+    """Generate a team and its players from a ``TEAM_SPECS`` entry."""
+    players = [
+        create_realistic_player(name, position, base_rating)
+        for name, position, base_rating in spec["players"]
+    ]
+    return Team(
+        spec["name"],
+        players,
+        spec["formation"],
+        spec["kit_color"],
+        spec["manager"]
+    )
+
+
+# Champions League 2025 teams with realistic rosters
+TEAM_SPECS = [
+    {
+        "name": "Real Madrid CF",
+        "players": [
+            ("Courtois", "G", 90),
+            ("Carvajal", "RB", 86),
+            ("Militão", "CB", 84),
+            ("Alaba", "CB", 87),
+            ("Mendy", "LB", 82),
+            ("Casemiro", "DM", 89),
+            ("Modrić", "CM", 90),
+            ("Kroos", "CM", 88),
+            ("Vinícius Jr", "LW", 88),
+            ("Benzema", "ST", 92),
+            ("Rodrygo", "RW", 84),
+            ("Valverde", "CM", 85),  # Substitute
+            ("Asensio", "RW", 83)    # Substitute
+        ],
+        "formation": "4-3-3",
+        "kit_color": "White",
+        "manager": "Carlo Ancelotti"
+    },
+    {
+        "name": "FC Barcelona",
+        "players": [
+            ("ter Stegen", "G", 89),
+            ("Dest", "RB", 78),
+            ("Araújo", "CB", 83),
+            ("García", "CB", 80),
+            ("Alba", "LB", 85),
+            ("Busquets", "DM", 87),
+            ("de Jong", "CM", 86),
+            ("Gavi", "CM", 81),
+            ("Dembélé", "RW", 83),
+            ("Lewandowski", "ST", 92),
+            ("Ansu Fati", "LW", 82),
+            ("Pedri", "CM", 86),     # Substitute
+            ("Raphinha", "RW", 84)   # Substitute
+        ],
+        "formation": "4-3-3",
+        "kit_color": "Blue/Red",
+        "manager": "Xavi Hernández"
+    },
+    {
+        "name": "Manchester City",
+        "players": [
+            ("Ederson", "G", 89),
+            ("Walker", "RB", 85),
+            ("Dias", "CB", 88),
+            ("Akanji", "CB", 83),
+            ("Cancelo", "LB", 84),
+            ("Rodri", "DM", 90),
+            ("De Bruyne", "CM", 91),
+            ("Gündoğan", "CM", 85),
+            ("Foden", "RW", 87),
+            ("Haaland", "ST", 93),
+            ("Grealish", "LW", 84),
+            ("Bernardo Silva", "CM", 86),  # Substitute
+            ("Álvarez", "ST", 83)          # Substitute
+        ],
+        "formation": "4-3-3",
+        "kit_color": "Sky Blue",
+        "manager": "Pep Guardiola"
+    },
+    {
+        "name": "Bayern Munich",
+        "players": [
+            ("Neuer", "G", 88),
+            ("Davies", "LB", 85),
+            ("de Ligt", "CB", 85),
+            ("Upamecano", "CB", 83),
+            ("Pavard", "RB", 82),
+            ("Kimmich", "DM", 89),
+            ("Goretzka", "CM", 86),
+            ("Musiala", "AM", 87),
+            ("Sané", "RW", 85),
+            ("Kane", "ST", 90),
+            ("Coman", "LW", 84),
+            ("Müller", "AM", 84),  # Substitute
+            ("Tel", "ST", 80)      # Substitute
+        ],
+        "formation": "4-2-3-1",
+        "kit_color": "Red",
+        "manager": "Thomas Tuchel"
+    },
+    {
+        "name": "Liverpool FC",
+        "players": [
+            ("Alisson", "G", 89),
+            ("Alexander-Arnold", "RB", 87),
+            ("van Dijk", "CB", 89),
+            ("Konaté", "CB", 84),
+            ("Robertson", "LB", 86),
+            ("Mac Allister", "DM", 84),
+            ("Szoboszlai", "CM", 83),
+            ("Elliott", "CM", 80),
+            ("Salah", "RW", 90),
+            ("Núñez", "ST", 84),
+            ("Díaz", "LW", 85),
+            ("Gravenberch", "CM", 81),  # Substitute
+            ("Jota", "LW", 83)           # Substitute
+        ],
+        "formation": "4-3-3",
+        "kit_color": "Red",
+        "manager": "Arne Slot"
+    },
+    {
+        "name": "Paris Saint-Germain",
+        "players": [
+            ("Donnarumma", "G", 88),
+            ("Hakimi", "RB", 85),
+            ("Marquinhos", "CB", 86),
+            ("Skriniar", "CB", 83),
+            ("Mendes", "LB", 82),
+            ("Vitinha", "DM", 84),
+            ("Verratti", "CM", 85),
+            ("Zaïre-Emery", "CM", 80),
+            ("Dembélé", "RW", 85),
+            ("Mbappé", "ST", 92),
+            ("Barcola", "LW", 81),
+            ("Ruiz", "CM", 82),  # Substitute
+            ("Kolo Muani", "ST", 82)  # Substitute
+        ],
+        "formation": "4-3-3",
+        "kit_color": "Navy Blue",
+        "manager": "Luis Enrique"
+    },
+    {
+        "name": "Arsenal FC",
+        "players": [
+            ("Raya", "G", 85),
+            ("White", "RB", 83),
+            ("Saliba", "CB", 87),
+            ("Gabriel", "CB", 85),
+            ("Zinchenko", "LB", 82),
+            ("Rice", "DM", 87),
+            ("Ødegaard", "CM", 88),
+            ("Havertz", "AM", 84),
+            ("Saka", "RW", 88),
+            ("Jesus", "ST", 83),
+            ("Martinelli", "LW", 84),
+            ("Partey", "DM", 82),  # Substitute
+            ("Trossard", "LW", 82)  # Substitute
+        ],
+        "formation": "4-3-3",
+        "kit_color": "Red/White",
+        "manager": "Mikel Arteta"
+    },
+    {
+        "name": "Inter Milan",
+        "players": [
+            ("Sommer", "G", 85),
+            ("Pavard", "RB", 83),
+            ("Acerbi", "CB", 82),
+            ("Bastoni", "CB", 85),
+            ("Dimarco", "LB", 84),
+            ("Barella", "CM", 86),
+            ("Çalhanoğlu", "CM", 85),
+            ("Mkhitaryan", "CM", 82),
+            ("Frattesi", "AM", 81),
+            ("Lautaro", "ST", 89),
+            ("Thuram", "ST", 84),
+            ("Dumfries", "RB", 81),  # Substitute
+            ("Arnautović", "ST", 80)  # Substitute
+        ],
+        "formation": "3-5-2",
+        "kit_color": "Blue/Black",
+        "manager": "Simone Inzaghi"
+    }
+]
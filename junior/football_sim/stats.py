@@ -0,0 +1,209 @@
+"""Incremental match statistics and finished-match results."""
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Dict, List
+
+from football_sim.team import Player, Team
+from football_sim.xg import XGModel
+
+if TYPE_CHECKING:
+    from football_sim.match import Match
+
+
+class MatchStats:
+    """Match statistics aggregated incrementally as events are applied.
+    
+    Counters that ``Team`` and ``Player`` already keep (goals, passes, cards...)
+    are read directly; this store adds what used to be recomputed at display
+    time: the possession integral, a per-shot xG log and a rating heap for
+    the top performers. Every query is O(1) or O(k log n) for the top k.
+    """
+    
+    def __init__(self, team1: Team, team2: Team):
+        self.teams = (team1, team2)
+        self.minute = 0
+        self.elapsed = 0
+        self.possession_integral = {id(team1): 0.0, id(team2): 0.0}
+        self.team_xg = {id(team1): 0.0, id(team2): 0.0}
+        self.player_xg = {}
+        self.shots = {
+            "minute": [], "team": [], "player": [], "distance": [],
+            "difficult_angle": [], "shot_type": [], "attacker_quality": [],
+            "xg": [], "outcome": []
+        }
+        self._rating_heap = []
+        self._rating_counter = itertools.count()
+        for team in self.teams:
+            team.stats = self
+            for player in team.players:
+                self.track_rating(player)
+    
+    def advance(self, minute: int):
+        """Integrate possession up to the given match minute."""
+        elapsed = max(0, minute - self.minute)
+        if elapsed:
+            for team in self.teams:
+                self.possession_integral[id(team)] += team.possession * elapsed
+            self.elapsed += elapsed
+        self.minute = minute
+    
+    def get_possession(self, team: Team) -> float:
+        """Average possession over the minutes played so far."""
+        if not self.elapsed:
+            return team.possession
+        return self.possession_integral[id(team)] / self.elapsed
+    
+    def get_pass_accuracy(self, subject) -> float:
+        """Pass success percentage for a team or a player."""
+        return subject.successful_passes / max(1, subject.passes) * 100
+    
+    def record_shot(
+        self,
+        team: Team,
+        shooter: Player,
+        distance: int,
+        difficult_angle: bool,
+        shot_type: str,
+        outcome: str
+    ) -> float:
+        """Log a shot's features, score it and add its xG to the totals."""
+        quality = XGModel.get_attacker_quality(shooter)
+        xg = XGModel.score(distance, difficult_angle, shot_type, quality)
+        shots = self.shots
+        shots["minute"].append(self.minute)
+        shots["team"].append(team.name)
+        shots["player"].append(shooter.name)
+        shots["distance"].append(distance)
+        shots["difficult_angle"].append(difficult_angle)
+        shots["shot_type"].append(shot_type)
+        shots["attacker_quality"].append(quality)
+        shots["xg"].append(xg)
+        shots["outcome"].append(outcome)
+        self.team_xg[id(team)] += xg
+        key = id(shooter)
+        self.player_xg[key] = self.player_xg.get(key, 0.0) + xg
+        return xg
+    
+    def get_xg(self, subject) -> float:
+        """Cumulative expected goals for a team or a player."""
+        if isinstance(subject, Team):
+            return self.team_xg[id(subject)]
+        return self.player_xg.get(id(subject), 0.0)
+    
+    def track_rating(self, player: Player):
+        """Record a rating change; outdated heap entries are skipped lazily."""
+        heapq.heappush(
+            self._rating_heap,
+            (-player.rating, next(self._rating_counter), player)
+        )
+        if len(self._rating_heap) > 256:
+            self._rating_heap = [
+                (-p.rating, next(self._rating_counter), p)
+                for team in self.teams for p in team.players[:11]
+            ]
+            heapq.heapify(self._rating_heap)
+    
+    def _is_current(self, entry) -> bool:
+        neg_rating, _, player = entry
+        return player.team.is_on_pitch(player) and -neg_rating == player.rating
+    
+    def get_top_performers(self, k: int = 3, min_rating: float = None) -> List[Player]:
+        """Return the k best rated on-pitch players, best first."""
+        heap = self._rating_heap
+        top, kept, seen = [], [], set()
+        while heap and len(top) < k:
+            entry = heapq.heappop(heap)
+            player = entry[2]
+            if id(player) in seen or not self._is_current(entry):
+                continue
+            kept.append(entry)
+            if min_rating is not None and player.rating < min_rating:
+                break
+            seen.add(id(player))
+            top.append(player)
+        for entry in kept:
+            heapq.heappush(heap, entry)
+        return top
+    
+    def team_columns(self) -> Dict[str, list]:
+        """Team aggregates as a column-oriented dict (one row per team)."""
+        columns = {
+            "team": [], "goals": [], "shots": [], "shots_on_target": [],
+            "possession": [], "passes": [], "pass_accuracy": [], "xg": [],
+            "corners": [], "offsides": [], "fouls": [], "yellow_cards": [],
+            "red_cards": [], "substitutions": []
+        }
+        for team in self.teams:
+            columns["team"].append(team.name)
+            columns["goals"].append(team.goals_scored)
+            columns["shots"].append(team.shots)
+            columns["shots_on_target"].append(team.shots_on_target)
+            columns["possession"].append(self.get_possession(team))
+            columns["passes"].append(team.passes)
+            columns["pass_accuracy"].append(self.get_pass_accuracy(team))
+            columns["xg"].append(self.get_xg(team))
+            columns["corners"].append(team.corners)
+            columns["offsides"].append(team.offsides)
+            columns["fouls"].append(team.fouls)
+            columns["yellow_cards"].append(team.yellow_cards)
+            columns["red_cards"].append(team.red_cards)
+            columns["substitutions"].append(team.substitutions)
+        return columns
+    
+    def player_columns(self) -> Dict[str, list]:
+        """Player aggregates as a column-oriented dict (one row per squad player)."""
+        columns = {
+            "team": [], "player": [], "position": [], "on_pitch": [],
+            "goals": [], "assists": [], "shots": [], "shots_on_target": [],
+            "xg": [], "passes": [], "pass_accuracy": [], "fouls": [],
+            "yellow_cards": [], "red_card": [], "injured": [],
+            "distance_covered": [], "fatigue": [], "rating": []
+        }
+        for team in self.teams:
+            for player in team.players:
+                columns["team"].append(team.name)
+                columns["player"].append(player.name)
+                columns["position"].append(player.position)
+                columns["on_pitch"].append(team.is_on_pitch(player))
+                columns["goals"].append(player.goals)
+                columns["assists"].append(player.assists)
+                columns["shots"].append(player.shots)
+                columns["shots_on_target"].append(player.shots_on_target)
+                columns["xg"].append(self.get_xg(player))
+                columns["passes"].append(player.passes)
+                columns["pass_accuracy"].append(self.get_pass_accuracy(player))
+                columns["fouls"].append(player.fouls)
+                columns["yellow_cards"].append(player.yellow_cards)
+                columns["red_card"].append(player.red_card)
+                columns["injured"].append(player.injured)
+                columns["distance_covered"].append(player.distance_covered)
+                columns["fatigue"].append(player.fatigue)
+                columns["rating"].append(player.rating)
+        return columns
+
+
+class MatchResult:
+    """Column-oriented snapshot of a finished match, detached from the terminal."""
+    
+    def __init__(self, match: "Match"):
+        stats = match.stats
+        team1, team2 = match.team1, match.team2
+        self.match = {
+            "home": team1.name,
+            "away": team2.name,
+            "home_goals": team1.goals_scored,
+            "away_goals": team2.goals_scored,
+            "home_xg": stats.get_xg(team1),
+            "away_xg": stats.get_xg(team2),
+            "home_possession": stats.get_possession(team1),
+            "stadium": match.stadium,
+            "weather": match.weather,
+            "temperature": match.temperature,
+            "attendance": match.attendance,
+            "referee": match.referee,
+            "first_half_added_time": match.first_half_added_time,
+            "second_half_added_time": match.second_half_added_time
+        }
+        self.teams = stats.team_columns()
+        self.players = stats.player_columns()
+        self.shots = {name: list(values) for name, values in stats.shots.items()}
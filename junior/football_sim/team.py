@@ -0,0 +1,361 @@
+"""Players, formations and teams, including substitution bookkeeping."""
+import heapq
+import itertools
+import random
+from collections import deque
+from typing import Dict, List, Tuple, Optional
+
+
+class Player:
+    """Represents a football player with detailed statistics."""
+    
+    EMOJI_MAP = {
+        "G": "🧤", "RB": "🛡️", "CB": "🛡️", "LB": "🛡️",
+        "DM": "⚙️", "CM": "⚙️", "AM": "⚙️",
+        "RW": "🏃", "LW": "🏃", "ST": "⚽"
+    }
+    
+    def __init__(
+        self,
+        name: str,
+        position: str,
+        attack: int,
+        defense: int,
+        speed: int = 70,
+        technique: int = 70,
+        physical: int = 70,
+        mental: int = 70,
+        age: int = 25
+    ):
+        self.name = name
+        self.position = position
+        self.attack = attack
+        self.defense = defense
+        self.speed = speed
+        self.technique = technique
+        self.physical = physical
+        self.mental = mental
+        self.age = age
+        self.team = None
+        
+        # Match statistics
+        self.goals = 0
+        self.assists = 0
+        self.passes = 0
+        self.successful_passes = 0
+        self.shots = 0
+        self.shots_on_target = 0
+        self.fouls = 0
+        self.yellow_cards = 0
+        self.red_card = False
+        self.fatigue = 0
+        self.form = random.randint(70, 100)
+        self.distance_covered = 0.0
+        self.duels_won = 0
+        self.duels_lost = 0
+        self.interceptions = 0
+        self.tackles = 0
+        self.crosses = 0
+        self.corners_taken = 0
+        self.rating = 6.0
+        self.injured = False
+        
+        # Position on the field
+        self.x = 0
+        self.y = 0
+        self.has_ball = False
+    
+    @property
+    def fatigue(self) -> float:
+        return self._fatigue
+    
+    @fatigue.setter
+    def fatigue(self, value: float):
+        self._fatigue = value
+        if self.team is not None:
+            self.team._track_fatigue(self)
+    
+    @property
+    def rating(self) -> float:
+        return self._rating
+    
+    @rating.setter
+    def rating(self, value: float):
+        self._rating = value
+        if self.team is not None and self.team.stats is not None:
+            self.team.stats.track_rating(self)
+    
+    def get_overall_rating(self) -> int:
+        """Calculate the player's overall rating."""
+        return int(
+            (
+                self.attack +
+                self.defense +
+                self.speed +
+                self.technique +
+                self.physical +
+                self.mental
+            ) / 6
+        )
+    
+    def get_fatigue_factor(self) -> float:
+        """Calculate the impact of fatigue on performance."""
+        return max(0.6, 1 - (self.fatigue / 150))
+    
+    def get_injury_risk(self) -> float:
+        """Calculate injury risk based on age and fatigue."""
+        age_factor = 0.02 * (self.age - 25) if self.age > 25 else 0
+        return min(0.08, 0.01 + age_factor + self.fatigue / 1200)
+    
+    def move(self, action: str, zone: str = None):
+        """Simulate player movement on the field."""
+        if self.injured or self.red_card:
+            return
+        max_movement = 6
+        if action == "attack":
+            self.x += random.randint(3, 6)
+            self.y += random.randint(-4, 4)
+        elif action == "defense":
+            self.x -= random.randint(2, 4)
+            self.y += random.randint(-3, 3)
+        elif action == "pass":
+            self.y += random.randint(-5, 5)
+        self.x = max(0, min(100, self.x))
+        self.y = max(0, min(100, self.y))
+    
+    def __str__(self) -> str:
+        return f"{self.name}"
+
+
+class Formation:
+    """Defines a tactical formation with player positions."""
+    
+    def __init__(self, name: str, positions: Dict[str, Tuple[int, int]]):
+        self.name = name
+        self.positions = positions
+
+
+# Predefined tactical formations
+FORMATIONS = {
+    "4-3-3": Formation("4-3-3", {
+        "G": (5, 50),
+        "RB": (20, 80),
+        "CB1": (20, 60),
+        "CB2": (20, 40),
+        "LB": (20, 20),
+        "DM": (40, 50),
+        "CM1": (40, 70),
+        "CM2": (40, 30),
+        "RW": (70, 80),
+        "ST": (70, 50),
+        "LW": (70, 20)
+    }),
+    "4-4-2": Formation("4-4-2", {
+        "G": (5, 50),
+        "RB": (20, 80),
+        "CB1": (20, 60),
+        "CB2": (20, 40),
+        "LB": (20, 20),
+        "RM": (50, 80),
+        "CM1": (50, 60),
+        "CM2": (50, 40),
+        "LM": (50, 20),
+        "ST1": (75, 40),
+        "ST2": (75, 60)
+    })
+}
+
+
+class Team:
+    """Represents a football team with players and tactics."""
+    
+    MAX_SUBSTITUTIONS = 5
+    
+    def __init__(
+        self,
+        name: str,
+        players: List[Player],
+        formation: str = "4-3-3",
+        kit_color: str = "Blue",
+        manager: str = "Coach"
+    ):
+        self.name = name
+        self.players = players
+        self.formation = FORMATIONS.get(formation, FORMATIONS["4-3-3"])
+        self.kit_color = kit_color
+        self.manager = manager
+        self.points = 0
+        
+        # Team statistics
+        self.goals_scored = 0
+        self.goals_conceded = 0
+        self.shots = 0
+        self.shots_on_target = 0
+        self.possession = 50.0
+        self.passes = 0
+        self.successful_passes = 0
+        self.fouls = 0
+        self.corners = 0
+        self.offsides = 0
+        self.yellow_cards = 0
+        self.red_cards = 0
+        self.substitutions = 0
+        
+        # Tactics
+        self.mentality = "Balanced"
+        self.pressing = 50
+        self.width = 50
+        
+        self.opponent = None
+        self.ball_holder = None
+        self.stats = None
+        
+        # Substitution bookkeeping: slot index per player, a queue of unused
+        # substitutes and a lazy max-heap of on-pitch players by fatigue.
+        self._slots = {id(p): i for i, p in enumerate(self.players)}
+        self.bench = deque(self.players[11:])
+        self._fatigue_heap = []
+        self._heap_counter = itertools.count()
+        for player in self.players:
+            player.team = self
+        self._rebuild_fatigue_heap()
+        self._position_players()
+    
+    def _position_players(self):
+        """Position players according to the formation."""
+        for i, player in enumerate(self.players[:11]):
+            if i < len(self.formation.positions):
+                player.x, player.y = list(self.formation.positions.values())[i]
+    
+    def set_opponent(self, opponent: 'Team'):
+        self.opponent = opponent
+    
+    def get_random_player(self, position: str = None, zone: str = None) -> Optional[Player]:
+        """Return a random player based on specified criteria."""
+        candidates = [
+            p for p in self.players[:11]
+            if not p.red_card and not p.injured and
+            (position is None or p.position == position)
+        ]
+        
+        if zone:
+            zone_positions = {
+                "defense": ["CB", "RB", "LB", "DM"],
+                "midfield": ["CM", "AM", "RM", "LM"],
+                "attack": ["ST", "RW", "LW"]
+            }
+            candidates = [
+                p for p in candidates
+                if p.position in zone_positions.get(zone, [])
+            ]
+        
+        if candidates:
+            weights = [max(1, p.form - p.fatigue / 2) for p in candidates]
+            return random.choices(candidates, weights=weights, k=1)[0]
+        return None
+    
+    def get_best_shooter(self) -> Optional[Player]:
+        """Return the best available shooter."""
+        candidates = [p for p in self.players[:11] if not p.red_card and not p.injured]
+        if candidates:
+            return max(
+                candidates,
+                key=lambda p: p.attack * p.technique * p.get_fatigue_factor()
+            )
+        return None
+    
+    def is_on_pitch(self, player: Player) -> bool:
+        """Check whether a player currently occupies one of the first 11 slots."""
+        return self._slots.get(id(player), 11) < 11
+    
+    def _is_available(self, player: Player) -> bool:
+        return self.is_on_pitch(player) and not player.red_card and not player.injured
+    
+    def _track_fatigue(self, player: Player):
+        """Record a fatigue change; outdated heap entries are skipped lazily."""
+        if not self.is_on_pitch(player):
+            return
+        heapq.heappush(
+            self._fatigue_heap,
+            (-player.fatigue, next(self._heap_counter), player)
+        )
+        if len(self._fatigue_heap) > 64:
+            self._rebuild_fatigue_heap()
+    
+    def _rebuild_fatigue_heap(self):
+        self._fatigue_heap = [
+            (-p.fatigue, next(self._heap_counter), p)
+            for p in self.players[:11] if self._is_available(p)
+        ]
+        heapq.heapify(self._fatigue_heap)
+    
+    def _is_current(self, entry) -> bool:
+        neg_fatigue, _, player = entry
+        return self._is_available(player) and -neg_fatigue == player.fatigue
+    
+    def get_most_tired_player(self) -> Optional[Player]:
+        """Return the available on-pitch player with the highest fatigue."""
+        heap = self._fatigue_heap
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+    
+    def make_substitution(self, player_out: Player, player_in: Player):
+        """Perform a player substitution."""
+        if (
+            self.substitutions >= self.MAX_SUBSTITUTIONS or
+            player_out.red_card or
+            not self.is_on_pitch(player_out) or
+            player_in not in self.bench
+        ):
+            return False
+        self.bench.remove(player_in)
+        # The substitute takes over the outgoing player's role and spot.
+        player_in.position = player_out.position
+        player_in.x, player_in.y = player_out.x, player_out.y
+        player_out.x, player_out.y = 0, 0
+        player_out.has_ball = False
+        
+        # Swap slots so the substituted player stays in the squad list
+        # (for final stats) but outside the first eleven.
+        out_slot, in_slot = self._slots[id(player_out)], self._slots[id(player_in)]
+        self.players[out_slot], self.players[in_slot] = player_in, player_out
+        self._slots[id(player_in)], self._slots[id(player_out)] = out_slot, in_slot
+        
+        player_in.rating = 6.0
+        player_in.fatigue = 0
+        self.substitutions += 1
+        return True
+    
+    def substitute(self, player_out: Player) -> Optional[Player]:
+        """Replace a player with the next substitute on the bench."""
+        if not self.bench:
+            return None
+        player_in = self.bench[0]
+        if self.make_substitution(player_out, player_in):
+            return player_in
+        return None
+    
+    def auto_substitute(
+        self,
+        max_changes: int = 2,
+        fatigue_threshold: float = 0.8
+    ) -> List[Tuple[Player, Player]]:
+        """Substitute the most tired players during a stoppage.
+        
+        The most tired player is always replaced if the bench and the
+        substitution limit allow it; further players are only replaced
+        while their fatigue factor is below ``fatigue_threshold``.
+        """
+        changes = []
+        while len(changes) < max_changes:
+            player_out = self.get_most_tired_player()
+            if player_out is None:
+                break
+            if changes and player_out.get_fatigue_factor() >= fatigue_threshold:
+                break
+            player_in = self.substitute(player_out)
+            if player_in is None:
+                break
+            changes.append((player_out, player_in))
+        return changes
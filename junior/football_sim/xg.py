@@ -0,0 +1,98 @@
+"""Expected-goals (xG) lookup model."""
+import math
+
+from football_sim.optional import get_numpy
+from football_sim.team import Player
+
+
+class XGModel:
+    """Expected-goals lookup table over distance, angle, shot type and quality.
+    
+    The table is built once per process on first use; single shots and
+    whole batches are then scored by indexing into it.
+    """
+    
+    SHOT_TYPES = ["strike", "header", "volley", "lob", "free_kick", "penalty", "counter_attack"]
+    TYPE_OFFSETS = {
+        "strike": 0.0,
+        "header": -0.6,
+        "volley": -0.4,
+        "lob": -0.3,
+        "free_kick": -0.2,
+        "penalty": 0.0,
+        "counter_attack": 0.3
+    }
+    MIN_DISTANCE = 5
+    MAX_DISTANCE = 35
+    MAX_QUALITY = 100
+    PENALTY_LOGIT = 1.15
+    
+    _table = None
+    _type_codes = {name: code for code, name in enumerate(SHOT_TYPES)}
+    
+    @classmethod
+    def _probability(cls, distance: int, difficult_angle: int, shot_type: str, quality: int) -> float:
+        quality_term = 0.025 * (quality - 70)
+        if shot_type == "penalty":
+            logit = cls.PENALTY_LOGIT + quality_term
+        else:
+            logit = (
+                -0.6 - 0.11 * distance - 0.7 * difficult_angle +
+                cls.TYPE_OFFSETS[shot_type] + quality_term
+            )
+        return 1 / (1 + math.exp(-logit))
+    
+    @classmethod
+    def get_table(cls):
+        """Return the lookup table indexed [distance, angle, shot type, quality]."""
+        if cls._table is None:
+            distances = range(cls.MIN_DISTANCE, cls.MAX_DISTANCE + 1)
+            table = [
+                [
+                    [
+                        [cls._probability(d, a, shot_type, q) for q in range(cls.MAX_QUALITY + 1)]
+                        for shot_type in cls.SHOT_TYPES
+                    ]
+                    for a in (0, 1)
+                ]
+                for d in distances
+            ]
+            np = get_numpy()
+            cls._table = np.array(table) if np is not None else table
+        return cls._table
+    
+    @staticmethod
+    def get_attacker_quality(shooter: Player) -> int:
+        """Shooting quality on a 0-100 scale, reduced by fatigue."""
+        return int((shooter.attack + shooter.technique) / 2 * shooter.get_fatigue_factor())
+    
+    @classmethod
+    def score(cls, distance: int, difficult_angle: bool, shot_type: str, quality: int) -> float:
+        """Return the xG of a single shot."""
+        distance = max(cls.MIN_DISTANCE, min(cls.MAX_DISTANCE, distance))
+        quality = max(0, min(cls.MAX_QUALITY, quality))
+        code = cls._type_codes.get(shot_type, 0)
+        table = cls.get_table()
+        return float(table[distance - cls.MIN_DISTANCE][int(difficult_angle)][code][quality])
+    
+    @classmethod
+    def score_batch(cls, distances, difficult_angles, shot_types, qualities):
+        """Score many shots at once.
+        
+        Arguments are equal-length sequences; shot types may be names or
+        codes (indices into ``SHOT_TYPES``). Returns a numpy array when numpy
+        is installed, a list otherwise.
+        """
+        np = get_numpy()
+        if np is None:
+            return [
+                cls.score(d, a, t if isinstance(t, str) else cls.SHOT_TYPES[t], q)
+                for d, a, t, q in zip(distances, difficult_angles, shot_types, qualities)
+            ]
+        codes = np.asarray(shot_types)
+        if codes.dtype.kind not in "iu":
+            codes = np.array([cls._type_codes.get(t, 0) for t in codes], dtype=np.intp)
+        d = np.clip(np.asarray(distances, dtype=np.intp), cls.MIN_DISTANCE, cls.MAX_DISTANCE)
+        a = np.asarray(difficult_angles, dtype=np.intp)
+        q = np.clip(np.asarray(qualities, dtype=np.intp), 0, cls.MAX_QUALITY)
+        return cls.get_table()[d - cls.MIN_DISTANCE, a, codes, q]
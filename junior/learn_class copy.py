@@ -1,7 +1,5 @@
 import random
 import time
-import sys
-import math
 from datetime import datetime
 from colorama import init, Fore, Style, Back
 from typing import Dict, List, Tuple
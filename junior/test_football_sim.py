@@ -0,0 +1,242 @@
+import random
+
+import pytest
+
+from football_sim import Player, Team
+
+
+def make_team(name="Home", size=16):
+    positions = ["G", "RB", "CB", "CB", "LB", "DM", "CM", "CM", "RW", "ST", "LW"]
+    players = [
+        Player(f"{name} {i}", positions[i] if i < 11 else "CM", 70, 70)
+        for i in range(size)
+    ]
+    return Team(name, players)
+
+
+def test_most_tired_player_follows_fatigue_changes():
+    team = make_team()
+    team.players[3].fatigue = 40
+    team.players[7].fatigue = 60
+    assert team.get_most_tired_player() is team.players[7]
+    team.players[7].fatigue = 10
+    assert team.get_most_tired_player() is team.players[3]
+
+
+def test_most_tired_player_skips_unavailable_players():
+    team = make_team()
+    team.players[5].fatigue = 90
+    team.players[5].red_card = True
+    team.players[2].fatigue = 50
+    assert team.get_most_tired_player() is team.players[2]
+
+
+def test_substitution_takes_over_position_and_slot():
+    team = make_team()
+    player_out, player_in = team.players[9], team.bench[0]
+    player_out.fatigue = 80
+    assert team.make_substitution(player_out, player_in) is True
+    assert player_in.position == "ST"
+    assert (player_in.x, player_in.y) == (70, 50)
+    assert team.players[9] is player_in
+    assert team.is_on_pitch(player_in) and not team.is_on_pitch(player_out)
+    assert player_in not in team.bench
+    assert team.get_random_player(position="ST") is player_in
+    assert team.get_most_tired_player() is not player_out
+
+
+def test_substitution_refused_for_player_off_pitch_or_not_on_bench():
+    team = make_team()
+    player_in = team.bench[0]
+    assert team.make_substitution(team.players[12], player_in) is False
+    assert team.make_substitution(team.players[1], team.players[2]) is False
+    assert team.substitutions == 0
+
+
+def test_substitution_limit():
+    team = make_team(size=20)
+    for i in range(Team.MAX_SUBSTITUTIONS):
+        assert team.substitute(team.players[i + 1]) is not None
+    assert team.substitute(team.players[7]) is None
+    assert team.substitutions == Team.MAX_SUBSTITUTIONS
+
+
+def test_auto_substitute_replaces_most_tired_first():
+    team = make_team()
+    left_back, midfielder, winger = team.players[4], team.players[6], team.players[8]
+    left_back.fatigue = 100
+    midfielder.fatigue = 70
+    winger.fatigue = 5
+    changes = team.auto_substitute(max_changes=3, fatigue_threshold=0.8)
+    assert [out for out, _ in changes] == [left_back, midfielder]
+    assert [sub.position for _, sub in changes] == ["LB", "CM"]
+    assert team.is_on_pitch(winger)
+
+
+def make_stats():
+    from football_sim import MatchStats
+    home, away = make_team("Home"), make_team("Away")
+    return MatchStats(home, away), home, away
+
+
+def test_possession_is_integrated_over_minutes():
+    stats, home, away = make_stats()
+    home.possession, away.possession = 60.0, 40.0
+    stats.advance(30)
+    home.possession, away.possession = 30.0, 70.0
+    stats.advance(60)
+    assert stats.get_possession(home) == 45.0
+    assert stats.get_possession(away) == 55.0
+
+
+def test_record_shot_accumulates_xg_per_team_and_player():
+    stats, home, away = make_stats()
+    shooter = home.players[9]
+    first = stats.record_shot(home, shooter, 12, False, "strike", "goal")
+    second = stats.record_shot(home, shooter, 25, True, "header", "saved")
+    assert stats.get_xg(home) == first + second
+    assert stats.get_xg(shooter) == first + second
+    assert stats.get_xg(away) == 0.0
+    assert stats.shots["outcome"] == ["goal", "saved"]
+    assert len(stats.shots["xg"]) == 2
+
+
+def test_top_performers_follow_rating_changes():
+    stats, home, away = make_stats()
+    home.players[2].rating = 8.5
+    away.players[5].rating = 9.0
+    home.players[9].rating = 7.5
+    assert stats.get_top_performers(2) == [away.players[5], home.players[2]]
+    away.players[5].rating = 5.0
+    assert stats.get_top_performers(2) == [home.players[2], home.players[9]]
+    assert stats.get_top_performers(3, min_rating=7.0) == [home.players[2], home.players[9]]
+
+
+def test_top_performers_ignore_substituted_players():
+    stats, home, away = make_stats()
+    star = home.players[9]
+    star.rating = 9.5
+    home.substitute(star)
+    assert star not in stats.get_top_performers(3)
+
+
+def test_xg_lookup_matches_the_logistic_model():
+    from football_sim import XGModel
+    for args in [(5, 0, "strike", 70), (18, 1, "header", 40), (35, 0, "volley", 100), (11, 0, "penalty", 85)]:
+        assert abs(XGModel.score(*args) - XGModel._probability(*args)) < 1e-12
+
+
+def test_xg_clamps_distance_and_quality():
+    from football_sim import XGModel
+    assert XGModel.score(1, False, "strike", 70) == XGModel.score(5, False, "strike", 70)
+    assert XGModel.score(80, False, "strike", 150) == XGModel.score(35, False, "strike", 100)
+    assert XGModel.score(20, False, "unknown", 70) == XGModel.score(20, False, "strike", 70)
+
+
+def test_xg_decreases_with_distance_and_angle():
+    from football_sim import XGModel
+    assert XGModel.score(8, False, "strike", 70) > XGModel.score(25, False, "strike", 70)
+    assert XGModel.score(12, False, "strike", 70) > XGModel.score(12, True, "strike", 70)
+
+
+def test_xg_batch_matches_single_scores():
+    from football_sim import XGModel
+    shots = [(6, 0, "strike", 80), (22, 1, "lob", 55), (40, 0, "header", 120), (11, 0, "penalty", 70)]
+    batch = XGModel.score_batch(*zip(*shots))
+    expected = [
+        XGModel.score(d, a, t, q)
+        for d, a, t, q in shots
+    ]
+    assert [float(x) for x in batch] == expected
+    codes = [XGModel.SHOT_TYPES.index(t) for _, _, t, _ in shots]
+    by_code = XGModel.score_batch([d for d, *_ in shots], [a for _, a, *_ in shots], codes, [q for *_, q in shots])
+    assert [float(x) for x in by_code] == expected
+
+
+def make_match():
+    from football_sim import Match
+    return Match(make_team("Home"), make_team("Away"), headless=True)
+
+
+def test_shots_stay_in_their_zone():
+    match = make_match()
+    for zone, (low, high, _) in match.SHOT_ZONES.items():
+        for _ in range(20):
+            shot = match.draw_shot("strike", zone)
+            assert shot.zone == zone and low <= shot.distance <= high
+    assert match.draw_shot("penalty") == ("penalty_spot", 11, False)
+    assert all(match.draw_shot("header").zone in ("six_yard", "box") for _ in range(20))
+
+
+def test_goal_xg_is_scored_from_the_event_shot(monkeypatch):
+    from football_sim.match import Shot
+    from football_sim.xg import XGModel
+    match = make_match()
+    shot = Shot("long_range", 33, True)
+    monkeypatch.setattr(match, "draw_shot", lambda shot_type, zone=None: shot)
+    match.handle_goal(match.team1, match.team2, "10'")
+    shots = match.stats.shots
+    assert (shots["distance"], shots["difficult_angle"]) == ([33], [True])
+    expected = XGModel.score(33, True, shots["shot_type"][0], shots["attacker_quality"][0])
+    assert shots["xg"] == [expected]
+    assert match.stats.get_xg(match.team1) == expected
+
+
+def test_recording_a_shot_draws_nothing():
+    from football_sim.match import Shot
+    match = make_match()
+    state = random.getstate()
+    match.record_shot(match.team1, match.team1.players[9], "strike", "save", Shot("box", 12, False))
+    assert random.getstate() == state
+    assert match.stats.shots["distance"] == [12]
+
+
+def play_headless_match(seed=7):
+    from football_sim import Match
+    from football_sim.squads import TEAM_SPECS, build_team
+    random.seed(seed)
+    match = Match(build_team(TEAM_SPECS[0]), build_team(TEAM_SPECS[1]), headless=True)
+    return match.simulate()
+
+
+def test_headless_match_prints_nothing(capsys):
+    result = play_headless_match()
+    assert capsys.readouterr().out == ""
+    home_goals = [g for team, g in zip(result.players["team"], result.players["goals"]) if team == result.match["home"]]
+    assert result.match["home_goals"] == sum(home_goals)
+    assert len(result.teams["team"]) == 2
+    assert len(result.shots["xg"]) == len(result.shots["outcome"])
+
+
+def test_npz_export_flushes_row_groups(tmp_path):
+    import numpy
+    from football_sim import ResultExporter
+    results = [play_headless_match(seed) for seed in range(3)]
+    with ResultExporter(str(tmp_path / "run"), fmt="npz", row_group_size=2) as exporter:
+        for result in results:
+            exporter.write(result)
+    parts = sorted(tmp_path.glob("run_*.npz"))
+    assert [p.name for p in parts] == ["run_00000.npz", "run_00001.npz"]
+    with numpy.load(parts[0]) as first, numpy.load(parts[1]) as second:
+        assert list(first["matches/match_id"]) == [0, 1]
+        assert list(second["matches/match_id"]) == [2]
+        assert list(second["teams/match_id"]) == [2, 2]
+        assert list(second["players/goals"]) == results[2].players["goals"]
+
+
+def test_parquet_export_writes_one_file_per_table(tmp_path):
+    import pyarrow.parquet
+    from football_sim import ResultExporter
+    with ResultExporter(str(tmp_path / "run"), fmt="parquet", row_group_size=2) as exporter:
+        for seed in range(3):
+            exporter.write(play_headless_match(seed))
+    matches = pyarrow.parquet.ParquetFile(tmp_path / "run_matches.parquet")
+    assert matches.metadata.num_rows == 3
+    assert matches.metadata.num_row_groups == 2
+    assert (tmp_path / "run_players.parquet").exists()
+
+
+def test_unknown_export_format():
+    from football_sim import ResultExporter
+    with pytest.raises(ValueError):
+        ResultExporter("run", fmt="csv")
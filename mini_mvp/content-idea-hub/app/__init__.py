@@ -10,36 +10,97 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_login import LoginManager
-from config import Config
+from config import get_config
+from app.cache import Cache, IdentityCache
+from app.metrics import Metrics
+from app.passwords import PasswordHasher
+from app.autocomplete import TagIndex
+from app.tagstats import TagStats
+from app.dedup import DuplicateIndex
+from app.sessions import ServerSessions
+from app.engine import DatabaseRouter, RoutingSession
+from app.assets import Assets
 
 
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
 login_manager = LoginManager()
+cache = Cache()
+identity_cache = IdentityCache()
+metrics = Metrics()
+passwords = PasswordHasher()
+tag_index = TagIndex()
+tag_stats = TagStats()
+duplicates = DuplicateIndex()
+sessions = ServerSessions()
+db_router = DatabaseRouter()
+assets = Assets()
 
 
-def create_app(config_class=Config):
+def create_app(config_class=None):
     """Create a Flask application instance.
 
     Args:
         config_class (Config, optional):
-        The configuration class to use. Defaults to Config.
+        The configuration class to use. Defaults to the APP_ENV profile
+        (see config.get_config). Settings from the file named by
+        APP_SETTINGS and from FLASK_* environment variables override it.
 
     Returns:
         Flask: The Flask application instance.
     """
     app = Flask(__name__)
-    app.config.from_object(config_class)
+    app.config.from_object(config_class or get_config())
+    app.config.from_envvar('APP_SETTINGS', silent=True)
+    app.config.from_prefixed_env()
 
     db.init_app(app)
-    migrate.init_app(app, db)
+    from app.engine import apply_sqlite_pragmas
+    with app.app_context():
+        for engine in db.engines.values():
+            apply_sqlite_pragmas(engine, app.config.get('SQLITE_PRAGMAS'))
+        metrics.init_app(app, db.engine)
+    db_router.init_app(app, db)
+    if db_router.replica is not None:
+        metrics.watch(db_router.replica)
+        metrics.add_metric('db_replica_requests_total', 'Requests whose reads went to the replica.',
+                           lambda: db_router.replica_requests, kind='counter')
+        metrics.add_metric('db_primary_requests_total', 'Requests kept on the primary.',
+                           lambda: db_router.primary_requests, kind='counter')
+    from app.search import include_name
+    migrate.init_app(app, db, include_name=include_name)
     login_manager.init_app(app)
+    cache.init_app(app)
+    assets.init_app(app)
+    metrics.add_metric('responses_compressed_total', 'Pages gzipped on the fly.',
+                       lambda: assets.compressed, kind='counter')
+    metrics.add_metric('compression_bytes_saved_total', 'Bytes saved by on-the-fly gzip.',
+                       lambda: assets.bytes_saved, kind='counter')
+    sessions.init_app(app)
+    if sessions.interface is not None:
+        metrics.add_metric('sessions_swept_total', 'Expired server-side sessions purged.',
+                           lambda: sessions.interface.swept, kind='counter')
+    passwords.init_app(app)
+    metrics.add_metric('password_hashes_in_flight', 'Password hashes running or queued.',
+                       lambda: passwords.in_flight)
+    metrics.add_metric('password_hashes_rejected_total', 'Hashes refused by admission control.',
+                       lambda: passwords.rejected, kind='counter')
     
+    from app.models import User  # Import local pour éviter circular
+    identity_cache.init_app(app, User, cache)
+    from app.models import Idea
+    tag_index.init_app(app, Idea)
+    tag_stats.init_app(app)
+    duplicates.init_app(app, Idea)
+    metrics.add_metric('identity_cache_hits_total', 'User loads served from the identity cache.',
+                       lambda: identity_cache.hits, kind='counter')
+    metrics.add_metric('identity_cache_misses_total', 'User loads that queried the database.',
+                       lambda: identity_cache.misses, kind='counter')
+
     @login_manager.user_loader
     def load_user(user_id):
-        from app.models import User  # Import local pour éviter circular
-        return User.query.get(int(user_id))
+        return identity_cache.load(db.session, int(user_id))
     
     login_manager.login_view = 'main.login'
 
@@ -47,4 +108,8 @@ def create_app(config_class=Config):
     from app.routes import bp
     
     app.register_blueprint(bp)
+    from app.api import api_bp
+    app.register_blueprint(api_bp)
+    from app.transfer import ideas_cli
+    app.cli.add_command(ideas_cli)
     return app
@@ -0,0 +1,302 @@
+"""
+Versioned JSON API for ideas (/api/v1).
+
+Listings reuse the HTML views' tag filter and keyset pagination; writes take
+a batch of ideas and apply it in one transaction with the set-based
+statements of app/bulk.py. Whole workspaces go through the streaming export
+and import endpoints (app/transfer.py). All endpoints use the session cookie of a logged
+in user and answer 401 in JSON instead of redirecting to the login page.
+
+JSON writes cannot be sent by another site without a CORS preflight, but the
+import also takes multipart and plain text bodies, which any page can post
+with the user's cookie: it requires the session's CSRF token, sent in an
+X-CSRFToken header (or a csrf_token form field) and obtained from
+GET /api/v1/csrf-token.
+"""
+from functools import wraps
+import io
+import json
+from flask import Blueprint, Response, jsonify, request, current_app, stream_with_context
+from flask_login import current_user
+from flask_wtf.csrf import generate_csrf, validate_csrf
+from sqlalchemy.orm import load_only, noload
+from wtforms import ValidationError
+from app import db, cache, tag_index, duplicates
+from app.bulk import insert_ideas, update_ideas, delete_ideas, owned_ids
+from app.dedup import signature
+from app.forms import clean_idea
+from app.models import Idea, parse_tags
+from app.pagination import paginate_ideas
+from app.routes import filter_by_tags, get_per_page
+from app.transfer import FORMATS, export_ideas, format_from_name, import_ideas, read_records
+
+api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
+
+# Fields a client can ask for with ?fields=; id and timestamp are always
+# loaded since the pagination cursors need them.
+RESPONSE_FIELDS = ('id', 'title', 'description', 'tags', 'timestamp')
+_COLUMNS = {
+    'id': Idea.id, 'title': Idea.title, 'description': Idea.description,
+    'tags': Idea.tags, 'timestamp': Idea.timestamp,
+}
+
+
+def error(status, message, **details):
+    """JSON error response."""
+    return jsonify(error=message, **details), status
+
+
+def api_login_required(view):
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not current_user.is_authenticated:
+            return error(401, 'Authentication required')
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def csrf_required(view):
+    """400 unless the request carries the session's CSRF token (header or form field)."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_app.config.get('WTF_CSRF_ENABLED', True):
+            token = None
+            for header in current_app.config.get('WTF_CSRF_HEADERS', ('X-CSRFToken', 'X-CSRF-Token')):
+                token = token or request.headers.get(header)
+            try:
+                validate_csrf(token or request.form.get('csrf_token'))
+            except ValidationError as exc:
+                return error(400, 'CSRF token missing or invalid', reason=str(exc))
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def parse_fields():
+    """Fields requested with ?fields=a,b (all by default), or None if one is unknown."""
+    raw = request.args.get('fields')
+    if not raw:
+        return RESPONSE_FIELDS
+    fields = tuple(dict.fromkeys(f.strip() for f in raw.split(',') if f.strip()))
+    if not fields or any(f not in RESPONSE_FIELDS for f in fields):
+        return None
+    return fields
+
+
+def serialize(idea, fields):
+    data = {}
+    for field in fields:
+        if field == 'tags':
+            data['tags'] = parse_tags(idea.tags)
+        elif field == 'timestamp':
+            data['timestamp'] = idea.timestamp.isoformat() if idea.timestamp else None
+        else:
+            data[field] = getattr(idea, field)
+    return data
+
+
+def idea_query(fields):
+    """Current user's ideas loading only the requested columns (and no Tag rows)."""
+    columns = {_COLUMNS[f] for f in fields} | {Idea.id, Idea.timestamp, Idea.user_id}
+    return Idea.query.filter_by(user_id=current_user.id).options(
+        load_only(*columns), noload(Idea.tag_list)
+    )
+
+
+def read_batch(key):
+    """Items of a write request: a JSON list, or an object holding the list under `key`.
+
+    Returns:
+        tuple: (items, error response or None).
+    """
+    body = request.get_json(silent=True)
+    if isinstance(body, dict):
+        body = body.get(key)
+    if not isinstance(body, list) or not body:
+        return None, error(400, f'Expected a non-empty JSON list (or {{"{key}": [...]}})')
+    limit = current_app.config['API_MAX_BATCH']
+    if len(body) > limit:
+        return None, error(413, f'Batch too large (max {limit} items)')
+    return body, None
+
+
+def clean_batch(items, partial=False):
+    rows, errors = [], {}
+    for index, item in enumerate(items):
+        row, row_errors = clean_idea(item, partial)
+        if row_errors:
+            errors[index] = row_errors
+        rows.append(row)
+    return rows, errors
+
+
+@api_bp.route('/ideas', methods=['GET'])
+@api_login_required
+def list_ideas():
+    """Page of ideas, newest first. Query args: tags, per_page, after, before, fields."""
+    fields = parse_fields()
+    if fields is None:
+        return error(400, 'Unknown field', allowed=list(RESPONSE_FIELDS))
+    query = idea_query(fields)
+    tags = request.args.get('tags')
+    if tags:
+        query = filter_by_tags(query, current_user.id, parse_tags(tags))
+    page = paginate_ideas(
+        query, get_per_page(),
+        after=request.args.get('after'), before=request.args.get('before'),
+    )
+    return jsonify(
+        items=[serialize(idea, fields) for idea in page.items],
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor,
+    )
+
+
+@api_bp.route('/ideas/<int:id>', methods=['GET'])
+@api_login_required
+def get_idea(id):
+    fields = parse_fields()
+    if fields is None:
+        return error(400, 'Unknown field', allowed=list(RESPONSE_FIELDS))
+    idea = idea_query(fields).filter(Idea.id == id).first()
+    if idea is None:
+        return error(404, 'Idea not found')
+    return jsonify(serialize(idea, fields))
+
+
+@api_bp.route('/ideas', methods=['POST'])
+@api_login_required
+def create_ideas():
+    """Create a batch of ideas: [{"title", "description", "tags"}, ...]. All or nothing.
+
+    `duplicates` maps the index of each new idea that resembles existing
+    ones to their ids and similarity (see app/dedup.py).
+    """
+    items, response = read_batch('ideas')
+    if response:
+        return response
+    rows, errors = clean_batch(items)
+    if errors:
+        return error(400, 'Validation failed', errors=errors)
+    for row in rows:
+        row['minhash'] = signature(row['title'], row.get('description'))
+    similar = duplicates.find_many(db.session, current_user.id, [row['minhash'] for row in rows], limit=3)
+    ids = insert_ideas(current_user.id, rows)
+    db.session.commit()
+    cache.bump_user_version(current_user.id)
+    flagged = {
+        index: [{'id': idea_id, 'similarity': score} for idea_id, _, score in matches]
+        for index, matches in enumerate(similar) if matches
+    }
+    return jsonify(created=len(ids), ids=ids, duplicates=flagged), 201
+
+
+@api_bp.route('/ideas', methods=['PATCH'])
+@api_login_required
+def patch_ideas():
+    """Update a batch of ideas: [{"id", ...changed fields}, ...]. All or nothing."""
+    items, response = read_batch('ideas')
+    if response:
+        return response
+    rows, errors = clean_batch(items, partial=True)
+    if errors:
+        return error(400, 'Validation failed', errors=errors)
+    ids = [row['id'] for row in rows]
+    if len(set(ids)) != len(ids):
+        return error(400, 'Duplicate ids in batch')
+    missing = sorted(set(ids) - owned_ids(current_user.id, ids))
+    if missing:
+        return error(404, 'Ideas not found', missing=missing)
+    update_ideas(current_user.id, rows)
+    db.session.commit()
+    cache.bump_user_version(current_user.id)
+    return jsonify(updated=len(rows))
+
+
+@api_bp.route('/ideas', methods=['DELETE'])
+@api_login_required
+def remove_ideas():
+    """Delete a batch of ideas: [id, ...] or {"ids": [...]}. All or nothing."""
+    ids, response = read_batch('ids')
+    if response:
+        return response
+    if not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+        return error(400, 'Ids must be integers')
+    ids = list(dict.fromkeys(ids))
+    missing = sorted(set(ids) - owned_ids(current_user.id, ids))
+    if missing:
+        return error(404, 'Ideas not found', missing=missing)
+    deleted = delete_ideas(current_user.id, ids)
+    db.session.commit()
+    cache.bump_user_version(current_user.id)
+    return jsonify(deleted=deleted)
+
+
+@api_bp.route('/tags', methods=['GET'])
+@api_login_required
+def tags():
+    """Autocomplete a tag: ?prefix=vi&limit=10, most used tags first."""
+    limit = max(1, min(request.args.get('limit', 10, type=int), 50))
+    suggestions = tag_index.suggest(db.session, current_user.id, request.args.get('prefix', ''), limit)
+    response = jsonify(tags=[{'name': name, 'count': count} for name, count in suggestions])
+    response.headers['Cache-Control'] = 'private, max-age=10'
+    return response
+
+
+@api_bp.route('/ideas/export', methods=['GET'])
+@api_login_required
+def export():
+    """Stream all ideas as CSV or JSON Lines. Query args: format (csv, jsonl), tags."""
+    fmt = request.args.get('format', 'csv')
+    if fmt not in FORMATS:
+        return error(400, 'Unknown format', allowed=list(FORMATS))
+    tags = parse_tags(request.args.get('tags'))
+    mimetype = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+    return Response(
+        stream_with_context(export_ideas(current_user.id, fmt, tags)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=ideas.{fmt}'},
+    )
+
+
+@api_bp.route('/csrf-token', methods=['GET'])
+@api_login_required
+def csrf_token():
+    """CSRF token of the session, for the X-CSRFToken header of the import."""
+    response = jsonify(csrf_token=generate_csrf())
+    response.headers['Cache-Control'] = 'private, no-store'
+    return response
+
+
+@api_bp.route('/ideas/import', methods=['POST'])
+@api_login_required
+@csrf_required
+def import_():
+    """Import a CSV or JSON Lines upload (multipart `file` field, or the raw body).
+
+    Needs the CSRF token (see csrf_token).
+
+    The response streams one JSON line of progress per committed batch; the
+    last line has "done": true and the first errors, with their line numbers.
+    """
+    upload = request.files.get('file')
+    if upload is not None:
+        stream, default = upload.stream, format_from_name(upload.filename)
+        # The request closes its files before a streamed response is read;
+        # detach the upload so it stays open until the import is done.
+        upload.stream = io.BytesIO()
+    else:
+        stream = request.stream
+        default = 'jsonl' if 'json' in (request.mimetype or '') else 'csv'
+    fmt = request.args.get('format', default)
+    if fmt not in FORMATS:
+        return error(400, 'Unknown format', allowed=list(FORMATS))
+    user_id = current_user.id
+
+    def generate():
+        try:
+            for progress in import_ideas(user_id, read_records(stream, fmt)):
+                yield json.dumps(progress) + '\n'
+        finally:
+            stream.close()
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
@@ -0,0 +1,306 @@
+"""
+Self-hosted static assets and response compression.
+
+Third-party files are vendored under app/static/vendor by `flask assets
+vendor` (pinned versions, checked against their published SRI hashes) and
+committed, so deployments without internet access serve them too. Until a
+file is vendored, asset_url() points at its pinned CDN URL and asset_sri()
+adds the integrity attribute, so pages never render unstyled; outside
+development and testing this is logged as an error, and with
+ASSETS_REQUIRE_VENDORED the app refuses to start instead.
+
+`flask assets build` (run at deploy time, like `flask db upgrade`) copies
+every file of app/static into app/static/dist:
+
+- our own CSS and JS is minified (comments and indentation removed; the
+  vendored *.min.* files are already minified);
+- the file name gets a hash of its content, e.g. js/tag-autocomplete.3f9a2c1d7e.js,
+  so it can be cached for a year: a new version has a new URL;
+- a .gz copy (and a .br copy if the brotli package is installed) is written
+  next to it, compressed once at maximum level instead of on every request;
+- dist/manifest.json maps each source name to its hashed name.
+
+Templates link assets with asset_url('css/...'). /assets/<name> serves the
+hashed files with far-future Cache-Control headers, picking the .br or .gz
+copy the browser accepts. Without a manifest (development, or before the
+first build), asset_url() falls back to the plain /static URL.
+
+HTML responses of at least COMPRESS_MIN_SIZE bytes are gzipped on the fly,
+except those that are open to BREACH: a page that carries a secret (a CSRF
+token was generated for it) or that may reflect attacker-chosen input (query
+string, form data) could let an attacker guess the secret from the
+compressed length, so it is sent uncompressed.
+"""
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import re
+import shutil
+import threading
+import urllib.request
+import click
+from flask import abort, current_app, g, request, send_from_directory, url_for
+from flask.cli import AppGroup
+from markupsafe import Markup
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # optionnel: seulement les copies .gz
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DIST = 'dist'
+MANIFEST = 'manifest.json'
+YEAR = 365 * 24 * 3600
+
+# Files fetched by `flask assets vendor`: path under app/static -> (URL, SRI hash).
+VENDOR = {
+    'vendor/bootstrap/css/bootstrap.min.css': (
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css',
+        'sha384-9ndCyUaIbzAi2FUVXJi0CjmCapSmO7SnpJef0486qhLnuZ2cdeRhO02iuK6FUUVM',
+    ),
+    'vendor/bootstrap/js/bootstrap.bundle.min.js': (
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js',
+        'sha384-geWF76RCwLtnZ8qwWowPQNguL3RmwHVBC9FhGdlKrxdiJJigb/j/68SIy3Te4Bkz',
+    ),
+}
+
+# Source maps are not vendored; the browser would request them for nothing.
+SOURCE_MAP = re.compile(rb'\n?(/\*# sourceMappingURL=[^*]*\*/|//# sourceMappingURL=\S*)\s*$')
+CSS_COMMENT = re.compile(rb'/\*(?!!).*?\*/', re.S)  # /*! licences */ kept
+CSS_SPACE = re.compile(rb'\s*([{};,>])\s*')
+CSS_BLOCK = re.compile(rb'{[^{}]*}')  # innermost blocks: declarations, never selectors
+CSS_COLON = re.compile(rb'\s*:\s*')
+
+
+def minify_css(data):
+    data = CSS_COMMENT.sub(b'', data)
+    data = re.sub(rb'\s+', b' ', data)
+    data = CSS_SPACE.sub(rb'\1', data)
+    # In a selector `a :hover` (any hovered descendant) is not `a:hover`.
+    data = CSS_BLOCK.sub(lambda block: CSS_COLON.sub(b':', block.group()), data)
+    return data.replace(b';}', b'}').strip()
+
+
+def minify_js(data):
+    # Deliberately simple: line breaks are kept (automatic semicolon
+    # insertion still sees them), only indentation, blank lines and
+    # whole-line // comments go.
+    lines = (line.strip() for line in data.splitlines())
+    return b'\n'.join(line for line in lines if line and not line.startswith(b'//'))
+
+
+def minify(name, data):
+    """Minify a CSS or JS file unless it is already minified (*.min.css, *.min.js)."""
+    data = SOURCE_MAP.sub(b'', data)
+    if '.min.' in os.path.basename(name):
+        return data
+    if name.endswith('.css'):
+        return minify_css(data)
+    if name.endswith('.js'):
+        return minify_js(data)
+    return data
+
+
+def hashed_name(name, data):
+    root, ext = os.path.splitext(name)
+    return f'{root}.{hashlib.sha256(data).hexdigest()[:10]}{ext}'
+
+
+def build(static_folder):
+    """Minify, fingerprint and pre-compress app/static into app/static/dist.
+
+    Args:
+        static_folder (str): The app's static folder.
+
+    Returns:
+        dict: The manifest, source name -> hashed name.
+    """
+    dist = os.path.join(static_folder, DIST)
+    shutil.rmtree(dist, ignore_errors=True)
+    manifest = {}
+    for directory, subdirs, files in os.walk(static_folder):
+        if directory == static_folder and DIST in subdirs:
+            subdirs.remove(DIST)
+        for filename in sorted(files):
+            source = os.path.join(directory, filename)
+            name = os.path.relpath(source, static_folder).replace(os.sep, '/')
+            with open(source, 'rb') as f:
+                data = minify(name, f.read())
+            manifest[name] = hashed_name(name, data)
+            target = os.path.join(dist, manifest[name])
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(data)
+            with open(target + '.gz', 'wb') as f:
+                f.write(gzip.compress(data, 9, mtime=0))  # mtime=0: même fichier à chaque build
+            if brotli is not None:
+                with open(target + '.br', 'wb') as f:
+                    f.write(brotli.compress(data))
+    os.makedirs(dist, exist_ok=True)
+    with open(os.path.join(dist, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+
+def vendor(static_folder, force=False):
+    """Download the VENDOR files into app/static, checking their SRI hashes.
+
+    Returns:
+        list: Paths written (files already present are kept unless `force`).
+    """
+    written = []
+    for name, (url, integrity) in VENDOR.items():
+        target = os.path.join(static_folder, name)
+        if os.path.exists(target) and not force:
+            continue
+        with urllib.request.urlopen(url, timeout=30) as response:
+            data = response.read()
+        algorithm, expected = integrity.split('-', 1)
+        actual = base64.b64encode(hashlib.new(algorithm, data).digest()).decode()
+        if actual != expected:
+            raise RuntimeError(f'{url}: {algorithm} is {actual}, expected {expected}')
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(data)
+        written.append(name)
+    return written
+
+
+class Assets:
+    """Hashed asset URLs, precompressed asset serving and HTML gzip; configured with init_app.
+
+    Config:
+        ASSETS_MAX_AGE: Cache-Control max-age of the hashed files, in seconds.
+        ASSETS_REQUIRE_VENDORED: raise at startup if a VENDOR file is missing.
+        COMPRESS_MIMETYPES: Content types gzipped on the fly.
+        COMPRESS_MIN_SIZE: Smaller responses are sent as is (bytes).
+        COMPRESS_LEVEL: gzip level, 1 (fast) to 9 (small).
+    """
+
+    def __init__(self):
+        self.manifest = {}
+        self.cdn = {}
+        self.max_age = YEAR
+        self.mimetypes = ('text/html',)
+        self.min_size = 1024
+        self.level = 6
+        self.csrf_field = 'csrf_token'
+        self.compressed = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.max_age = app.config.get('ASSETS_MAX_AGE', YEAR)
+        self.mimetypes = tuple(app.config.get('COMPRESS_MIMETYPES', ('text/html',)))
+        self.min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+        self.level = app.config.get('COMPRESS_LEVEL', 6)
+        self.manifest = {}
+        path = os.path.join(app.static_folder, DIST, MANIFEST)
+        if os.path.exists(path):
+            with open(path) as f:
+                self.manifest = json.load(f)
+        elif not (app.debug or app.testing):
+            logger.warning('No %s: assets are served unhashed; run `flask assets build`', path)
+        # Not vendored yet: served from the pinned CDN URL meanwhile.
+        self.cdn = {name: VENDOR[name] for name in VENDOR
+                    if not os.path.exists(os.path.join(app.static_folder, name))}
+        if self.cdn:
+            message = f"Vendored assets missing ({', '.join(self.cdn)}); run `flask assets vendor`"
+            if app.config.get('ASSETS_REQUIRE_VENDORED'):
+                raise RuntimeError(message)
+            if app.debug or app.testing:
+                logger.warning('%s; loaded from the CDN meanwhile', message)
+            else:
+                logger.error('%s; pages load them from the CDN', message)
+        self.csrf_field = app.config.get('WTF_CSRF_FIELD_NAME', 'csrf_token')
+
+        app.extensions['assets'] = self
+        app.add_template_global(self.url, 'asset_url')
+        app.add_template_global(self.sri, 'asset_sri')
+        app.add_url_rule('/assets/<path:filename>', 'assets', self.view)
+        app.after_request(self._compress)
+        app.cli.add_command(assets_cli)
+
+    def url(self, name):
+        """URL of a static file, fingerprinted when the manifest knows it."""
+        if name in self.cdn:
+            return self.cdn[name][0]
+        hashed = self.manifest.get(name)
+        if hashed is None:
+            return url_for('static', filename=name)
+        return url_for('assets', filename=hashed)
+
+    def sri(self, name):
+        """integrity/crossorigin attributes for a file loaded from the CDN, else nothing."""
+        if name not in self.cdn:
+            return Markup('')
+        return Markup(' integrity="%s" crossorigin="anonymous"') % self.cdn[name][1]
+
+    def view(self, filename):
+        dist = os.path.join(current_app.static_folder, DIST)
+        path = safe_join(dist, filename)
+        if path is None or filename == MANIFEST or not os.path.isfile(path):
+            abort(404)
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if request.accept_encodings[encoding] and os.path.isfile(path + suffix):
+                response = send_from_directory(dist, filename + suffix, mimetype=mimetype)
+                response.content_encoding = encoding
+                break
+        else:
+            response = send_from_directory(dist, filename, mimetype=mimetype)
+        response.headers['Cache-Control'] = f'public, max-age={self.max_age}, immutable'
+        response.vary.add('Accept-Encoding')
+        return response
+
+    def _exposes_secret(self):
+        """True if compressing this page could leak a secret through its length (BREACH)."""
+        return self.csrf_field in g or bool(request.args) or request.method not in ('GET', 'HEAD')
+
+    def _compress(self, response):
+        if response.mimetype not in self.mimetypes:
+            return response
+        response.vary.add('Accept-Encoding')
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or 'Content-Encoding' in response.headers or not request.accept_encodings['gzip']
+                or self._exposes_secret()):
+            return response
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+        compressed = gzip.compress(data, self.level)
+        response.set_data(compressed)
+        response.content_encoding = 'gzip'
+        # The compressed body is another representation: its ETag becomes weak.
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        with self._lock:
+            self.compressed += 1
+            self.bytes_saved += len(data) - len(compressed)
+        return response
+
+
+assets_cli = AppGroup('assets', help='Static assets.')
+
+
+@assets_cli.command('vendor')
+@click.option('--force', is_flag=True, help='Download files already present again.')
+def vendor_command(force):
+    """Download the third-party assets into app/static/vendor."""
+    written = vendor(current_app.static_folder, force)
+    click.echo(f'Downloaded {len(written)} file(s).' if written else 'Vendored assets are up to date.')
+
+
+@assets_cli.command('build')
+def build_command():
+    """Minify, fingerprint and pre-compress app/static into app/static/dist."""
+    manifest = build(current_app.static_folder)
+    click.echo(f"Built {len(manifest)} asset(s){' with brotli' if brotli else ''}.")
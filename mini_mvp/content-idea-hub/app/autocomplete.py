@@ -0,0 +1,150 @@
+"""
+Tag autocomplete from an in-memory, per-user prefix index.
+
+Each user's vocabulary is a sorted list of tag names (prefix lookups with
+bisect) plus the number of ideas carrying each tag, used to rank the
+suggestions. It is built lazily on the first lookup from the Tag and idea_tag
+tables (the normalized copy of Idea.tags), then kept up to date in place:
+ORM writes of Idea are picked up by mapper events and the bulk paths of
+app/bulk.py record their changes explicitly; both are applied only once the
+transaction commits.
+
+Writes made by other worker processes are not seen; vocabularies are
+rebuilt after TAG_INDEX_TTL seconds to bound that staleness.
+"""
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session
+
+
+class TagVocabulary:
+    """Tag names of one user, sorted, with their usage counts."""
+
+    def __init__(self, counts):
+        self.counts = {name: n for name, n in counts.items() if n > 0}
+        self.names = sorted(self.counts)
+        self.built_at = time.monotonic()
+
+    def add(self, name, delta):
+        count = self.counts.get(name, 0) + delta
+        if count > 0:
+            if name not in self.counts:
+                insort(self.names, name)
+            self.counts[name] = count
+        elif name in self.counts:
+            del self.counts[name]
+            del self.names[bisect_left(self.names, name)]
+
+    def suggest(self, prefix, limit):
+        """Most used tags starting with `prefix` (ties in alphabetical order)."""
+        start = bisect_left(self.names, prefix)
+        end = bisect_left(self.names, prefix + '\U0010ffff', start)
+        matches = ((-self.counts[name], name) for name in self.names[start:end])
+        return [(name, -negated) for negated, name in heapq.nsmallest(limit, matches)]
+
+
+def record_tag_change(session, user_id, old_tags, new_tags):
+    """Queue a change of an idea's raw tag string, applied if the session commits.
+
+    Use for writes that bypass the ORM unit of work (bulk statements); pass
+    None as `old_tags` for a new idea and as `new_tags` for a deleted one.
+    """
+    session.info.setdefault('tag_changes', []).append((user_id, old_tags, new_tags))
+
+
+class TagIndex:
+    """Per-process LRU of TagVocabulary, configured with init_app like the caches.
+
+    Config:
+        TAG_INDEX_TTL: seconds before a vocabulary is rebuilt from the database.
+        TAG_INDEX_MAX_USERS: number of vocabularies kept in memory.
+    """
+
+    def __init__(self):
+        self.ttl = 300
+        self.max_users = 1000
+        self._vocabularies = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app, model):
+        self.ttl = app.config.get('TAG_INDEX_TTL', 300)
+        self.max_users = app.config.get('TAG_INDEX_MAX_USERS', 1000)
+        if not event.contains(model, 'after_insert', self._on_insert):
+            event.listen(model, 'after_insert', self._on_insert)
+            event.listen(model, 'after_update', self._on_update)
+            event.listen(model, 'after_delete', self._on_delete)
+            event.listen(Session, 'after_commit', self._on_commit)
+            event.listen(Session, 'after_rollback', self._on_rollback)
+
+    def _on_insert(self, mapper, connection, target):
+        record_tag_change(inspect(target).session, target.user_id, None, target.tags)
+
+    def _on_update(self, mapper, connection, target):
+        history = inspect(target).attrs.tags.history
+        if history.has_changes():
+            old = history.deleted[0] if history.deleted else None
+            record_tag_change(inspect(target).session, target.user_id, old, target.tags)
+
+    def _on_delete(self, mapper, connection, target):
+        record_tag_change(inspect(target).session, target.user_id, target.tags, None)
+
+    def _on_commit(self, session):
+        from app.models import parse_tags  # Import local pour éviter circular
+
+        changes = session.info.pop('tag_changes', ())
+        with self._lock:
+            for user_id, old_tags, new_tags in changes:
+                vocabulary = self._vocabularies.get(user_id)
+                if vocabulary is None:
+                    continue  # built from the committed data on the next lookup
+                for name in parse_tags(old_tags):
+                    vocabulary.add(name, -1)
+                for name in parse_tags(new_tags):
+                    vocabulary.add(name, 1)
+
+    def _on_rollback(self, session):
+        session.info.pop('tag_changes', None)
+
+    def vocabulary(self, session, user_id):
+        """The user's vocabulary, built from the database if missing or expired."""
+        from app.models import Tag, idea_tag
+
+        with self._lock:
+            vocabulary = self._vocabularies.get(user_id)
+            if vocabulary is not None and time.monotonic() - vocabulary.built_at < self.ttl:
+                self._vocabularies.move_to_end(user_id)
+                return vocabulary
+        rows = session.execute(
+            select(Tag.name, func.count(idea_tag.c.idea_id))
+            .join(idea_tag, idea_tag.c.tag_id == Tag.id)
+            .where(Tag.user_id == user_id)
+            .group_by(Tag.name)
+        )
+        vocabulary = TagVocabulary(dict(rows.all()))
+        with self._lock:
+            self._vocabularies[user_id] = vocabulary
+            self._vocabularies.move_to_end(user_id)
+            while len(self._vocabularies) > self.max_users:
+                self._vocabularies.popitem(last=False)
+        return vocabulary
+
+    def suggest(self, session, user_id, prefix, limit=10):
+        """Autocomplete a tag prefix.
+
+        Args:
+            session: Database session, used only to (re)build the vocabulary.
+            user_id (int): Owner of the tags.
+            prefix (str): Start of a tag; normalized like parse_tags.
+            limit (int, optional): Maximum number of suggestions.
+
+        Returns:
+            list: (name, count) pairs, most used first.
+        """
+        prefix = prefix.strip().lower()[:50]
+        vocabulary = self.vocabulary(session, user_id)
+        with self._lock:
+            return vocabulary.suggest(prefix, limit)
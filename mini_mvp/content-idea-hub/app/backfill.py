@@ -0,0 +1,160 @@
+"""
+Helpers for online data migrations, used from the Alembic versions.
+
+A plain migration fills a new table or column in one statement, or in one
+transaction, which holds the database's write lock (SQLite) or the updated
+rows (PostgreSQL) until it ends, so every request that writes waits for the
+whole migration. backfill() walks the source rows in key order instead:
+
+- each batch of `batch_size` rows is processed and committed in its own
+  short transaction, and `pause` seconds between batches leave room for
+  the application's writes;
+- the last key of each batch is saved in the same transaction
+  (migration_checkpoint table), so an interrupted upgrade resumes after
+  the last committed batch when `flask db upgrade` is run again;
+- progress, throughput and the estimated time left are logged.
+
+The application keeps running the new code during the backfill and writes
+the new tables itself (dual write: the mapper events and app/bulk.py fill
+idea_tag, idea_band and the tag statistics for every idea they touch). Rows
+it changes after their batch was processed are therefore already right,
+and the backfill must not fail on rows it wrote first: inserts into a table
+the application also writes use insert_ignore() (INSERT ... ON CONFLICT DO
+NOTHING), and derived counters are upserted with the recomputed value. The
+same makes a rerun after an interruption safe.
+
+Schema operations before a backfill should use if_not_exists=True so that
+a resumed upgrade can run them again. create_index() builds indexes without
+blocking writers where the engine allows it (CREATE INDEX CONCURRENTLY on
+PostgreSQL); SQLite has no such option and locks writes while it builds.
+"""
+import logging
+import time
+from alembic import op
+import sqlalchemy as sa
+
+BATCH_SIZE = 1000
+LOG_EVERY = 5  # secondes entre deux lignes de progression
+
+log = logging.getLogger('alembic.backfill')
+
+checkpoints = sa.Table(
+    'migration_checkpoint', sa.MetaData(),
+    sa.Column('name', sa.String(100), primary_key=True),
+    sa.Column('last_key', sa.BigInteger, nullable=False),
+    sa.Column('rows_done', sa.BigInteger, nullable=False),
+    sa.Column('updated_at', sa.Float, nullable=False),
+)
+
+
+def _connect(bind):
+    # Batches commit on their own connection; an in-memory SQLite database
+    # only exists on the migration's connection, so it keeps using it.
+    if bind.engine.url.database in (None, '', ':memory:'):
+        return bind.begin_nested()
+    return bind.engine.begin()
+
+
+def _save_checkpoint(connection, name, last_key, rows_done):
+    values = {'last_key': last_key, 'rows_done': rows_done, 'updated_at': time.time()}
+    updated = connection.execute(
+        checkpoints.update().where(checkpoints.c.name == name).values(**values)
+    ).rowcount
+    if not updated:
+        connection.execute(checkpoints.insert().values(name=name, **values))
+
+
+def insert_ignore(connection, table, rows):
+    """INSERT `rows` into `table`, skipping those whose key already exists.
+
+    For tables the running application writes too (see the module docstring).
+    """
+    if connection.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    connection.execute(dialect_insert(table).on_conflict_do_nothing(), rows)
+
+
+def backfill(name, query, process, batch_size=None, pause=0.0):
+    """Run `process` over the rows of `query` in key order, one transaction per batch.
+
+    Args:
+        name (str): Unique name of the backfill, e.g. '0dc12fc71ea3_minhash';
+            it identifies the checkpoint to resume from.
+        query (Select): The source rows. Its first column is the integer
+            key the rows are walked by (usually the primary key).
+        process (callable): process(connection, rows) writes one batch,
+            using only `connection`, inside the batch's transaction.
+        batch_size (int, optional): Rows per batch and transaction. Defaults to BATCH_SIZE.
+        pause (float, optional): Seconds to sleep between batches.
+
+    Returns:
+        int: Number of rows processed by this run.
+    """
+    context = op.get_context()
+    if context.as_sql:
+        raise RuntimeError(f'Backfill {name} needs a database connection; it cannot run with --sql')
+    bind = op.get_bind()
+    key = query.selected_columns[0]
+    batch_size = batch_size or BATCH_SIZE
+
+    with context.autocommit_block():
+        checkpoints.create(bind, checkfirst=True)
+        with _connect(bind) as connection:
+            saved = connection.execute(
+                sa.select(checkpoints.c.last_key, checkpoints.c.rows_done).where(checkpoints.c.name == name)
+            ).first()
+            last_key, done = saved if saved else (None, 0)
+            remaining = query if last_key is None else query.where(key > last_key)
+            total = done + connection.execute(
+                sa.select(sa.func.count()).select_from(remaining.subquery())
+            ).scalar()
+        if saved:
+            log.info('%s: resuming after key %s (%d/%d rows done)', name, last_key, done, total)
+
+        started = logged = time.monotonic()
+        first_done = done
+        while True:
+            with _connect(bind) as connection:
+                batch = query if last_key is None else query.where(key > last_key)
+                rows = connection.execute(batch.order_by(key).limit(batch_size)).fetchall()
+                if not rows:
+                    connection.execute(checkpoints.delete().where(checkpoints.c.name == name))
+                    if connection.execute(sa.select(sa.func.count()).select_from(checkpoints)).scalar() == 0:
+                        checkpoints.drop(connection)
+                    break
+                process(connection, rows)
+                last_key, done = rows[-1][0], done + len(rows)
+                _save_checkpoint(connection, name, last_key, done)
+
+            now = time.monotonic()
+            if now - logged >= LOG_EVERY:
+                logged = now
+                rate = (done - first_done) / (now - started)
+                eta = (total - done) / rate if rate else 0
+                log.info('%s: %d/%d rows (%d%%), %.0f rows/s, about %.0fs left',
+                         name, done, total, 100 * done // max(total, 1), rate, eta)
+            if pause:
+                time.sleep(pause)
+
+    elapsed = time.monotonic() - started
+    log.info('%s: %d rows in %.1fs (%.0f rows/s)', name, done - first_done, elapsed,
+             (done - first_done) / elapsed if elapsed else 0)
+    return done - first_done
+
+
+def create_index(index_name, table_name, columns, unique=False, **kw):
+    """Create an index if missing, without blocking writes where the engine allows it.
+
+    On PostgreSQL the index is built CONCURRENTLY, outside the migration's
+    transaction. Elsewhere it is a plain CREATE INDEX.
+    """
+    started = time.monotonic()
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(index_name, table_name, columns, unique=unique, if_not_exists=True,
+                            postgresql_concurrently=True, **kw)
+    else:
+        op.create_index(index_name, table_name, columns, unique=unique, if_not_exists=True, **kw)
+    log.info('index %s on %s built in %.1fs', index_name, table_name, time.monotonic() - started)
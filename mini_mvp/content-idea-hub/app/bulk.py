@@ -0,0 +1,146 @@
+"""
+Set-based writes of many ideas at once, for the JSON API and imports.
+
+Each function issues a handful of multi-row statements (executemany INSERT
+... RETURNING, ORM bulk UPDATE by primary key, DELETE ... WHERE id IN)
+instead of one ORM flush per idea. They do not commit: the caller wraps a
+whole batch in a single transaction.
+"""
+from sqlalchemy import delete, insert, select, update
+from app import db
+from app.autocomplete import record_tag_change
+from app.dedup import index_ideas, signature
+from app.models import Idea, IdeaBand, Tag, idea_tag, parse_tags
+
+
+def tag_ids(user_id, names):
+    """Map tag names to Tag ids for a user, inserting the missing tags.
+
+    Args:
+        user_id (int): Owner of the tags.
+        names (iterable): Normalized tag names.
+
+    Returns:
+        dict: name -> Tag id.
+    """
+    names = set(names)
+    if not names:
+        return {}
+    ids = dict(db.session.execute(
+        select(Tag.name, Tag.id).where(Tag.user_id == user_id, Tag.name.in_(names))
+    ).all())
+    missing = [{'name': name, 'user_id': user_id} for name in names if name not in ids]
+    if missing:
+        rows = db.session.execute(
+            insert(Tag).returning(Tag.name, Tag.id, sort_by_parameter_order=True), missing
+        )
+        ids.update(rows.all())
+    return ids
+
+
+def _link_tags(user_id, tags_by_idea):
+    """Insert idea_tag rows for {idea_id: raw tag string}."""
+    names = {idea_id: parse_tags(text) for idea_id, text in tags_by_idea.items()}
+    ids = tag_ids(user_id, (name for idea_names in names.values() for name in idea_names))
+    links = [
+        {'idea_id': idea_id, 'tag_id': ids[name]}
+        for idea_id, idea_names in names.items() for name in idea_names
+    ]
+    if links:
+        db.session.execute(idea_tag.insert(), links)
+
+
+def insert_ideas(user_id, rows):
+    """Insert ideas for a user with their tags.
+
+    Args:
+        user_id (int): Author of the ideas.
+        rows (list): Dicts with title and optional description, tags (raw
+            string), timestamp (kept when moving ideas between databases) and
+            minhash (if already computed, see app/dedup.py).
+
+    Returns:
+        list: The new idea ids, in the order of `rows`.
+    """
+    if not rows:
+        return []
+    values = []
+    for row in rows:
+        value = {'title': row['title'], 'description': row.get('description'),
+                 'tags': row.get('tags'), 'user_id': user_id,
+                 'minhash': row['minhash'] if 'minhash' in row else signature(row['title'], row.get('description'))}
+        if row.get('timestamp'):
+            value['timestamp'] = row['timestamp']
+        values.append(value)
+    ids = db.session.execute(
+        insert(Idea).returning(Idea.id, sort_by_parameter_order=True), values
+    ).scalars().all()
+    _link_tags(user_id, {idea_id: row.get('tags') for idea_id, row in zip(ids, rows) if row.get('tags')})
+    signatures = {idea_id: value['minhash'] for idea_id, value in zip(ids, values)}
+    index_ideas(db.session, user_id, signatures, new=True)
+    for row in rows:
+        record_tag_change(db.session, user_id, None, row.get('tags'))
+    return ids
+
+
+def owned_ids(user_id, ids):
+    """Subset of `ids` that exist and belong to the user."""
+    if not ids:
+        return set()
+    return set(db.session.execute(
+        select(Idea.id).where(Idea.user_id == user_id, Idea.id.in_(ids))
+    ).scalars())
+
+
+def update_ideas(user_id, rows):
+    """Apply partial updates to a user's ideas; `tags` replaces the idea's tags.
+
+    Args:
+        user_id (int): Author of the ideas (already checked with owned_ids).
+        rows (list): Dicts with id plus any of title, description and tags.
+    """
+    retagged = {row['id']: row['tags'] for row in rows if 'tags' in row}
+    if retagged:
+        # Old tag strings, read before the update, for the autocomplete index
+        old_tags = db.session.execute(select(Idea.id, Idea.tags).where(Idea.id.in_(retagged))).all()
+        for idea_id, old in old_tags:
+            record_tag_change(db.session, user_id, old, retagged[idea_id])
+    values = [row for row in rows if len(row) > 1]
+    rewritten = {row['id']: row for row in values if 'title' in row or 'description' in row}
+    if rewritten:
+        # New MinHash signatures need the unchanged half of title/description
+        current = db.session.execute(
+            select(Idea.id, Idea.title, Idea.description).where(Idea.id.in_(rewritten))
+        ).all()
+        signatures = {}
+        for idea_id, title, description in current:
+            row = rewritten[idea_id]
+            signatures[idea_id] = signature(row.get('title', title), row.get('description', description))
+        values = [{**row, 'minhash': signatures[row['id']]} if row['id'] in signatures else row
+                  for row in values]
+        index_ideas(db.session, user_id, signatures)
+    if values:
+        db.session.execute(update(Idea), values)
+    if retagged:
+        db.session.execute(delete(idea_tag).where(idea_tag.c.idea_id.in_(retagged)))
+        _link_tags(user_id, {idea_id: text for idea_id, text in retagged.items() if text})
+
+
+def delete_ideas(user_id, ids):
+    """Delete a user's ideas and their tag links.
+
+    Returns:
+        int: Number of ideas deleted.
+    """
+    if not ids:
+        return 0
+    owned = select(Idea.id).where(Idea.user_id == user_id, Idea.id.in_(ids))
+    for (old,) in db.session.execute(select(Idea.tags).where(Idea.user_id == user_id, Idea.id.in_(ids))):
+        record_tag_change(db.session, user_id, old, None)
+    db.session.execute(delete(idea_tag).where(idea_tag.c.idea_id.in_(owned)))
+    db.session.execute(delete(IdeaBand.__table__).where(IdeaBand.idea_id.in_(owned)))
+    result = db.session.execute(
+        delete(Idea).where(Idea.user_id == user_id, Idea.id.in_(ids)),
+        execution_options={'synchronize_session': False},
+    )
+    return result.rowcount
@@ -0,0 +1,283 @@
+"""
+Small pluggable cache for rendered pages and fragments.
+
+Backends:
+    memory  -- per-process LRU with TTL (default; one worker)
+    sqlite  -- a shared SQLite file, usable by several workers on one host
+    null    -- caches nothing
+
+Per-user data is keyed with a version token. Every write bumps the token,
+so stale entries are never read again and simply expire. The tokens are kept
+apart from the cached fragments, so that evicting fragments never resets
+another user's version: an unbounded per-process map for the memory and null
+backends, the (unbounded) shared file for sqlite.
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class NullBackend:
+    """Backend that stores nothing (caching disabled)."""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+
+class MemoryBackend:
+    """Thread-safe in-process LRU cache with per-entry TTL (unbounded if max_entries is None)."""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._data = OrderedDict()  # key -> (expires_at or None, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while self.max_entries is not None and len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class SQLiteBackend:
+    """Cache stored in a SQLite file shared by all workers on the host."""
+
+    SWEEP_EVERY = 500  # writes between purges of expired rows
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connect().execute(
+            'CREATE TABLE IF NOT EXISTS cache '
+            '(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)'
+        )
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        row = self._connect().execute(
+            'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+        return pickle.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+            (key, pickle.dumps(value), time.time() + ttl if ttl else None),
+        )
+        self._writes += 1
+        if self._writes % self.SWEEP_EVERY == 0:
+            conn.execute('DELETE FROM cache WHERE expires_at < ?', (time.time(),))
+
+    def delete(self, key):
+        self._connect().execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def clear(self):
+        self._connect().execute('DELETE FROM cache')
+
+
+class Cache:
+    """Flask extension wrapping the configured cache backend.
+
+    Config:
+        CACHE_BACKEND: 'memory', 'sqlite' or 'null'.
+        CACHE_DEFAULT_TTL: seconds an entry lives by default.
+        CACHE_MAX_ENTRIES: size of the memory LRU.
+        CACHE_PATH: file of the sqlite backend.
+    """
+
+    def __init__(self, app=None):
+        self.backend = NullBackend()
+        self.versions = MemoryBackend(None)
+        self.default_ttl = 60
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        kind = app.config.get('CACHE_BACKEND', 'memory')
+        self.default_ttl = app.config.get('CACHE_DEFAULT_TTL', 60)
+        if kind == 'memory':
+            self.backend = MemoryBackend(app.config.get('CACHE_MAX_ENTRIES', 1024))
+        elif kind == 'sqlite':
+            path = app.config.get('CACHE_PATH') or os.path.join(app.instance_path, 'cache.db')
+            self.backend = SQLiteBackend(path)
+        elif kind == 'null':
+            self.backend = NullBackend()
+        else:
+            raise ValueError(f'Unknown CACHE_BACKEND: {kind}')
+        # One token per user: small enough to never evict, see the module docstring.
+        self.versions = self.backend if kind == 'sqlite' else MemoryBackend(None)
+        app.extensions['cache'] = self
+
+    def get(self, key):
+        return self.backend.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.backend.set(key, value, self.default_ttl if ttl is None else ttl)
+
+    def delete(self, key):
+        self.backend.delete(key)
+
+    def clear(self):
+        self.backend.clear()
+
+    def user_version(self, user_id):
+        """Current version token of a user's data."""
+        version = self.versions.get(f'version:{user_id}')
+        if version is None:
+            version = self.bump_user_version(user_id)
+        return version
+
+    def bump_user_version(self, user_id):
+        """Invalidate everything cached for a user; call after each write."""
+        version = time.time_ns()
+        self.versions.set(f'version:{user_id}', version, None)
+        return version
+
+    def user_key(self, user_id, *parts):
+        """Cache key scoped to a user and the current version of their data."""
+        return ':'.join(['user', str(user_id), str(self.user_version(user_id))] + [str(p) for p in parts])
+
+
+class IdentityCache:
+    """Short-lived per-process cache of user rows for Flask-Login's user_loader.
+
+    Only column values are cached; on a hit they are merged into the current
+    session with ``load=False``, which gives a normal session-bound instance
+    without a SELECT.
+
+    Each entry carries the user's identity token, kept with the page cache's
+    version tokens (Cache.versions). When a User row is updated or deleted
+    through the ORM, this process drops its entry at once and, after the
+    commit, the token is bumped; an entry whose token is no longer current is
+    a miss. With CACHE_BACKEND 'sqlite' the tokens are shared, so a password
+    change or a deleted account in one worker is seen by every worker on its
+    next request. With the per-process 'memory' backend other workers only
+    see it when USER_CACHE_TTL expires; keep the TTL short in that setup.
+
+    Config:
+        USER_CACHE_TTL: seconds a cached user is trusted (0 disables the cache).
+        USER_CACHE_MAX_ENTRIES: size of the LRU.
+    """
+
+    def __init__(self):
+        self.backend = NullBackend()
+        self.versions = MemoryBackend(None)
+        self.ttl = 0
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app, model, cache=None):
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+
+        self.ttl = app.config.get('USER_CACHE_TTL', 60)
+        self.backend = (
+            MemoryBackend(app.config.get('USER_CACHE_MAX_ENTRIES', 10000))
+            if self.ttl else NullBackend()
+        )
+        self.versions = cache.versions if cache is not None else MemoryBackend(None)
+        self.model = model
+        if not event.contains(model, 'after_update', self._on_change):
+            event.listen(model, 'after_update', self._on_change)
+            event.listen(model, 'after_delete', self._on_change)
+            event.listen(Session, 'after_commit', self._on_commit)
+            event.listen(Session, 'after_rollback', self._on_rollback)
+
+    def _on_change(self, mapper, connection, target):
+        from sqlalchemy import inspect
+
+        self.backend.delete(target.id)
+        # The token moves after the commit: a worker reading the row before
+        # then would otherwise cache the old values under the new token.
+        inspect(target).session.info.setdefault('changed_users', set()).add(target.id)
+
+    def _on_commit(self, session):
+        for user_id in session.info.pop('changed_users', ()):
+            self.invalidate(user_id)
+
+    def _on_rollback(self, session):
+        session.info.pop('changed_users', None)
+
+    def _token(self, user_id):
+        return self.versions.get(f'identity:{user_id}')
+
+    def invalidate(self, user_id):
+        """Drop a user from this process's cache and from every worker's (see above)."""
+        self.backend.delete(user_id)
+        self.versions.set(f'identity:{user_id}', time.time_ns(), None)
+
+    def load(self, session, user_id):
+        """Return the user with this id, from the cache when possible."""
+        from sqlalchemy.orm import make_transient_to_detached
+
+        token = self._token(user_id) if self.ttl else None
+        entry = self.backend.get(user_id)
+        if entry is None or entry[0] != token:
+            self.misses += 1
+            user = session.get(self.model, user_id)
+            if user is not None:
+                columns = self.model.__table__.columns
+                self.backend.set(user_id, (token, {c.key: getattr(user, c.key) for c in columns}), self.ttl)
+            return user
+        self.hits += 1
+        user = self.model(**entry[1])
+        make_transient_to_detached(user)
+        return session.merge(user, load=False)
+
+    def stats(self):
+        """Hit/miss counters since the process started."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
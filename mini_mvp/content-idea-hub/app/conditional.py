@@ -0,0 +1,93 @@
+"""
+Conditional GET for per-user pages (ETag, Last-Modified, 304 Not Modified).
+
+The validators come from the database, not from the cache (whose version
+tokens are per process with the memory backend and absent with the null
+one): the number of the user's ideas and their latest Idea.updated_at, read
+in one query on the (user_id, updated_at) index, plus the endpoint, its
+arguments and the query string. Any write moves the date and a delete
+changes the count, whichever worker made it. A matching If-None-Match is
+answered with an empty 304 without running the view.
+
+Pages embed the session's CSRF token, so it is part of the ETag too: after
+logging out and in again, the browser's copy has a dead token and must not
+be revalidated. The signed token also expires after WTF_CSRF_TIME_LIMIT, so
+the validators change every CONDITIONAL_GET_WINDOW seconds as well.
+
+Last-Modified is sent for information only: a date cannot tell a delete or a
+new session apart, so If-Modified-Since alone never gives a 304. Pages with
+pending flash messages are always rendered. Gzipped pages carry the weak
+form of the ETag (see app/assets.py), so If-None-Match is compared weakly.
+"""
+import hashlib
+import time
+from datetime import datetime, timezone
+from functools import wraps
+from flask import current_app, make_response, request, session
+from flask_login import current_user
+from sqlalchemy import func, select
+from app import db
+from app.models import Idea
+
+
+def data_version(user_id):
+    """(number of ideas, latest updated_at) of a user, read from the index."""
+    return db.session.execute(
+        select(func.count(), func.max(Idea.updated_at)).where(Idea.user_id == user_id)
+    ).one()
+
+
+def page_validators(user_id, version, *parts):
+    """Strong ETag and Last-Modified date for a user's page.
+
+    Args:
+        user_id (int): Owner of the data shown.
+        version (tuple): data_version(user_id), read before the page is rendered.
+        *parts: Anything else the page depends on (endpoint, arguments...).
+
+    Returns:
+        tuple: (etag, last_modified datetime).
+    """
+    window = current_app.config['CONDITIONAL_GET_WINDOW']
+    window_start = int(time.time()) // window * window
+    csrf_token = session.get(current_app.config.get('WTF_CSRF_FIELD_NAME', 'csrf_token'))
+    raw = repr((user_id, tuple(version), csrf_token, window_start) + parts).encode()
+    etag = hashlib.sha256(raw).hexdigest()[:32]
+    updated_at = version[1]
+    modified = window_start
+    if updated_at is not None:
+        modified = max(int(updated_at.replace(tzinfo=timezone.utc).timestamp()), window_start)
+    return etag, datetime.fromtimestamp(modified, tz=timezone.utc)
+
+
+def conditional(cache_control='private, no-cache'):
+    """Add ETag/Last-Modified/Cache-Control to a GET view and answer 304 when they match.
+
+    Args:
+        cache_control (str, optional): Cache-Control header of the page. The
+            default lets the browser keep a copy but revalidate it each time.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET' or '_flashes' in session:
+                return view(*args, **kwargs)
+            version = data_version(current_user.id)
+            parts = (request.endpoint, sorted(kwargs.items()), sorted(request.args.items(multi=True)))
+            etag, last_modified = page_validators(current_user.id, version, *parts)
+            if request.if_none_match.contains_weak(etag):  # weak once gzipped
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                # The view may have created the session's CSRF token; the
+                # data part stays the version read before rendering.
+                etag, last_modified = page_validators(current_user.id, version, *parts)
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.headers['Cache-Control'] = cache_control
+            response.vary.add('Cookie')
+            return response
+        return wrapper
+    return decorator
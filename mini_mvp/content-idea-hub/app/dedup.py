@@ -0,0 +1,344 @@
+"""
+Near-duplicate ideas with MinHash signatures and an LSH bucket index.
+
+The title and description of an idea are cut into character 3-grams
+(shingles). Two ideas are near duplicates when the Jaccard similarity of
+their shingle sets reaches DEDUP_THRESHOLD. Comparing sets directly would mean
+reading every idea of the user, so each idea stores a fixed-size MinHash
+signature instead (Idea.minhash). The fraction of equal slots in two
+signatures estimates their Jaccard similarity. Signatures use one
+permutation hashing: each shingle is hashed once (CRC-32 spread by a
+multiplicative hash, both cheap) into one of SIGNATURE_SIZE slots, which
+keeps the minimum, and empty slots copy a filled one ("optimal
+densification", so short texts still give unbiased estimates).
+
+The signature is cut into BANDS bands of ROWS slots. Each band is hashed to
+a bucket stored in idea_band, indexed by (user_id, bucket). Ideas sharing a
+bucket are the candidates; only they are read and compared, so a lookup
+reads a few index entries rather than all of the user's ideas. With 16 bands
+of 4 slots, a pair at 0.6 similarity shares a bucket 89% of the time and one
+at 0.3 only 12% of the time.
+
+Signatures and buckets follow every write: ORM flushes of Idea through
+mapper events, and the set-based writes of app/bulk.py through
+index_ideas(). `flask duplicates clusters` groups the existing duplicates of
+a user and `flask duplicates reindex` rebuilds the index.
+"""
+import re
+import struct
+import zlib
+from collections import Counter, defaultdict
+from hashlib import blake2b
+from itertools import combinations, groupby
+import click
+from flask.cli import AppGroup
+from sqlalchemy import delete, event, insert, inspect, select, update
+
+SHINGLE_SIZE = 3
+MAX_TEXT = 4000  # Caractères de titre + description pris en compte
+SIGNATURE_SIZE = 64
+BANDS, ROWS = 16, 4
+_PACK = struct.Struct(f'<{SIGNATURE_SIZE}I')
+
+
+def _models():
+    from app import models  # Import local pour éviter circular
+    return models
+
+
+def _chunks(values, size=500):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def shingles(title, description=None):
+    """Character 3-grams of the normalized title and description."""
+    text = ' '.join(re.findall(r'\w+', f'{title or ""} {description or ""}'.lower()))[:MAX_TEXT]
+    if not text:
+        return set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(max(1, len(text) - SHINGLE_SIZE + 1))}
+
+
+def _donor(slot, attempt):
+    h = zlib.crc32(b'%d:%d' % (slot, attempt)) * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF
+    return h * SIGNATURE_SIZE >> 64
+
+
+def signature(title, description=None):
+    """MinHash signature of an idea's text, as bytes (None if there is no text).
+
+    Args:
+        title (str): Title of the idea.
+        description (str, optional): Description of the idea.
+
+    Returns:
+        bytes: SIGNATURE_SIZE little-endian 32-bit slots.
+    """
+    slots = [None] * SIGNATURE_SIZE
+    for shingle in shingles(title, description):
+        h = zlib.crc32(shingle.encode()) * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF
+        slot, value = h * SIGNATURE_SIZE >> 64, h >> 26 & 0xFFFFFFFF
+        if slots[slot] is None or value < slots[slot]:
+            slots[slot] = value
+    if all(value is None for value in slots):
+        return None
+    # Densification: an empty slot copies a filled one, probing slots in a
+    # pseudo-random order fixed per slot, the same for every idea.
+    filled = list(slots)
+    for slot in range(SIGNATURE_SIZE):
+        attempt = 0
+        while filled[slot] is None:
+            attempt += 1
+            filled[slot] = slots[_donor(slot, attempt)]
+    return _PACK.pack(*filled)
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures, between 0 and 1."""
+    if not a or not b:
+        return 0.0
+    return sum(x == y for x, y in zip(_PACK.unpack(a), _PACK.unpack(b))) / SIGNATURE_SIZE
+
+
+def buckets(sig):
+    """LSH bucket of each band of a signature, as signed 64-bit integers."""
+    if not sig:
+        return []
+    size = ROWS * 4
+    return [
+        int.from_bytes(blake2b(bytes([band]) + sig[band * size:(band + 1) * size], digest_size=8).digest(),
+                       'little', signed=True)
+        for band in range(BANDS)
+    ]
+
+
+def band_rows(idea_id, user_id, sig):
+    """idea_band rows of an idea."""
+    return [
+        {'idea_id': idea_id, 'band': band, 'bucket': bucket, 'user_id': user_id}
+        for band, bucket in enumerate(buckets(sig))
+    ]
+
+
+def index_ideas(session, user_id, signatures, new=False):
+    """Replace the LSH buckets of ideas written with set-based statements.
+
+    Args:
+        session: Session (or connection) of the write; nothing is committed.
+        user_id (int): Author of the ideas.
+        signatures (dict): idea id -> signature (None for no text).
+        new (bool, optional): The ideas were just inserted and have no
+            buckets yet, so there is nothing to delete first.
+    """
+    if not signatures:
+        return
+    table = _models().IdeaBand.__table__
+    if not new:
+        for chunk in _chunks(signatures):
+            session.execute(delete(table).where(table.c.idea_id.in_(chunk)))
+    rows = [row for idea_id, sig in signatures.items() for row in band_rows(idea_id, user_id, sig)]
+    if rows:
+        session.execute(insert(table), rows)
+
+
+class DuplicateIndex:
+    """Finds an idea's near duplicates; configured with init_app like the tag index.
+
+    Config:
+        DEDUP_THRESHOLD: minimum estimated similarity of a duplicate.
+        DEDUP_MAX_CANDIDATES: candidates compared per lookup, those sharing
+            the most buckets first.
+    """
+
+    def __init__(self):
+        self.threshold = 0.6
+        self.max_candidates = 200
+
+    def init_app(self, app, model):
+        self.threshold = app.config.get('DEDUP_THRESHOLD', 0.6)
+        self.max_candidates = app.config.get('DEDUP_MAX_CANDIDATES', 200)
+        if not event.contains(model, 'before_insert', self._on_write):
+            event.listen(model, 'before_insert', self._on_write)
+            event.listen(model, 'before_update', self._on_write)
+            event.listen(model, 'after_insert', self._after_insert)
+            event.listen(model, 'after_update', self._after_update)
+            event.listen(model, 'before_delete', self._on_delete)
+        app.cli.add_command(duplicates_cli)
+
+    def _on_write(self, mapper, connection, target):
+        state = inspect(target)
+        if state.pending or state.attrs.title.history.has_changes() \
+                or state.attrs.description.history.has_changes():
+            target.minhash = signature(target.title, target.description)
+
+    def _after_insert(self, mapper, connection, target):
+        index_ideas(connection, target.user_id, {target.id: target.minhash}, new=True)
+
+    def _after_update(self, mapper, connection, target):
+        if inspect(target).attrs.minhash.history.has_changes():
+            index_ideas(connection, target.user_id, {target.id: target.minhash})
+
+    def _on_delete(self, mapper, connection, target):
+        table = _models().IdeaBand.__table__
+        connection.execute(delete(table).where(table.c.idea_id == target.id))
+
+    def find_many(self, session, user_id, signatures, limit=5):
+        """Near duplicates among a user's ideas for several signatures at once.
+
+        Args:
+            session: Database session.
+            user_id (int): Owner of the ideas to search.
+            signatures (list): Signatures (see signature()), None allowed.
+            limit (int, optional): Maximum matches per signature.
+
+        Returns:
+            list: For each signature, a list of (idea id, title, similarity)
+            tuples, most similar first.
+        """
+        models = _models()
+        IdeaBand, Idea = models.IdeaBand, models.Idea
+        wanted = [buckets(sig) for sig in signatures]
+        members = defaultdict(list)
+        for chunk in _chunks({bucket for bs in wanted for bucket in bs}):
+            for bucket, idea_id in session.execute(
+                select(IdeaBand.bucket, IdeaBand.idea_id)
+                .where(IdeaBand.user_id == user_id, IdeaBand.bucket.in_(chunk))
+            ):
+                members[bucket].append(idea_id)
+
+        candidates = []
+        for bs in wanted:
+            shared = Counter(idea_id for bucket in bs for idea_id in members.get(bucket, ()))
+            candidates.append([idea_id for idea_id, _ in shared.most_common(self.max_candidates)])
+        stored = {}
+        for chunk in _chunks({idea_id for ids in candidates for idea_id in ids}):
+            for idea_id, title, sig in session.execute(
+                select(Idea.id, Idea.title, Idea.minhash).where(Idea.id.in_(chunk))
+            ):
+                stored[idea_id] = (title, sig)
+
+        results = []
+        for sig, ids in zip(signatures, candidates):
+            matches = []
+            for idea_id in ids:
+                title, other = stored[idea_id]
+                score = similarity(sig, other)
+                if score >= self.threshold:
+                    matches.append((idea_id, title, round(score, 2)))
+            matches.sort(key=lambda match: (-match[2], match[0]))
+            results.append(matches[:limit])
+        return results
+
+    def find(self, session, user_id, title, description=None, limit=5):
+        """Near duplicates of a title and description among a user's ideas."""
+        return self.find_many(session, user_id, [signature(title, description)], limit)[0]
+
+    def clusters(self, session, user_id, max_bucket=1000):
+        """Group all of a user's near-duplicate ideas.
+
+        Every pair of ideas sharing a bucket is compared once; pairs above
+        the threshold are merged into clusters (union-find). Buckets with
+        more than `max_bucket` ideas are skipped.
+
+        Returns:
+            list: Lists of idea ids, largest clusters first.
+        """
+        models = _models()
+        IdeaBand, Idea = models.IdeaBand, models.Idea
+        pairs = set()
+        rows = session.execute(
+            select(IdeaBand.bucket, IdeaBand.idea_id)
+            .where(IdeaBand.user_id == user_id)
+            .order_by(IdeaBand.bucket)
+            .execution_options(yield_per=10000)
+        )
+        for _, group in groupby(rows, key=lambda row: row.bucket):
+            ids = sorted({row.idea_id for row in group})
+            if 1 < len(ids) <= max_bucket:
+                pairs.update(combinations(ids, 2))
+
+        sigs = {}
+        for chunk in _chunks({idea_id for pair in pairs for idea_id in pair}):
+            sigs.update(session.execute(select(Idea.id, Idea.minhash).where(Idea.id.in_(chunk))).all())
+        parent = {}
+
+        def root(idea_id):
+            while parent[idea_id] != idea_id:
+                parent[idea_id] = parent[parent[idea_id]]  # path halving
+                idea_id = parent[idea_id]
+            return idea_id
+
+        for a, b in pairs:
+            if similarity(sigs[a], sigs[b]) >= self.threshold:
+                parent.setdefault(a, a)
+                parent.setdefault(b, b)
+                parent[root(a)] = root(b)
+        groups = defaultdict(list)
+        for idea_id in sorted(parent):
+            groups[root(idea_id)].append(idea_id)
+        return sorted(groups.values(), key=lambda ids: (-len(ids), ids[0]))
+
+
+duplicates_cli = AppGroup('duplicates', help='Near-duplicate ideas.')
+
+
+def _user_ids(username):
+    from app import db
+
+    User = _models().User
+    if username:
+        user = User.query.filter_by(username=username).first()
+        if user is None:
+            raise click.ClickException(f'Unknown user: {username}')
+        return [user.id]
+    return db.session.execute(select(User.id).order_by(User.id)).scalars().all()
+
+
+@duplicates_cli.command('clusters')
+@click.argument('username', required=False)
+@click.option('--threshold', type=float, help='Minimum similarity (default: DEDUP_THRESHOLD).')
+def clusters_command(username, threshold):
+    """List the groups of near-duplicate ideas of USERNAME, or of every user."""
+    from app import db, duplicates
+
+    if threshold is not None:
+        duplicates.threshold = threshold
+    Idea = _models().Idea
+    found = 0
+    for user_id in _user_ids(username):
+        for cluster in duplicates.clusters(db.session, user_id):
+            found += 1
+            titles = dict(db.session.execute(select(Idea.id, Idea.title).where(Idea.id.in_(cluster))).all())
+            click.echo(f'user {user_id}, {len(cluster)} ideas:')
+            for idea_id in cluster:
+                click.echo(f'  #{idea_id} {titles[idea_id]}')
+    click.echo(f'{found} group(s) of near-duplicate ideas.')
+
+
+@duplicates_cli.command('reindex')
+@click.argument('username', required=False)
+@click.option('--batch-size', type=int, default=1000, show_default=True)
+def reindex_command(username, batch_size):
+    """Recompute signatures and buckets of USERNAME's ideas, or of every idea."""
+    from app import db
+
+    Idea = _models().Idea
+    total = 0
+    for user_id in _user_ids(username):
+        last_id = 0
+        while True:
+            rows = db.session.execute(
+                select(Idea.id, Idea.title, Idea.description)
+                .where(Idea.user_id == user_id, Idea.id > last_id)
+                .order_by(Idea.id).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            sigs = {row.id: signature(row.title, row.description) for row in rows}
+            db.session.execute(update(Idea), [{'id': idea_id, 'minhash': sig} for idea_id, sig in sigs.items()])
+            index_ideas(db.session, user_id, sigs)
+            db.session.commit()
+            total += len(rows)
+    click.echo(f'Reindexed {total} ideas.')
@@ -0,0 +1,96 @@
+"""
+Per-connection database setup and read/write routing.
+
+SQLite connections get the PRAGMAs from SQLITE_PRAGMAS (WAL journal, busy
+timeout, synchronous level) as soon as they are opened, so every pooled
+connection of every worker behaves the same.
+
+With a read engine configured (SQLALCHEMY_BINDS['replica'], e.g. a
+PostgreSQL replica, or a second, read-only pool on the same SQLite WAL file:
+'sqlite:///file:/path/site.db?mode=ro&uri=true'), read-only requests query
+it and everything else goes to the primary (see DatabaseRouter).
+"""
+import time
+from flask import request, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """Run `PRAGMA name=value` on each new connection of a SQLite engine.
+
+    Args:
+        engine (Engine): The SQLAlchemy engine.
+        pragmas (dict): PRAGMA names and values, e.g. {'journal_mode': 'WAL'}.
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            if name == 'journal_mode' and (engine.url.database in (None, '', ':memory:')
+                                           or engine.url.query.get('mode') == 'ro'):
+                continue  # in-memory databases cannot use WAL, read-only ones cannot switch
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+class RoutingSession(Session):
+    """db.session sending the reads of read-only requests to the replica engine.
+
+    DatabaseRouter marks the session of a read-only request with
+    info['read_only']. Its statements then go to the DB_READ_BIND engine,
+    until the first flush or INSERT/UPDATE/DELETE: from there on the session
+    stays on the primary, so it reads what it has just written.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.info.get('read_only'):
+            if self._flushing or getattr(clause, 'is_dml', False):
+                self.info['read_only'] = False
+            else:
+                return self.info['replica']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class DatabaseRouter:
+    """Routes GET/HEAD requests to a read replica; configured with init_app like the cache.
+
+    Every other request goes to the primary and makes the user's session
+    sticky: for DB_STICKY_SECONDS afterwards, its reads stay on the primary
+    too, so the user sees their own writes despite the replica's lag.
+
+    Config:
+        SQLALCHEMY_BINDS[DB_READ_BIND]: URI of the replica (no replica, no routing).
+        DB_READ_BIND: bind key of the replica, 'replica' by default.
+        DB_STICKY_SECONDS: how long reads stay on the primary after a write.
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self):
+        self.replica = None
+        self.sticky = 5
+        self.replica_requests = 0
+        self.primary_requests = 0
+
+    def init_app(self, app, db):
+        key = app.config.get('DB_READ_BIND', 'replica')
+        self.sticky = app.config.get('DB_STICKY_SECONDS', 5)
+        with app.app_context():
+            self.replica = db.engines.get(key)
+        if self.replica is not None:
+            app.before_request(lambda: self._before_request(db))
+        app.extensions['db_router'] = self
+
+    def _before_request(self, db):
+        now = time.time()
+        if request.method not in self.SAFE_METHODS:
+            session['_db_primary_until'] = now + self.sticky
+        elif session.get('_db_primary_until', 0) <= now:
+            db.session.info.update(read_only=True, replica=self.replica)
+            self.replica_requests += 1
+            return
+        self.primary_requests += 1
@@ -20,4 +20,60 @@ class IdeaForm(FlaskForm):
 
 class SearchForm(FlaskForm):
     tags = StringField('Filter by Tags')
-    submit = SubmitField('Search')
\ No newline at end of file
+    submit = SubmitField('Search')
+
+class TextSearchForm(FlaskForm):
+    class Meta:
+        csrf = False  # GET form, nothing to protect
+
+    q = StringField('Search ideas', validators=[Length(max=200)])
+    submit = SubmitField('Search')
+
+IDEA_FIELDS = ('title', 'description', 'tags')
+
+
+def idea_errors(data, partial=False):
+    """Validate one idea given as a dict (API and import rows) with IdeaForm's rules.
+
+    Args:
+        data (dict): Values for title, description and tags.
+        partial (bool, optional): Only check the keys present in `data` (updates).
+
+    Returns:
+        dict: Field name -> list of error messages; empty if the idea is valid.
+    """
+    errors = {}
+    for name in IDEA_FIELDS:
+        if name in data and data[name] is not None and not isinstance(data[name], str):
+            errors[name] = ['Must be a string.']
+    if errors:
+        return errors
+    form = IdeaForm(formdata=None, data=data, meta={'csrf': False})
+    form.validate()
+    return {
+        name: messages for name, messages in form.errors.items()
+        if name in IDEA_FIELDS and (not partial or name in data)
+    }
+
+
+def clean_idea(row, partial=False):
+    """Normalize and validate one idea given as a dict (API batches, imports).
+
+    Returns:
+        tuple: (normalized dict, errors dict). Tag lists become the same
+        comma-separated string the HTML form stores.
+    """
+    if not isinstance(row, dict):
+        return None, {'_': ['Must be an object.']}
+    allowed = IDEA_FIELDS + (('id',) if partial else ())
+    unknown = [key for key in row if key not in allowed]
+    if unknown:
+        return None, {key: ['Unknown field.'] for key in unknown}
+    row = dict(row)
+    if isinstance(row.get('tags'), list):
+        if not all(isinstance(tag, str) for tag in row['tags']):
+            return None, {'tags': ['Must be a list of strings.']}
+        row['tags'] = ','.join(row['tags'])
+    if partial and (not isinstance(row.get('id'), int) or isinstance(row.get('id'), bool)):
+        return None, {'id': ['An integer id is required.']}
+    return row, idea_errors(row, partial=partial)
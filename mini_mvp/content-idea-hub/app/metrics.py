@@ -0,0 +1,230 @@
+"""
+Per-request instrumentation: SQL and template timings, slow-query log and
+Prometheus metrics.
+
+SQLAlchemy cursor events and Flask's template signals feed a RequestTiming
+kept in `g`. Each response then gets a Server-Timing header (visible in the
+browser dev tools), e.g.
+
+    Server-Timing: db;dur=12.4;desc="7 queries", tpl;dur=3.1, app;dur=21.9
+
+Statements slower than SLOW_QUERY_MS and requests slower than
+SLOW_REQUEST_MS (with their slowest statements) are logged as warnings.
+Process-wide counters and histograms are served in Prometheus text format at
+/debug/metrics when DEBUG_METRICS is set; with several workers each process
+reports its own numbers.
+"""
+import heapq
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from flask import Response, g, has_request_context, request, before_render_template, template_rendered
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Bornes des histogrammes de durée, en secondes
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SLOWEST_KEPT = 3
+
+
+def compact_sql(statement, limit=500):
+    """One-line, truncated statement for logs."""
+    statement = re.sub(r'\s+', ' ', statement).strip()
+    return statement if len(statement) <= limit else statement[:limit] + '…'
+
+
+class RequestTiming:
+    """What one request spent in the database and in templates."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.sql_time = 0.0
+        self.render_time = 0.0
+        self.slowest = []  # min-heap of (duration, statement)
+        self._render_starts = []
+
+    def add_query(self, statement, duration):
+        self.queries += 1
+        self.sql_time += duration
+        item = (duration, statement)
+        if len(self.slowest) < SLOWEST_KEPT:
+            heapq.heappush(self.slowest, item)
+        elif duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, item)
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def server_timing(self):
+        """Value of the Server-Timing header (durations in ms)."""
+        return ', '.join((
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.queries} queries"',
+            f'tpl;dur={self.render_time * 1000:.1f}',
+            f'app;dur={self.elapsed() * 1000:.1f}',
+        ))
+
+
+class Histogram:
+    """Cumulative Prometheus histogram for one label set."""
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{k}="{v}"' for k, v in labels.items()) + '}' if labels else ''
+
+
+class Metrics:
+    """Instrumentation extension, configured with init_app like the cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)  # (endpoint, method, status) -> count
+        self.request_durations = defaultdict(Histogram)  # endpoint -> Histogram
+        self.query_durations = Histogram()
+        self.render_durations = Histogram()
+        self.slow_queries = 0
+        self.extra = {}  # name -> (type, help, callable returning a number)
+
+    def init_app(self, app, engine):
+        """Hook the engine and the app's request and template signals.
+
+        Args:
+            app (Flask): The application.
+            engine (Engine): Its SQLAlchemy engine.
+        """
+        self.slow_query = app.config.get('SLOW_QUERY_MS', 200) / 1000
+        self.slow_request = app.config.get('SLOW_REQUEST_MS', 1000) / 1000
+        app.extensions['metrics'] = self
+
+        self.watch(engine)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        if app.config.get('DEBUG_METRICS', app.debug):
+            app.add_url_rule('/debug/metrics', 'debug_metrics', self.view)
+
+    def watch(self, engine):
+        """Time the queries of another engine too (e.g. a read replica)."""
+        if not event.contains(engine, 'before_cursor_execute', self._before_cursor_execute):
+            event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def add_metric(self, name, help_text, func, kind='gauge'):
+        """Export the value returned by `func()` at scrape time.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): HELP line.
+            func (callable): Returns the current value.
+            kind (str, optional): Prometheus type, 'gauge' or 'counter'.
+        """
+        self.extra[name] = (kind, help_text, func)
+
+    @staticmethod
+    def _timing():
+        return g.get('_timing') if has_request_context() else None
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info['query_start'].pop()
+        with self._lock:
+            self.query_durations.observe(duration)
+            if duration >= self.slow_query:
+                self.slow_queries += 1
+        if duration >= self.slow_query:
+            logger.warning('Slow query (%.1f ms): %s', duration * 1000, compact_sql(statement))
+        timing = self._timing()
+        if timing is not None:
+            timing.add_query(statement, duration)
+
+    def _before_render(self, sender, template, context, **extra):
+        timing = self._timing()
+        if timing is not None:
+            timing._render_starts.append(time.perf_counter())
+
+    def _after_render(self, sender, template, context, **extra):
+        timing = self._timing()
+        if timing is not None and timing._render_starts:
+            duration = time.perf_counter() - timing._render_starts.pop()
+            if not timing._render_starts:  # nested renders are already counted by the outer one
+                timing.render_time += duration
+            with self._lock:
+                self.render_durations.observe(duration)
+
+    def _before_request(self):
+        g._timing = RequestTiming()
+
+    def _after_request(self, response):
+        timing = g.pop('_timing', None)
+        if timing is None:
+            return response
+        response.headers['Server-Timing'] = timing.server_timing()
+        elapsed = timing.elapsed()
+        endpoint = request.endpoint or 'none'
+        with self._lock:
+            self.requests[endpoint, request.method, response.status_code] += 1
+            self.request_durations[endpoint].observe(elapsed)
+        if elapsed >= self.slow_request:
+            logger.warning(
+                'Slow request %s %s (%.1f ms, %d queries, %.1f ms SQL, %.1f ms templates); slowest: %s',
+                request.method, request.path, elapsed * 1000, timing.queries,
+                timing.sql_time * 1000, timing.render_time * 1000,
+                ' | '.join(f'{d * 1000:.1f} ms {compact_sql(s, 200)}'
+                           for d, s in sorted(timing.slowest, reverse=True)),
+            )
+        return response
+
+    def render(self):
+        """All metrics in Prometheus text exposition format."""
+        lines = []
+
+        def histogram(name, help_text, items):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for labels, hist in items:
+                for bound, count in zip(BUCKETS, hist.counts):
+                    lines.append(f'{name}_bucket{_labels(**labels, le=bound)} {count}')
+                lines.append(f'{name}_bucket{_labels(**labels, le="+Inf")} {hist.count}')
+                lines.append(f'{name}_sum{_labels(**labels)} {hist.sum:.6f}')
+                lines.append(f'{name}_count{_labels(**labels)} {hist.count}')
+
+        with self._lock:
+            lines.append('# HELP http_requests_total Requests handled, by endpoint, method and status.')
+            lines.append('# TYPE http_requests_total counter')
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                lines.append(f'http_requests_total{_labels(endpoint=endpoint, method=method, status=status)} {count}')
+            histogram('http_request_duration_seconds', 'Request duration, by endpoint.',
+                      [({'endpoint': e}, h) for e, h in sorted(self.request_durations.items())])
+            histogram('db_query_duration_seconds', 'SQL statement duration.',
+                      [({}, self.query_durations)])
+            histogram('template_render_duration_seconds', 'Template render duration.',
+                      [({}, self.render_durations)])
+            lines.append(f'# HELP db_slow_queries_total Statements slower than {self.slow_query * 1000:g} ms.')
+            lines.append('# TYPE db_slow_queries_total counter')
+            lines.append(f'db_slow_queries_total {self.slow_queries}')
+        for name, (kind, help_text, func) in sorted(self.extra.items()):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            lines.append(f'{name} {func()}')
+        return '\n'.join(lines) + '\n'
+
+    def view(self):
+        return Response(self.render(), mimetype='text/plain; version=0.0.4')
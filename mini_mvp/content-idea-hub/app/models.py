@@ -4,9 +4,34 @@ Returns:
     User: The user instance.
 """
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
-from app import db  # Import db from __init__.py
+from sqlalchemy import insert
+from app import db, passwords  # Import db from __init__.py
+
+
+def parse_tags(text):
+    """Split a comma-separated tag string into unique, normalized tag names.
+
+    Args:
+        text (str): Raw tags, e.g. "Video, funny,tech".
+
+    Returns:
+        list: Lower-cased names in their original order, e.g. ['video', 'funny', 'tech'].
+    """
+    names = []
+    for raw in (text or '').split(','):
+        name = raw.strip().lower()[:50]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+idea_tag = db.Table(
+    'idea_tag',
+    db.Column('idea_id', db.Integer, db.ForeignKey('idea.id'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tag.id'), primary_key=True),
+    db.Index('ix_idea_tag_tag_id_idea_id', 'tag_id', 'idea_id'),
+)
 
 class User(db.Model, UserMixin):
     id = db.Column(db.Integer, primary_key=True)
@@ -16,9 +41,9 @@ class User(db.Model, UserMixin):
 
     def set_password(self, password):
         """
-        configuer le mot de passe en *hashant*
+        configuer le mot de passe en *hashant* (sur le pool de app/passwords.py)
         """
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = passwords.hash(password)
 
     def check_password(self, password):
         """_summary_
@@ -29,7 +54,17 @@ class User(db.Model, UserMixin):
         Returns:
             _type_: _description_
         """
-        return check_password_hash(self.password_hash, password)
+        return passwords.verify(self.password_hash, password)
+
+    def rehash_password(self, password):
+        """
+        Re-hash a just-verified password if the stored hash uses an outdated
+        method or cost (PASSWORD_HASH_METHOD). Returns True if it changed.
+        """
+        if not passwords.needs_rehash(self.password_hash):
+            return False
+        self.set_password(password)
+        return True
     
     def __repr__(self):
         return f'<User {self.username}>'
@@ -41,7 +76,116 @@ class Idea(db.Model):
     description = db.Column(db.Text)
     tags = db.Column(db.String(200))  # e.g., "video,funny,tech"
     timestamp = db.Column(db.DateTime, index=True, default=datetime.utcnow)
+    # Dernière écriture, pour les validateurs des pages (app/conditional.py)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    tag_list = db.relationship('Tag', secondary=idea_tag, lazy='selectin', backref='ideas')
+    # Signature MinHash du titre et de la description (app/dedup.py), chargée à la demande
+    minhash = db.deferred(db.Column(db.LargeBinary))
+
+    __table_args__ = (
+        # Keyset pagination of a user's ideas (see app/pagination.py)
+        db.Index('ix_idea_user_id_timestamp_id', 'user_id', 'timestamp', 'id'),
+        # count() and max(updated_at) of a user's ideas from the index alone
+        db.Index('ix_idea_user_id_updated_at', 'user_id', 'updated_at'),
+    )
+
+    def set_tags(self, text):
+        """
+        Store the raw tag string and link the idea to its normalized Tag rows,
+        creating the missing ones for the idea's author.
+        """
+        self.tags = text
+        names = parse_tags(text)
+        user_id = self.user_id if self.user_id is not None else self.author.id
+        existing = {}
+        if names:
+            # Tags created earlier in the same unit of work are not in the DB yet.
+            existing = {
+                obj.name: obj for obj in db.session.new
+                if isinstance(obj, Tag) and obj.user_id == user_id and obj.name in names
+            }
+            with db.session.no_autoflush:
+                existing.update(
+                    (tag.name, tag)
+                    for tag in Tag.query.filter(Tag.user_id == user_id, Tag.name.in_(names))
+                )
+                missing = [{'name': name, 'user_id': user_id} for name in names if name not in existing]
+                if missing:
+                    # One multi-row INSERT ... RETURNING for all the new tags,
+                    # not one INSERT per Tag at flush time.
+                    existing.update(
+                        (tag.name, tag)
+                        for tag in db.session.scalars(insert(Tag).values(missing).returning(Tag))
+                    )
+        self.tag_list = [existing[name] for name in names]
 
     def __repr__(self):
         return f'<Idea {self.title}>'
+
+
+class Tag(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'name', name='uq_tag_user_id_name'),
+    )
+
+    def __repr__(self):
+        return f'<Tag {self.name}>'
+
+
+class TagStat(db.Model):
+    """Materialized usage of a tag (see app/tagstats.py), one row per tag in use."""
+    __tablename__ = 'tag_stats'
+
+    tag_id = db.Column(db.Integer, db.ForeignKey('tag.id'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    idea_count = db.Column(db.Integer, nullable=False, default=0)
+    last_used_at = db.Column(db.DateTime)
+
+    tag = db.relationship('Tag', lazy='joined')
+
+
+class TagActivity(db.Model):
+    """Number of times a tag was put on an idea, per day."""
+    __tablename__ = 'tag_activity'
+
+    tag_id = db.Column(db.Integer, db.ForeignKey('tag.id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('ix_tag_activity_user_id_day', 'user_id', 'day'),
+    )
+
+
+class TagPair(db.Model):
+    """Number of ideas carrying both tags (tag_a_id < tag_b_id)."""
+    __tablename__ = 'tag_pair'
+
+    tag_a_id = db.Column(db.Integer, db.ForeignKey('tag.id'), primary_key=True)
+    tag_b_id = db.Column(db.Integer, db.ForeignKey('tag.id'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('ix_tag_pair_user_id_count', 'user_id', 'count'),
+    )
+
+
+class IdeaBand(db.Model):
+    """LSH bucket of one band of an idea's MinHash signature (see app/dedup.py)."""
+    __tablename__ = 'idea_band'
+
+    idea_id = db.Column(db.Integer, db.ForeignKey('idea.id'), primary_key=True)
+    band = db.Column(db.SmallInteger, primary_key=True)
+    bucket = db.Column(db.BigInteger, nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_idea_band_user_id_bucket', 'user_id', 'bucket'),
+    )
@@ -0,0 +1,96 @@
+"""
+Keyset (cursor) pagination for idea listings.
+
+Pages are ordered by (timestamp, id) descending and a cursor encodes the
+(timestamp, id) of the boundary row, so every page is an index range scan on
+ix_idea_user_id_timestamp_id instead of an OFFSET over all previous rows.
+"""
+import base64
+from datetime import datetime
+from sqlalchemy import and_, or_
+from app.models import Idea
+
+
+class KeysetPage:
+    """One page of ideas plus the cursors to reach its neighbours."""
+
+    def __init__(self, items, next_cursor=None, prev_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+
+def encode_cursor(idea):
+    """Encode an idea's (timestamp, id) as an opaque URL-safe string."""
+    raw = f'{idea.timestamp.isoformat()}|{idea.id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor from encode_cursor.
+
+    Args:
+        cursor (str): The cursor, possibly None or tampered with.
+
+    Returns:
+        tuple: (timestamp, id), or None if the cursor is missing or invalid.
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        timestamp, idea_id = raw.split('|')
+        return datetime.fromisoformat(timestamp), int(idea_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def paginate_ideas(query, per_page, after=None, before=None):
+    """Fetch one page of `query`, newest first.
+
+    Args:
+        query: Idea query, already filtered.
+        per_page (int): Page size.
+        after (str, optional): Cursor of the last row of the previous page (go forward).
+        before (str, optional): Cursor of the first row of the next page (go back).
+
+    Returns:
+        KeysetPage: The page of ideas.
+    """
+    after_key, before_key = decode_cursor(after), decode_cursor(before)
+    if before_key:
+        timestamp, idea_id = before_key
+        rows = (
+            query.filter(or_(Idea.timestamp > timestamp,
+                             and_(Idea.timestamp == timestamp, Idea.id > idea_id)))
+            .order_by(Idea.timestamp.asc(), Idea.id.asc())
+            .limit(per_page + 1)
+            .all()
+        )
+        has_more = len(rows) > per_page
+        items = rows[:per_page][::-1]
+        return KeysetPage(
+            items,
+            next_cursor=encode_cursor(items[-1]) if items else None,
+            prev_cursor=encode_cursor(items[0]) if has_more else None,
+        )
+
+    if after_key:
+        timestamp, idea_id = after_key
+        query = query.filter(or_(Idea.timestamp < timestamp,
+                                 and_(Idea.timestamp == timestamp, Idea.id < idea_id)))
+    rows = query.order_by(Idea.timestamp.desc(), Idea.id.desc()).limit(per_page + 1).all()
+    items = rows[:per_page]
+    return KeysetPage(
+        items,
+        next_cursor=encode_cursor(items[-1]) if len(rows) > per_page else None,
+        prev_cursor=encode_cursor(items[0]) if after_key and items else None,
+    )
@@ -0,0 +1,111 @@
+"""
+Password hashing on a bounded worker pool.
+
+Werkzeug's scrypt and pbkdf2 hashes are CPU- and memory-heavy on purpose.
+Running them on a fixed pool of PASSWORD_HASH_WORKERS threads (hashlib
+releases the GIL, so threads use several cores) or processes caps how many
+run at once. At most PASSWORD_HASH_MAX_PENDING hashes may be running or
+queued; past that, callers wait up to PASSWORD_HASH_TIMEOUT seconds for a slot
+and then get HasherBusy, so a burst of logins is turned away quickly instead
+of starving every other route.
+
+The algorithm and cost come from PASSWORD_HASH_METHOD (any Werkzeug method
+string, e.g. 'scrypt:32768:8:1' or 'pbkdf2:sha256:600000'). Hashes made with
+other parameters still verify, and needs_rehash() tells the login view to
+upgrade them.
+"""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HasherBusy(Exception):
+    """Too many password hashes pending; the caller should answer 503."""
+
+
+class PasswordHasher:
+    """Bounded password hashing, configured with init_app like the cache."""
+
+    def __init__(self):
+        self.method = 'scrypt'
+        self.workers = 0
+        self.pool_kind = 'thread'
+        self.timeout = 2.0
+        self._prefix = None
+        self._dummy = None
+        self._slots = threading.BoundedSemaphore(1)
+        self._executor = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.in_flight = 0
+
+    def init_app(self, app):
+        self.method = app.config.get('PASSWORD_HASH_METHOD', 'scrypt')
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 1)
+        self.pool_kind = app.config.get('PASSWORD_HASH_POOL', 'thread')
+        self.timeout = app.config.get('PASSWORD_HASH_TIMEOUT', 2.0)
+        max_pending = app.config.get('PASSWORD_HASH_MAX_PENDING') or 4 * max(self.workers, 1)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        # Hash once to learn the exact parameter prefix Werkzeug writes,
+        # e.g. 'scrypt' -> 'scrypt:32768:8:1'; also used for unknown users.
+        self._dummy = generate_password_hash('', self.method)
+        self._prefix = self._dummy.split('$', 1)[0]
+        app.extensions['passwords'] = self
+
+    def _pool(self):
+        # Created on first use and again after a fork (pre-forking servers).
+        if self._executor is None or self._executor_pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._executor_pid != os.getpid():
+                    if self.pool_kind == 'process':
+                        self._executor = ProcessPoolExecutor(self.workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='pwhash')
+                    self._executor_pid = os.getpid()
+        return self._executor
+
+    def _run(self, func, *args):
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self.rejected += 1
+            raise HasherBusy()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            if self.workers <= 0:
+                return func(*args)
+            return self._pool().submit(func, *args).result()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def hash(self, password):
+        """Hash a password with the configured method.
+
+        Raises:
+            HasherBusy: No slot freed up within PASSWORD_HASH_TIMEOUT.
+        """
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        """Check a password against a stored hash (any supported method).
+
+        Args:
+            pwhash (str): Stored hash, or None for an unknown user; a dummy
+                hash is checked instead so the timing does not reveal it.
+            password (str): The candidate password.
+
+        Raises:
+            HasherBusy: No slot freed up within PASSWORD_HASH_TIMEOUT.
+        """
+        if pwhash is None:
+            self._run(check_password_hash, self._dummy, password)
+            return False
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """True if `pwhash` was made with another method or cost than configured."""
+        return pwhash.split('$', 1)[0] != self._prefix
@@ -1,13 +1,119 @@
-from flask import Blueprint, render_template, redirect, url_for, flash
+from flask import Blueprint, Response, render_template, stream_template, redirect, url_for, flash, request, current_app, session
 from flask_login import login_user, logout_user, current_user, login_required
-from app import db, login_manager
+from markupsafe import Markup
+from sqlalchemy import func
+from sqlalchemy.orm import noload
+from app import db, login_manager, cache, passwords, duplicates, sessions
 from app.models import User
-from app.forms import RegisterForm, LoginForm, SearchForm
-from app.models import Idea
+from app.forms import RegisterForm, LoginForm, SearchForm, TextSearchForm
+from app.models import Idea, Tag, idea_tag, parse_tags
 from app.forms import IdeaForm
+from app.search import search_ideas
+from app.pagination import paginate_ideas
+from app.passwords import HasherBusy
+from app.conditional import conditional
+from app.tagstats import tag_page
 bp = Blueprint('main', __name__)
 
 
+def filter_by_tags(query, user_id, names):
+    """Keep only ideas carrying every tag in `names`, using the idea_tag index.
+
+    Args:
+        query: Idea query to filter.
+        user_id (int): Owner of the tags.
+        names (list): Normalized tag names (see parse_tags).
+
+    Returns:
+        The filtered query.
+    """
+    if not names:
+        return query
+    tag_ids = db.select(Tag.id).where(Tag.user_id == user_id, Tag.name.in_(names))
+    return (
+        query.join(idea_tag, idea_tag.c.idea_id == Idea.id)
+        .filter(idea_tag.c.tag_id.in_(tag_ids))
+        .group_by(Idea.id)
+        .having(func.count(idea_tag.c.tag_id) == len(names))
+    )
+
+
+def get_per_page():
+    """Page size from the `per_page` query argument, bounded by the config."""
+    default = current_app.config['IDEAS_PER_PAGE']
+    per_page = request.args.get('per_page', default, type=int)
+    return max(1, min(per_page, current_app.config['IDEAS_MAX_PER_PAGE']))
+
+
+def paginate_user_ideas(tags=None):
+    """Current user's ideas, optionally filtered by tags, paginated from the query string."""
+    ideas = Idea.query.filter_by(user_id=current_user.id)
+    if tags:
+        ideas = filter_by_tags(ideas, current_user.id, parse_tags(tags))
+    return paginate_ideas(
+        ideas,
+        get_per_page(),
+        after=request.args.get('after'),
+        before=request.args.get('before'),
+    )
+
+
+def render_idea_list(tags=None):
+    """Render the current user's idea table, cached per user, filter and page.
+
+    The cache key carries the user's data version, bumped on every write, so
+    a cached list is reused until the user adds, edits or deletes an idea.
+    """
+    key = cache.user_key(
+        current_user.id, 'ideas', request.endpoint, tags or '', get_per_page(),
+        request.args.get('after', ''), request.args.get('before', ''),
+    )
+    html = cache.get(key)
+    if html is None:
+        page = paginate_user_ideas(tags)
+        html = render_template('_idea_list.html', ideas=page.items, page=page, tags=tags)
+        cache.set(key, html)
+    return Markup(html)
+
+
+def buffered(chunks, size=16384):
+    """Group the many small strings Jinja yields into ~`size` byte chunks."""
+    buffer, length = [], 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def stream_idea_list(tags=None, **context):
+    """Stream index.html with every idea of the current user (or of a tag filter).
+
+    Instead of a page, the whole table is rendered while the ideas are read
+    EXPORT_BATCH_SIZE rows at a time (`yield_per`), so the first bytes go out
+    at once and memory stays flat however many ideas there are.
+    """
+    user_id = current_user.id
+
+    def ideas():
+        # Runs while the response is sent, in the context kept by stream_template.
+        query = Idea.query.filter_by(user_id=user_id)
+        if tags:
+            query = filter_by_tags(query, user_id, parse_tags(tags))
+        query = query.options(noload(Idea.tag_list)).order_by(Idea.timestamp.desc(), Idea.id.desc())
+        yield from query.yield_per(current_app.config['EXPORT_BATCH_SIZE'])
+
+    chunks = stream_template('index.html', stream=True, ideas=ideas(), tags=tags, **context)
+    return Response(buffered(chunks), mimetype='text/html')
+
+
+def server_busy(template, form, title):
+    """503 page when password hashing is saturated (see app/passwords.py)."""
+    flash('The server is busy, please try again in a moment.')
+    return render_template(template, form=form, title=title), 503, {'Retry-After': '1'}
 
 
 @bp.route('/register', methods=['GET', 'POST'])
@@ -17,7 +123,10 @@ def register():
     form = RegisterForm()
     if form.validate_on_submit():
         user = User(username=form.username.data)
-        user.set_password(form.password.data)
+        try:
+            user.set_password(form.password.data)
+        except HasherBusy:
+            return server_busy('register.html', form, 'Register')
         db.session.add(user)
         db.session.commit()
         flash('Registered successfully!')
@@ -31,64 +140,103 @@ def login():
     form = LoginForm()
     if form.validate_on_submit():
         user = User.query.filter_by(username=form.username.data).first()
-        if user and user.check_password(form.password.data):
-            login_user(user)
-            return redirect(url_for('main.index'))
+        try:
+            if user is None:
+                passwords.verify(None, form.password.data)  # same cost as a wrong password
+            elif user.check_password(form.password.data):
+                if user.rehash_password(form.password.data):
+                    db.session.commit()
+                sessions.regenerate()  # new session id once logged in
+                login_user(user)
+                return redirect(url_for('main.index'))
+        except HasherBusy:
+            return server_busy('login.html', form, 'Login')
         flash('Invalid username or password')
     return render_template('login.html', form=form, title='Login')
 
 @bp.route('/logout')
 @login_required
 def logout():
+    session.clear()  # removes the server-side session for every worker
     logout_user()
     return redirect(url_for('main.login'))
 
 @bp.route('/', methods=['GET', 'POST'])
 @login_required
+@conditional()
 def index():
     form = SearchForm()
-    ideas = Idea.query.filter_by(user_id=current_user.id)
-    if form.validate_on_submit() and form.tags.data:
-        tags = [t.strip() for t in form.tags.data.split(',')]
-        for tag in tags:
-            ideas = ideas.filter(Idea.tags.like(f'%{tag}%'))
-    ideas = ideas.order_by(Idea.timestamp.desc()).all()
-    return render_template('index.html', ideas=ideas, form=form)
+    tags = request.args.get('tags', '')
+    if form.validate_on_submit():
+        tags = form.tags.data or ''
+    elif tags:
+        form.tags.data = tags
+    if request.args.get('stream', type=int):
+        return stream_idea_list(tags, form=form, search_form=TextSearchForm())
+    return render_template('index.html', idea_list=render_idea_list(tags), tags=tags,
+                           form=form, search_form=TextSearchForm())
+
+@bp.route('/tags', methods=['GET'])
+@login_required
+@conditional()
+def tags():
+    """Tag cloud, per-tag trends and co-occurrence, from the tag_stats tables."""
+    return render_template('tags.html', title='Tags', **tag_page(db.session, current_user.id))
+
+@bp.route('/search', methods=['GET'])
+@login_required
+def search():
+    form = TextSearchForm(request.args)
+    results = []
+    if form.q.data and form.validate():
+        results = search_ideas(current_user.id, form.q.data)
+    return render_template('search.html', form=form, results=results, title='Search')
 
 """
         [route for create,update and remove ideas] 
 """
 @bp.route('/ideas', methods=['GET'])
 @login_required
+@conditional()
 def ideas():
-    ideas = Idea.query.filter_by(user_id=current_user.id).order_by(Idea.timestamp.desc()).all()
-    return render_template('index.html', ideas=ideas)  # Reuse index as dashboard
+    if request.args.get('stream', type=int):
+        return stream_idea_list()
+    return render_template('index.html', idea_list=render_idea_list())  # Reuse index as dashboard
 
 @bp.route('/idea/new', methods=['GET', 'POST'])
 @login_required
 def new_idea():
     form = IdeaForm()
     if form.validate_on_submit():
-        idea = Idea(title=form.title.data, description=form.description.data, tags=form.tags.data, author=current_user)
+        user_id = current_user.id  # the commit expires current_user; no reload just for its id
+        similar = duplicates.find(db.session, user_id, form.title.data, form.description.data, limit=3)
+        idea = Idea(title=form.title.data, description=form.description.data, author=current_user)
+        idea.set_tags(form.tags.data)
         db.session.add(idea)
         db.session.commit()
+        cache.bump_user_version(user_id)
         flash('Idea added!')
+        if similar:
+            titles = ', '.join(f'"{title}"' for _, title, _ in similar)
+            flash(f'This looks like an idea you already have: {titles}', 'warning')
         return redirect(url_for('main.index'))
     return render_template('idea_form.html', form=form)
 
 @bp.route('/idea/<int:id>/edit', methods=['GET', 'POST'])
 @login_required
+@conditional('private, no-cache, max-age=0')
 def edit_idea(id):
     idea = Idea.query.get_or_404(id)
-    if idea.author != current_user:
+    if idea.user_id != current_user.id:
         flash('Not authorized')
         return redirect(url_for('main.index'))
     form = IdeaForm(obj=idea)
     if form.validate_on_submit():
         idea.title = form.title.data
         idea.description = form.description.data
-        idea.tags = form.tags.data
+        idea.set_tags(form.tags.data)
         db.session.commit()
+        cache.bump_user_version(current_user.id)
         flash('Idea updated!')
         return redirect(url_for('main.index'))
     return render_template('idea_form.html', form=form, idea=idea)
@@ -97,11 +245,12 @@ def edit_idea(id):
 @login_required
 def delete_idea(id):
     idea = Idea.query.get_or_404(id)
-    if idea.author != current_user:
+    if idea.user_id != current_user.id:
         flash('Not authorized')
         return redirect(url_for('main.index'))
     db.session.delete(idea)
     db.session.commit()
+    cache.bump_user_version(current_user.id)
     flash('Idea deleted!')
     return redirect(url_for('main.index'))
 
@@ -0,0 +1,109 @@
+"""
+Full-text search over idea titles and descriptions.
+
+On SQLite the `idea_fts` FTS5 table (created and kept in sync by triggers in
+migration 8c41e5a9d2b7) gives ranked matches with highlighted snippets. Other
+engines, or a database created without the migration, fall back to LIKE
+filters with the highlighting done in Python.
+"""
+import re
+from markupsafe import Markup, escape
+from sqlalchemy import inspect, or_, text
+from app import db
+from app.models import Idea
+
+FTS_TABLE = 'idea_fts'
+# Control characters used as highlight markers inside FTS output, so the text
+# can be HTML-escaped before the markers become <mark> tags.
+_OPEN, _CLOSE = '\x02', '\x03'
+_fts_available = {}
+
+
+def include_name(name, type_, parent_names):
+    """Hide the FTS5 table and its shadow tables from Alembic autogenerate."""
+    return not (type_ == 'table' and name.startswith(FTS_TABLE))
+
+
+def fts_available():
+    """Check once per engine whether the FTS5 table can be used."""
+    engine = db.engine
+    if engine.url not in _fts_available:
+        _fts_available[engine.url] = (
+            engine.dialect.name == 'sqlite' and inspect(engine).has_table(FTS_TABLE)
+        )
+    return _fts_available[engine.url]
+
+
+def parse_terms(query):
+    """Split a user query into plain search terms (FTS operators are ignored)."""
+    return [t for t in re.findall(r'\w+', query or '') if t][:10]
+
+
+def _highlight(value):
+    """Escape FTS output and turn the markers into <mark> tags."""
+    return Markup(str(escape(value or '')).replace(_OPEN, '<mark>').replace(_CLOSE, '</mark>'))
+
+
+def _highlight_terms(value, terms, width=None):
+    """Fallback highlighting: mark terms in `value`, optionally cropped around the first hit."""
+    value = value or ''
+    pattern = re.compile('|'.join(re.escape(t) for t in terms), re.IGNORECASE)
+    if width and len(value) > width:
+        match = pattern.search(value)
+        start = max(0, (match.start() if match else 0) - width // 3)
+        value = ('…' if start else '') + value[start:start + width] + ('…' if start + width < len(value) else '')
+    return _highlight(pattern.sub(lambda m: f'{_OPEN}{m.group(0)}{_CLOSE}', value))
+
+
+def search_ideas(user_id, query, limit=50):
+    """Search a user's ideas by title and description.
+
+    Args:
+        user_id (int): Owner of the ideas.
+        query (str): Free text; every word must match (as a prefix).
+        limit (int, optional): Maximum number of results. Defaults to 50.
+
+    Returns:
+        list: (idea, highlighted title, highlighted snippet) tuples, best match first.
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return []
+    if fts_available():
+        return _search_fts(user_id, terms, limit)
+    return _search_like(user_id, terms, limit)
+
+
+def _search_fts(user_id, terms, limit):
+    match = ' '.join('"{}"*'.format(t.replace('"', '""')) for t in terms)
+    rows = db.session.execute(
+        text(
+            f"SELECT {FTS_TABLE}.rowid AS id, "
+            f"highlight({FTS_TABLE}, 0, :open, :close) AS title, "
+            f"snippet({FTS_TABLE}, 1, :open, :close, '…', 16) AS snippet "
+            f"FROM {FTS_TABLE} JOIN idea ON idea.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH :match AND idea.user_id = :user_id "
+            f"ORDER BY bm25({FTS_TABLE}, 10.0, 1.0) LIMIT :limit"
+        ),
+        {'open': _OPEN, 'close': _CLOSE, 'match': match, 'user_id': user_id, 'limit': limit},
+    ).all()
+    ideas = {idea.id: idea for idea in Idea.query.filter(Idea.id.in_([r.id for r in rows]))}
+    return [
+        (ideas[r.id], _highlight(r.title), _highlight(r.snippet))
+        for r in rows if r.id in ideas
+    ]
+
+
+def _search_like(user_id, terms, limit):
+    ideas = Idea.query.filter_by(user_id=user_id)
+    for term in terms:
+        pattern = '%{}%'.format(term.replace('_', '\\_'))
+        ideas = ideas.filter(or_(
+            Idea.title.ilike(pattern, escape='\\'),
+            Idea.description.ilike(pattern, escape='\\'),
+        ))
+    ideas = ideas.order_by(Idea.timestamp.desc()).limit(limit).all()
+    return [
+        (idea, _highlight_terms(idea.title, terms), _highlight_terms(idea.description, terms, width=120))
+        for idea in ideas
+    ]
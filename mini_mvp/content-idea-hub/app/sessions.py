@@ -0,0 +1,330 @@
+"""
+Server-side sessions: the cookie carries a random id, the data stays on the server.
+
+Flask's default session is the whole (signed) dict in a cookie, re-signed
+and re-sent whenever it changes, and it cannot be revoked: a copied cookie
+stays valid until it expires. With a server-side store the cookie is a
+fixed 43-character id, sent once when the session starts. Logging out
+deletes the session in the store, so every worker sees it gone at once, and
+`flask sessions revoke USERNAME` ends all the sessions of a user.
+
+Backends (SESSION_BACKEND):
+    cookie  -- Flask's signed cookie sessions (no server-side store)
+    memory  -- per-process LRU (default; one worker)
+    sqlite  -- a shared SQLite file, usable by several workers on one host
+
+Sessions live PERMANENT_SESSION_LIFETIME after their last write. A session
+that is only read is written again once half of that lifetime has passed,
+so idle users stay logged in without a store write on every request.
+Anonymous sessions (no logged-in user, typically just a CSRF token) only
+live SESSION_ANONYMOUS_LIFETIME, and the memory backend keeps them in their
+own LRU, so a crawler or a burst of login-page visits cannot evict the
+sessions of logged-in users.
+Expired sessions are purged in small batches every SESSION_SWEEP_EVERY
+writes and by `flask sessions sweep`.
+"""
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+import click
+from flask import session
+from flask.cli import AppGroup
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+
+
+class ServerSession(SecureCookieSession):
+    """Session dict tracked like Flask's, plus the id it is stored under."""
+
+    def __init__(self, initial=None, sid=None, expires_at=None):
+        super().__init__(initial)
+        self.sid = sid
+        self.expires_at = expires_at
+        self.new = sid is None
+        self.previous_sid = None
+
+    def regenerate(self):
+        """Move the data to a fresh id (on login, against session fixation)."""
+        if self.sid is not None and self.previous_sid is None:
+            self.previous_sid = self.sid
+        self.sid = None
+        self.new = True
+        self.modified = True
+
+
+class MemorySessionStore:
+    """Thread-safe in-process LRUs of sessions, one for users and one for anonymous sessions."""
+
+    def __init__(self, max_entries=10000, max_anonymous=10000):
+        self.max_entries = max_entries
+        self.max_anonymous = max_anonymous
+        self._data = OrderedDict()  # sid -> (expires_at, user_id, data)
+        self._anonymous = OrderedDict()  # sid -> (expires_at, None, data)
+        self._lock = threading.Lock()
+
+    def load(self, sid):
+        with self._lock:
+            entries = self._data if sid in self._data else self._anonymous
+            entry = entries.get(sid)
+            if entry is None or entry[0] < time.time():
+                return None
+            entries.move_to_end(sid)
+            return entry[2], entry[0]
+
+    def save(self, sid, data, expires_at, user_id=None):
+        entries, other, limit = (
+            (self._data, self._anonymous, self.max_entries) if user_id is not None
+            else (self._anonymous, self._data, self.max_anonymous)
+        )
+        with self._lock:
+            other.pop(sid, None)
+            entries[sid] = (expires_at, user_id, data)
+            entries.move_to_end(sid)
+            while len(entries) > limit:
+                entries.popitem(last=False)
+
+    def delete(self, sid):
+        with self._lock:
+            self._data.pop(sid, None)
+            self._anonymous.pop(sid, None)
+
+    def revoke_user(self, user_id):
+        with self._lock:
+            sids = [sid for sid, entry in self._data.items() if entry[1] == user_id]
+            for sid in sids:
+                del self._data[sid]
+        return len(sids)
+
+    def sweep(self, batch=500):
+        removed, now = 0, time.time()
+        while True:
+            with self._lock:  # a batch at a time, so requests are not held up
+                expired = [
+                    (entries, sid)
+                    for entries in (self._anonymous, self._data)
+                    for sid, entry in entries.items() if entry[0] < now
+                ][:batch]
+                for entries, sid in expired:
+                    del entries[sid]
+            removed += len(expired)
+            if len(expired) < batch:
+                return removed
+
+
+class SQLiteSessionStore:
+    """Sessions stored in a SQLite file shared by all workers on the host."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS session '
+            '(sid TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL, user_id TEXT)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS ix_session_expires_at ON session (expires_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS ix_session_user_id ON session (user_id)')
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def load(self, sid):
+        row = self._connect().execute(
+            'SELECT data, expires_at FROM session WHERE sid = ? AND expires_at >= ?', (sid, time.time())
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def save(self, sid, data, expires_at, user_id=None):
+        self._connect().execute(
+            'INSERT OR REPLACE INTO session (sid, data, expires_at, user_id) VALUES (?, ?, ?, ?)',
+            (sid, data, expires_at, user_id),
+        )
+
+    def delete(self, sid):
+        self._connect().execute('DELETE FROM session WHERE sid = ?', (sid,))
+
+    def revoke_user(self, user_id):
+        return self._connect().execute('DELETE FROM session WHERE user_id = ?', (user_id,)).rowcount
+
+    def sweep(self, batch=500):
+        # Short DELETEs of `batch` rows each keep the write lock brief for other workers.
+        conn, removed, now = self._connect(), 0, time.time()
+        while True:
+            count = conn.execute(
+                'DELETE FROM session WHERE rowid IN '
+                '(SELECT rowid FROM session WHERE expires_at < ? LIMIT ?)', (now, batch)
+            ).rowcount
+            removed += count
+            if count < batch:
+                return removed
+
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface keeping the session data in a store."""
+
+    serializer = TaggedJSONSerializer()  # same types as cookie sessions (Markup, datetime...)
+
+    def __init__(self, store, sweep_every=1000, sweep_batch=500, anonymous_lifetime=3600):
+        self.store = store
+        self.anonymous_lifetime = anonymous_lifetime
+        self.sweep_every = sweep_every
+        self.sweep_batch = sweep_batch
+        self.swept = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            found = self.store.load(sid)
+            if found is not None:
+                data, expires_at = found
+                return ServerSession(self.serializer.loads(data), sid=sid, expires_at=expires_at)
+        return ServerSession()
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        cookie = {
+            'domain': self.get_cookie_domain(app),
+            'path': self.get_cookie_path(app),
+            'secure': self.get_cookie_secure(app),
+            'partitioned': self.get_cookie_partitioned(app),
+            'samesite': self.get_cookie_samesite(app),
+            'httponly': self.get_cookie_httponly(app),
+        }
+        if session.accessed:
+            response.vary.add('Cookie')
+        if session.previous_sid:
+            self.store.delete(session.previous_sid)
+
+        if not session:
+            if session.modified and (session.sid or session.previous_sid):
+                if session.sid:
+                    self.store.delete(session.sid)
+                response.delete_cookie(name, **cookie)
+                response.vary.add('Cookie')
+            return
+
+        now = time.time()
+        user_id = session.get('_user_id')
+        lifetime = app.permanent_session_lifetime.total_seconds()
+        if user_id is None:
+            lifetime = min(lifetime, self.anonymous_lifetime)
+        stale = session.expires_at is None or session.expires_at - now < lifetime / 2
+        if not (session.modified or stale):
+            return
+        if session.sid is None:
+            session.sid = secrets.token_urlsafe(32)
+        self.store.save(session.sid, self.serializer.dumps(dict(session)), now + lifetime, user_id)
+        self._count_write()
+        # The id only changes when a session starts or is regenerated; a
+        # permanent session also re-sends its cookie to push back the expiry.
+        if session.new or (session.permanent and stale):
+            response.set_cookie(name, session.sid, expires=self.get_expiration_time(app, session), **cookie)
+            response.vary.add('Cookie')
+
+    def _count_write(self):
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.sweep_every == 0
+        if due:
+            swept = self.store.sweep(self.sweep_batch)
+            with self._lock:
+                self.swept += swept
+
+
+class ServerSessions:
+    """Installs the configured session backend; configured with init_app like the cache.
+
+    Config:
+        SESSION_BACKEND: 'cookie', 'memory' or 'sqlite'.
+        SESSION_MAX_ENTRIES: size of the memory LRU of logged-in sessions.
+        SESSION_MAX_ANONYMOUS: size of the memory LRU of anonymous sessions.
+        SESSION_ANONYMOUS_LIFETIME: seconds an anonymous session is kept.
+        SESSION_PATH: file of the sqlite backend.
+        SESSION_SWEEP_EVERY: session writes between purges of expired sessions.
+        SESSION_SWEEP_BATCH: sessions deleted per statement while purging.
+    """
+
+    def __init__(self):
+        self.interface = None
+
+    def init_app(self, app):
+        kind = app.config.get('SESSION_BACKEND', 'memory')
+        if kind == 'cookie':
+            store = None
+        elif kind == 'memory':
+            store = MemorySessionStore(
+                app.config.get('SESSION_MAX_ENTRIES', 10000),
+                app.config.get('SESSION_MAX_ANONYMOUS', 10000),
+            )
+        elif kind == 'sqlite':
+            path = app.config.get('SESSION_PATH') or os.path.join(app.instance_path, 'sessions.db')
+            store = SQLiteSessionStore(path)
+        else:
+            raise ValueError(f'Unknown SESSION_BACKEND: {kind}')
+        if store is None:
+            self.interface = None
+        else:
+            self.interface = ServerSessionInterface(
+                store,
+                sweep_every=app.config.get('SESSION_SWEEP_EVERY', 1000),
+                sweep_batch=app.config.get('SESSION_SWEEP_BATCH', 500),
+                anonymous_lifetime=app.config.get('SESSION_ANONYMOUS_LIFETIME', 3600),
+            )
+            app.session_interface = self.interface
+        app.extensions['server_sessions'] = self
+        app.cli.add_command(sessions_cli)
+
+    def regenerate(self):
+        """Give the current session a new id; no-op with cookie sessions."""
+        if isinstance(session._get_current_object(), ServerSession):
+            session.regenerate()
+
+    def revoke_user(self, user_id):
+        """End every stored session of a user. Returns the number removed."""
+        if self.interface is None:
+            return 0
+        return self.interface.store.revoke_user(str(user_id))
+
+    def sweep(self):
+        """Purge expired sessions now. Returns the number removed."""
+        if self.interface is None:
+            return 0
+        return self.interface.store.sweep(self.interface.sweep_batch)
+
+
+sessions_cli = AppGroup('sessions', help='Server-side sessions.')
+
+
+@sessions_cli.command('sweep')
+def sweep_command():
+    """Delete expired sessions."""
+    from app import sessions
+
+    click.echo(f'Removed {sessions.sweep()} expired session(s).')
+
+
+@sessions_cli.command('revoke')
+@click.argument('username')
+def revoke_command(username):
+    """Log USERNAME out everywhere."""
+    from app import sessions
+    from app.models import User  # Import local pour éviter circular
+
+    user = User.query.filter_by(username=username).first()
+    if user is None:
+        raise click.ClickException(f'Unknown user: {username}')
+    click.echo(f'Revoked {sessions.revoke_user(user.id)} session(s) of {username}.')
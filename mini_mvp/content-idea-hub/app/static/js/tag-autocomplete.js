@@ -0,0 +1,29 @@
+// Suggest completions for the last tag of comma-separated tag fields
+// (the API URL is on the datalist, see _tag_autocomplete.html).
+(function () {
+    var list = document.getElementById('tag-suggestions');
+    document.querySelectorAll('input[list="tag-suggestions"]').forEach(function (input) {
+        var timer = null;
+        input.addEventListener('input', function () {
+            clearTimeout(timer);
+            timer = setTimeout(function () {
+                var value = input.value;
+                var cut = value.lastIndexOf(',') + 1;
+                var head = value.slice(0, cut);
+                var prefix = value.slice(cut).trim();
+                if (!prefix) { list.innerHTML = ''; return; }
+                fetch(list.dataset.url + '?limit=8&prefix=' + encodeURIComponent(prefix))
+                    .then(function (response) { return response.json(); })
+                    .then(function (data) {
+                        list.innerHTML = '';
+                        data.tags.forEach(function (tag) {
+                            var option = document.createElement('option');
+                            option.value = head + (head ? ' ' : '') + tag.name;
+                            option.label = tag.name + ' (' + tag.count + ')';
+                            list.appendChild(option);
+                        });
+                    });
+            }, 150);
+        });
+    });
+})();
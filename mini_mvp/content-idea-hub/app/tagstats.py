@@ -0,0 +1,263 @@
+"""
+Materialized tag statistics behind the tag cloud page.
+
+Three tables are kept up to date:
+
+- tag_stats: ideas per tag and the last time the tag was used.
+- tag_activity: how many times a tag was put on an idea, per day.
+- tag_pair: how many ideas carry both tags of a pair.
+
+They are fed by the tag changes that idea writes already record for the
+autocomplete index (see record_tag_change in app/autocomplete.py). Just
+before a session commits, the pending changes are folded into a handful of
+upserts run in the same transaction. The tag page therefore reads rows per
+tag and never parses Idea.tags.
+
+`flask tags rebuild-stats` recomputes the tables from idea_tag, for backfills
+or repairs.
+"""
+import math
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from itertools import combinations
+import click
+from flask.cli import AppGroup
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import Session, aliased
+
+SPARK_BLOCKS = '▁▂▃▄▅▆▇█'
+
+
+def _models():
+    from app import models  # Import local pour éviter circular
+    return models
+
+
+def _upsert(session, table, rows, keys, added, replaced=()):
+    """INSERT ... ON CONFLICT DO UPDATE adding `added` columns and refreshing `replaced` ones."""
+    if session.get_bind().dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = dialect_insert(table)
+    update = {name: table.c[name] + stmt.excluded[name] for name in added}
+    update.update({name: func.coalesce(stmt.excluded[name], table.c[name]) for name in replaced})
+    session.execute(stmt.on_conflict_do_update(index_elements=keys, set_=update), rows)
+
+
+def _tag_ids(session, user_id, names):
+    Tag = _models().Tag
+    # Tags the write already loaded or created (Idea.set_tags) need no query.
+    ids = {
+        obj.name: obj.id for obj in session.identity_map.values()
+        if isinstance(obj, Tag) and obj.user_id == user_id and obj.name in names and obj.id is not None
+    }
+    names = [name for name in names if name not in ids]
+    for start in range(0, len(names), 500):
+        ids.update(session.execute(
+            select(Tag.name, Tag.id).where(Tag.user_id == user_id, Tag.name.in_(names[start:start + 500]))
+        ).all())
+    return ids
+
+
+def apply_changes(session, changes):
+    """Fold tag changes into the statistics tables, inside the session's transaction.
+
+    Args:
+        session: The session about to commit (already flushed).
+        changes (list): (user_id, old raw tags, new raw tags) per idea written.
+    """
+    models = _models()
+    now = datetime.utcnow()
+    counts, added, pairs = Counter(), Counter(), Counter()
+    for user_id, old_tags, new_tags in changes:
+        old, new = set(models.parse_tags(old_tags)), set(models.parse_tags(new_tags))
+        for name in new - old:
+            counts[user_id, name] += 1
+            added[user_id, name] += 1
+        for name in old - new:
+            counts[user_id, name] -= 1
+        old_pairs, new_pairs = set(combinations(sorted(old), 2)), set(combinations(sorted(new), 2))
+        for pair in new_pairs - old_pairs:
+            pairs[(user_id,) + pair] += 1
+        for pair in old_pairs - new_pairs:
+            pairs[(user_id,) + pair] -= 1
+
+    names = defaultdict(set)
+    for user_id, name in counts:
+        names[user_id].add(name)
+    for user_id, name_a, name_b in pairs:  # a kept tag may gain or lose pairs
+        names[user_id].update((name_a, name_b))
+    ids = {user_id: _tag_ids(session, user_id, user_names) for user_id, user_names in names.items()}
+
+    stats_rows, activity_rows, pair_rows = [], [], []
+    for (user_id, name), delta in counts.items():
+        tag_id = ids[user_id].get(name)
+        if tag_id is None or not delta:
+            continue
+        stats_rows.append({'tag_id': tag_id, 'user_id': user_id, 'idea_count': delta,
+                           'last_used_at': now if added[user_id, name] else None})
+        if added[user_id, name]:
+            activity_rows.append({'tag_id': tag_id, 'day': now.date(), 'user_id': user_id,
+                                  'count': added[user_id, name]})
+    for (user_id, name_a, name_b), delta in pairs.items():
+        id_a, id_b = ids[user_id].get(name_a), ids[user_id].get(name_b)
+        if id_a is None or id_b is None or not delta:
+            continue
+        id_a, id_b = sorted((id_a, id_b))
+        pair_rows.append({'tag_a_id': id_a, 'tag_b_id': id_b, 'user_id': user_id, 'count': delta})
+
+    users = list(names)
+    if stats_rows:
+        table = models.TagStat.__table__
+        _upsert(session, table, stats_rows, ['tag_id'], ['idea_count'], ['last_used_at'])
+        if any(row['idea_count'] < 0 for row in stats_rows):  # only a decrement can reach 0
+            session.execute(delete(table).where(table.c.user_id.in_(users), table.c.idea_count <= 0))
+    if activity_rows:
+        _upsert(session, models.TagActivity.__table__, activity_rows, ['tag_id', 'day'], ['count'])
+    if pair_rows:
+        table = models.TagPair.__table__
+        _upsert(session, table, pair_rows, ['tag_a_id', 'tag_b_id'], ['count'])
+        if any(row['count'] < 0 for row in pair_rows):
+            session.execute(delete(table).where(table.c.user_id.in_(users), table.c.count <= 0))
+
+
+def rebuild(session, user_id=None):
+    """Recompute the statistics from idea_tag, for one user or everyone (no commit).
+
+    Past edits are not stored anywhere, so tag_activity is rebuilt from the
+    creation day of the ideas currently carrying each tag.
+    """
+    models = _models()
+    Tag, Idea, idea_tag = models.Tag, models.Idea, models.idea_tag
+    tables = (models.TagStat.__table__, models.TagActivity.__table__, models.TagPair.__table__)
+    for table in tables:
+        stmt = delete(table)
+        if user_id is not None:
+            stmt = stmt.where(table.c.user_id == user_id)
+        session.execute(stmt)
+
+    def for_user(query, column):
+        return query if user_id is None else query.where(column == user_id)
+
+    tagged = select().select_from(Tag).join(idea_tag, idea_tag.c.tag_id == Tag.id).join(
+        Idea, Idea.id == idea_tag.c.idea_id)
+    day = func.date(Idea.timestamp)
+    a, b = aliased(idea_tag), aliased(idea_tag)
+    session.execute(insert(tables[0]).from_select(
+        ['tag_id', 'user_id', 'idea_count', 'last_used_at'],
+        for_user(tagged.add_columns(Tag.id, Tag.user_id, func.count(), func.max(Idea.timestamp)), Tag.user_id)
+        .group_by(Tag.id, Tag.user_id),
+    ))
+    session.execute(insert(tables[1]).from_select(
+        ['tag_id', 'day', 'user_id', 'count'],
+        for_user(tagged.add_columns(Tag.id, day, Tag.user_id, func.count()), Tag.user_id)
+        .where(Idea.timestamp.isnot(None))
+        .group_by(Tag.id, day, Tag.user_id),
+    ))
+    session.execute(insert(tables[2]).from_select(
+        ['tag_a_id', 'tag_b_id', 'user_id', 'count'],
+        for_user(
+            select(a.c.tag_id, b.c.tag_id, Idea.user_id, func.count())
+            .join(b, (b.c.idea_id == a.c.idea_id) & (a.c.tag_id < b.c.tag_id))
+            .join(Idea, Idea.id == a.c.idea_id),
+            Idea.user_id,
+        ).group_by(a.c.tag_id, b.c.tag_id, Idea.user_id),
+    ))
+
+
+def sparkline(values):
+    """Render counts as a string of block characters, e.g. '▁▁▃█▂'."""
+    top = max(values, default=0)
+    if not top:
+        return SPARK_BLOCKS[0] * len(values)
+    return ''.join(SPARK_BLOCKS[round(v / top * (len(SPARK_BLOCKS) - 1))] for v in values)
+
+
+def tag_page(session, user_id, days=30, pairs=20):
+    """Everything the tag page shows, read from the statistics tables.
+
+    Returns:
+        dict: tags (name, count, last use, cloud weight, daily sparkline) by
+        name, and the `pairs` most frequent co-occurring tag pairs.
+    """
+    models = _models()
+    Tag, TagStat, TagActivity, TagPair = models.Tag, models.TagStat, models.TagActivity, models.TagPair
+    stats = session.execute(
+        select(TagStat.tag_id, Tag.name, TagStat.idea_count, TagStat.last_used_at)
+        .join(Tag, Tag.id == TagStat.tag_id)
+        .where(TagStat.user_id == user_id)
+        .order_by(Tag.name)
+    ).all()
+
+    first_day = datetime.utcnow().date() - timedelta(days=days - 1)
+    activity = defaultdict(lambda: [0] * days)
+    for tag_id, day, count in session.execute(
+        select(TagActivity.tag_id, TagActivity.day, TagActivity.count)
+        .where(TagActivity.user_id == user_id, TagActivity.day >= first_day)
+    ):
+        activity[tag_id][(day - first_day).days] = count
+
+    most = max((row.idea_count for row in stats), default=1)
+    tags = [{
+        'name': row.name,
+        'count': row.idea_count,
+        'last_used_at': row.last_used_at,
+        # 1 à 3 em, échelle logarithmique
+        'weight': 1 + 2 * math.log(row.idea_count) / math.log(most) if most > 1 else 1,
+        'trend': sparkline(activity[row.tag_id]),
+        'recent': sum(activity[row.tag_id]),
+    } for row in stats]
+
+    tag_a, tag_b = aliased(Tag), aliased(Tag)
+    top_pairs = session.execute(
+        select(tag_a.name, tag_b.name, TagPair.count)
+        .join(tag_a, tag_a.id == TagPair.tag_a_id)
+        .join(tag_b, tag_b.id == TagPair.tag_b_id)
+        .where(TagPair.user_id == user_id)
+        .order_by(TagPair.count.desc())
+        .limit(pairs)
+    ).all()
+    return {'tags': tags, 'pairs': top_pairs, 'days': days}
+
+
+class TagStats:
+    """Keeps the statistics in step with every commit; configured with init_app."""
+
+    def init_app(self, app):
+        if not event.contains(Session, 'before_commit', self._before_commit):
+            event.listen(Session, 'before_commit', self._before_commit)
+            event.listen(Session, 'after_commit', self._reset)
+            event.listen(Session, 'after_rollback', self._reset)
+        app.cli.add_command(tags_cli)
+
+    def _before_commit(self, session):
+        session.flush()  # ORM writes record their tag changes while flushing
+        changes = session.info.get('tag_changes', ())
+        done = session.info.get('tag_stats_done', 0)
+        if len(changes) > done:
+            session.info['tag_stats_done'] = len(changes)
+            apply_changes(session, changes[done:])
+
+    def _reset(self, session):
+        session.info.pop('tag_stats_done', None)
+
+
+tags_cli = AppGroup('tags', help='Tag statistics.')
+
+
+@tags_cli.command('rebuild-stats')
+@click.argument('username', required=False)
+def rebuild_stats_command(username):
+    """Recompute tag statistics for USERNAME, or for every user."""
+    from app import db
+
+    user_id = None
+    if username:
+        user = _models().User.query.filter_by(username=username).first()
+        if user is None:
+            raise click.ClickException(f'Unknown user: {username}')
+        user_id = user.id
+    rebuild(db.session, user_id)
+    db.session.commit()
+    click.echo(f"Tag statistics rebuilt for {username or 'all users'}.")
@@ -0,0 +1,218 @@
+"""
+Streaming export and import of ideas (CSV and JSON Lines).
+
+Exports read the user's ideas with `yield_per` (a server-side cursor where
+the driver supports it) and produce the file chunk by chunk. Imports parse
+the upload line by line, validate each idea with IdeaForm's rules and insert
+them in batches, committing every batch and reporting progress after it, so
+neither side ever holds a whole backlog in memory.
+
+Both are available over HTTP (see app/api.py) and as `flask ideas export`
+and `flask ideas import` for moving large workspaces without a request
+timeout.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timezone
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import select
+from app import db, cache
+from app.bulk import insert_ideas
+from app.forms import IDEA_FIELDS, clean_idea
+from app.models import Idea, User
+from app.routes import filter_by_tags
+
+FORMATS = ('csv', 'jsonl')
+EXPORT_FIELDS = ('id', 'title', 'description', 'tags', 'timestamp')
+MAX_REPORTED_ERRORS = 100  # Erreurs détaillées dans le rapport, les autres sont seulement comptées
+
+
+def format_from_name(filename, default='csv'):
+    """Guess the format from a file name (.csv, .jsonl/.ndjson)."""
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if name.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def export_ideas(user_id, fmt='csv', tags=None):
+    """Yield a user's ideas, oldest first, as chunks of CSV or JSON Lines text.
+
+    Args:
+        user_id (int): Owner of the ideas.
+        fmt (str, optional): 'csv' or 'jsonl'. Defaults to 'csv'.
+        tags (list, optional): Normalized tag names to filter on.
+
+    Yields:
+        str: One chunk per fetched batch of rows.
+    """
+    stmt = select(Idea.id, Idea.title, Idea.description, Idea.tags, Idea.timestamp).where(
+        Idea.user_id == user_id
+    )
+    stmt = filter_by_tags(stmt, user_id, tags).order_by(Idea.id)
+    batch_size = current_app.config['EXPORT_BATCH_SIZE']
+    result = db.session.execute(stmt.execution_options(yield_per=batch_size))
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if fmt == 'csv':
+        writer.writerow(EXPORT_FIELDS)
+    for rows in result.partitions():
+        for idea_id, title, description, tags_text, timestamp in rows:
+            timestamp = timestamp.isoformat() if timestamp else None
+            if fmt == 'csv':
+                writer.writerow((idea_id, title, description, tags_text, timestamp))
+            else:
+                buffer.write(json.dumps({
+                    'id': idea_id, 'title': title, 'description': description,
+                    'tags': tags_text, 'timestamp': timestamp,
+                }, ensure_ascii=False))
+                buffer.write('\n')
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def read_records(stream, fmt):
+    """Parse an upload incrementally.
+
+    Args:
+        stream: Binary file-like object (UTF-8, an optional BOM is skipped).
+        fmt (str): 'csv' (with a header row) or 'jsonl'.
+
+    Yields:
+        tuple: (line number, record). A JSON line that cannot be parsed gives
+        a None record, which the import reports as invalid.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='' if fmt == 'csv' else None)
+    if fmt == 'csv':
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_no, line in enumerate(text, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError:
+            yield line_no, None
+
+
+def parse_timestamp(value):
+    """ISO 8601 timestamp as a naive UTC datetime (how Idea.timestamp is stored)."""
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+def prepare_record(record):
+    """Keep the importable columns of a record and validate them.
+
+    Exported files can be imported back: their id column is ignored (ideas get
+    new ids) and their timestamp is kept. Other unknown columns are ignored.
+
+    Returns:
+        tuple: (row for insert_ideas, errors dict).
+    """
+    if not isinstance(record, dict):
+        return None, {'_': ['Invalid record.']}
+    row, errors = clean_idea({key: record[key] for key in IDEA_FIELDS if key in record})
+    if errors:
+        return None, errors
+    if record.get('timestamp'):
+        try:
+            row['timestamp'] = parse_timestamp(str(record['timestamp']))
+        except ValueError:
+            return None, {'timestamp': ['Invalid ISO 8601 date.']}
+    return row, {}
+
+
+def import_ideas(user_id, records, batch_size=None):
+    """Insert parsed records for a user in batched transactions.
+
+    Invalid records are skipped and reported; every valid batch is committed
+    on its own, so an interrupted import keeps the batches already done.
+
+    Args:
+        user_id (int): Author of the imported ideas.
+        records (iterable): (line number, record) pairs from read_records.
+        batch_size (int, optional): Ideas per transaction. Defaults to IMPORT_BATCH_SIZE.
+
+    Yields:
+        dict: Progress after each batch (processed, imported, failed, errors);
+        the last one has done=True.
+    """
+    batch_size = batch_size or current_app.config['IMPORT_BATCH_SIZE']
+    progress = {'processed': 0, 'imported': 0, 'failed': 0, 'errors': []}
+    batch = []
+
+    def flush():
+        insert_ideas(user_id, batch)
+        db.session.commit()
+        cache.bump_user_version(user_id)
+        progress['imported'] += len(batch)
+        batch.clear()
+
+    for line_no, record in records:
+        progress['processed'] += 1
+        row, errors = prepare_record(record)
+        if errors:
+            progress['failed'] += 1
+            if len(progress['errors']) < MAX_REPORTED_ERRORS:
+                progress['errors'].append({'line': line_no, 'errors': errors})
+            continue
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush()
+            yield dict(progress, errors=list(progress['errors']), done=False)
+    if batch:
+        flush()
+    yield dict(progress, done=True)
+
+
+ideas_cli = AppGroup('ideas', help='Import and export ideas.')
+
+
+def get_user_or_fail(username):
+    user = User.query.filter_by(username=username).first()
+    if user is None:
+        raise click.ClickException(f'Unknown user: {username}')
+    return user
+
+
+@ideas_cli.command('export')
+@click.argument('username')
+@click.argument('output', type=click.File('w', encoding='utf-8'), default='-')
+@click.option('--format', 'fmt', type=click.Choice(FORMATS), default=None,
+              help='Defaults to the output file extension, else csv.')
+def export_command(username, output, fmt):
+    """Write USERNAME's ideas to OUTPUT (stdout by default)."""
+    user = get_user_or_fail(username)
+    for chunk in export_ideas(user.id, fmt or format_from_name(output.name)):
+        output.write(chunk)
+
+
+@ideas_cli.command('import')
+@click.argument('username')
+@click.argument('source', type=click.File('rb'))
+@click.option('--format', 'fmt', type=click.Choice(FORMATS), default=None,
+              help='Defaults to the input file extension, else csv.')
+@click.option('--batch-size', type=int, default=None, help='Ideas per transaction.')
+def import_command(username, source, fmt, batch_size):
+    """Import ideas for USERNAME from SOURCE (CSV with a header row, or JSON Lines)."""
+    user = get_user_or_fail(username)
+    records = read_records(source, fmt or format_from_name(source.name))
+    for progress in import_ideas(user.id, records, batch_size):
+        click.echo(f"{progress['processed']} processed, {progress['imported']} imported, "
+                   f"{progress['failed']} failed", err=True)
+    for failure in progress['errors']:
+        click.echo(f"line {failure['line']}: {failure['errors']}", err=True)
@@ -0,0 +1,333 @@
+"""Benchmark the idea hub and report throughput and latency percentiles as JSON.
+
+Seeds a fresh SQLite database (migrated like production), then drives the
+main views through the Flask test client and through a local threaded HTTP
+server with several client threads. Save the JSON of two commits to compare
+them.
+
+Usage:
+    python bench.py --users 20 --ideas-per-user 500 --requests 200 --threads 8 -o bench.json
+    python bench.py --mode client --scenarios index,index_tags
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from itertools import count
+from urllib.parse import urlencode
+
+import sqlalchemy
+from flask_migrate import upgrade
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from config import BASE_DIR, Config
+from app import create_app, db, passwords
+from app.bulk import insert_ideas
+from app.models import Idea, User
+
+PASSWORD = 'bench-password'
+SCENARIOS = ('register', 'login', 'index', 'index_tags', 'new_idea', 'edit_idea', 'delete_idea')
+
+
+def make_config(db_path, args):
+    class BenchConfig(Config):
+        SECRET_KEY = 'bench'
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        WTF_CSRF_ENABLED = False
+        CACHE_BACKEND = args.cache
+        CACHE_PATH = os.path.join(os.path.dirname(db_path), 'cache.db')
+        SESSION_BACKEND = args.sessions
+        SESSION_PATH = os.path.join(os.path.dirname(db_path), 'sessions.db')
+        DEBUG_METRICS = False
+        SLOW_QUERY_MS = 10 ** 6  # pas de logs pendant la mesure
+        SLOW_REQUEST_MS = 10 ** 6
+        PASSWORD_HASH_METHOD = args.hash_method or Config.PASSWORD_HASH_METHOD
+        PASSWORD_HASH_WORKERS = Config.PASSWORD_HASH_WORKERS if args.hash_workers is None else args.hash_workers
+        PASSWORD_HASH_POOL = args.hash_pool or Config.PASSWORD_HASH_POOL
+    return BenchConfig
+
+
+def seed(app, users, ideas_per_user, tag_pool, rng):
+    """Create `users` users with `ideas_per_user` tagged ideas each.
+
+    Returns:
+        list: (username, [idea ids]) per user.
+    """
+    tags = [f'tag{i}' for i in range(tag_pool)]
+    accounts = []
+    with app.app_context():
+        password_hash = passwords.hash(PASSWORD)  # hashed once, shared by every user
+        for u in range(users):
+            user = User(username=f'bench{u:04d}', password_hash=password_hash)
+            db.session.add(user)
+            db.session.flush()
+            rows = [
+                {'title': f'Idea {u}-{i}', 'description': f'Benchmark idea {i} of user {u}. ' * 4,
+                 'tags': ','.join(rng.sample(tags, rng.randint(1, min(3, tag_pool))))}
+                for i in range(ideas_per_user)
+            ]
+            accounts.append((user.username, insert_ideas(user.id, rows)))
+        db.session.commit()
+        assert Idea.query.count() == users * ideas_per_user
+    return accounts
+
+
+class ClientSession:
+    """Requests through the Flask test client (no network, no server)."""
+
+    def __init__(self, app):
+        self.app = app
+        self.client = app.test_client()
+
+    def reset(self):
+        self.client = self.app.test_client()
+
+    def request(self, method, path, data=None):
+        response = self.client.open(path, method=method, data=data)
+        response.close()
+        return response.status_code
+
+
+class HttpSession:
+    """Keep-alive HTTP connection with a minimal cookie jar."""
+
+    def __init__(self, host, port):
+        self.conn = http.client.HTTPConnection(host, port, timeout=30)
+        self.cookies = {}
+
+    def reset(self):
+        self.cookies.clear()
+
+    def request(self, method, path, data=None):
+        headers = {}
+        body = None
+        if data is not None:
+            body = urlencode(data)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f'{k}={v}' for k, v in self.cookies.items())
+        self.conn.request(method, path, body=body, headers=headers)
+        response = self.conn.getresponse()
+        response.read()
+        for header in response.headers.get_all('Set-Cookie') or ():
+            name, _, value = header.split(';', 1)[0].partition('=')
+            self.cookies[name.strip()] = value
+        return response.status
+
+
+class Worker:
+    """One simulated user: a session, an account and the ideas it may edit or delete."""
+
+    usernames = count()
+
+    def __init__(self, session, username, idea_ids, tag_pool, rng):
+        self.session = session
+        self.username = username
+        self.idea_ids = list(idea_ids)
+        self.tag_pool = tag_pool
+        self.rng = rng
+
+    def login(self):
+        return self.session.request('POST', '/login', {'username': self.username, 'password': PASSWORD})
+
+    def idea_form(self):
+        return {'title': f'Bench idea {self.rng.random():.6f}', 'description': 'Created by bench.py',
+                'tags': f'tag{self.rng.randrange(self.tag_pool)},bench'}
+
+    def run(self, scenario):
+        """Run one request of `scenario`; returns True if the status was the expected one."""
+        if scenario == 'register':
+            self.session.reset()
+            name = f'new{os.getpid()}_{next(self.usernames)}'
+            return self.session.request('POST', '/register', {'username': name, 'password': PASSWORD}) == 302
+        if scenario == 'login':
+            self.session.reset()
+            return self.login() == 302
+        if scenario == 'index':
+            return self.session.request('GET', '/') == 200
+        if scenario == 'index_tags':
+            return self.session.request('GET', f'/?tags=tag{self.rng.randrange(self.tag_pool)}') == 200
+        if scenario == 'new_idea':
+            return self.session.request('POST', '/idea/new', self.idea_form()) == 302
+        if scenario == 'edit_idea':
+            idea_id = self.rng.choice(self.idea_ids)
+            return self.session.request('POST', f'/idea/{idea_id}/edit', self.idea_form()) == 302
+        if scenario == 'delete_idea':
+            if not self.idea_ids:
+                return None  # pool exhausted
+            idea_id = self.idea_ids.pop()
+            return self.session.request('POST', f'/idea/{idea_id}/delete') == 302
+        raise ValueError(f'Unknown scenario: {scenario}')
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies, errors, wall):
+    latencies = sorted(latencies)
+    ms = [round(v * 1000, 3) for v in latencies]
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'wall_s': round(wall, 4),
+        'throughput_rps': round(len(latencies) / wall, 1) if wall else None,
+        # e.g. logins/s per core, to compare hashing costs across machines
+        'throughput_per_core_rps': round(len(latencies) / wall / (os.cpu_count() or 1), 2) if wall else None,
+        'mean_ms': round(sum(ms) / len(ms), 3) if ms else None,
+        'p50_ms': percentile(ms, 50),
+        'p90_ms': percentile(ms, 90),
+        'p95_ms': percentile(ms, 95),
+        'p99_ms': percentile(ms, 99),
+        'max_ms': ms[-1] if ms else None,
+    }
+
+
+def run_scenario(workers, scenario, requests, warmup):
+    """Split `requests` over the workers, one thread each, and time every request."""
+    latencies, errors = [], 0
+    lock = threading.Lock()
+
+    def drive(worker, n):
+        nonlocal errors
+        local, failed = [], 0
+        if scenario not in ('register', 'login'):
+            worker.login()
+        for i in range(warmup + n):
+            start = time.perf_counter()
+            ok = worker.run(scenario)
+            elapsed = time.perf_counter() - start
+            if ok is None:
+                break
+            if i >= warmup:
+                local.append(elapsed)
+                failed += not ok
+        with lock:
+            latencies.extend(local)
+            errors += failed
+
+    share = [requests // len(workers) + (i < requests % len(workers)) for i in range(len(workers))]
+    threads = [threading.Thread(target=drive, args=(w, n)) for w, n in zip(workers, share)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+class KeepAliveHandler(WSGIRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--ideas-per-user', type=int, default=500)
+    parser.add_argument('--tags', type=int, default=30, help='Size of the tag pool.')
+    parser.add_argument('--requests', type=int, default=200, help='Measured requests per scenario and mode.')
+    parser.add_argument('--warmup', type=int, default=5, help='Unmeasured requests per worker first.')
+    parser.add_argument('--threads', type=int, default=8, help='HTTP client threads.')
+    parser.add_argument('--mode', choices=('client', 'http', 'both'), default='both')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--cache', choices=('memory', 'sqlite', 'null'), default='memory')
+    parser.add_argument('--sessions', choices=('memory', 'sqlite', 'cookie'), default='memory')
+    parser.add_argument('--hash-method', help='PASSWORD_HASH_METHOD, e.g. scrypt:16384:8:1.')
+    parser.add_argument('--hash-workers', type=int, help='PASSWORD_HASH_WORKERS (0 = inline).')
+    parser.add_argument('--hash-pool', choices=('thread', 'process'), help='PASSWORD_HASH_POOL.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('-o', '--output', help='Write the JSON report here instead of stdout.')
+    args = parser.parse_args(argv)
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(sorted(unknown))}')
+    modes = ('client', 'http') if args.mode == 'both' else (args.mode,)
+    rng = random.Random(args.seed)
+    users = max(args.users, args.threads + 1)
+
+    workdir = tempfile.mkdtemp(prefix='idea-hub-bench-')
+    try:
+        report = benchmark(args, scenarios, modes, users, rng, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+def benchmark(args, scenarios, modes, users, rng, workdir):
+    """Seed a database in `workdir`, run every scenario in every mode and build the report."""
+    app = create_app(make_config(os.path.join(workdir, 'bench.db'), args))
+    with app.app_context():
+        upgrade(directory=os.path.join(BASE_DIR, 'migrations'))
+    started = time.perf_counter()
+    accounts = seed(app, users, args.ideas_per_user, args.tags, rng)
+    seed_time = time.perf_counter() - started
+    # Chaque mode et chaque worker a son propre compte, donc ses propres idées
+    pools = iter(accounts)
+
+    results = {}
+    for mode in modes:
+        server = None
+        if mode == 'client':
+            workers = [Worker(ClientSession(app), *next(pools), args.tags, random.Random(rng.random()))]
+        else:
+            server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=KeepAliveHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            workers = [
+                Worker(HttpSession('127.0.0.1', server.server_port), *next(pools), args.tags,
+                       random.Random(rng.random()))
+                for _ in range(args.threads)
+            ]
+        try:
+            results[mode] = {s: run_scenario(workers, s, args.requests, args.warmup) for s in scenarios}
+        finally:
+            if server is not None:
+                server.shutdown()
+
+    return {
+        'meta': {
+            'revision': git_revision(),
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlalchemy': sqlalchemy.__version__,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'params': {**vars(args), 'users': users},
+            'seed_s': round(seed_time, 3),
+        },
+        'results': results,
+    }
+
+
+if __name__ == '__main__':
+    sys.exit(main())
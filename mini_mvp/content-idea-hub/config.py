@@ -1,12 +1,193 @@
-"""Configuration pour l'application Flask, y compris la configuration de la base de données."""
+"""Configuration pour l'application Flask, y compris la configuration de la base de données.
+
+Settings are read from the environment so every worker process of a
+deployment sees the same values. A profile is chosen with APP_ENV
+(development, production or testing, see get_config); extra settings can be
+loaded from the Python file named by APP_SETTINGS and from FLASK_* variables
+(see create_app).
+"""
 import os
 import secrets
+import tempfile
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+INSTANCE_DIR = os.path.join(BASE_DIR, 'instance')
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+
+def env_bool(name, default=False):
+    value = os.environ.get(name)
+    if value in (None, ''):
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def load_secret_key():
+    """
+    Clé secrète partagée par tous les workers.
+
+    Order: SECRET_KEY, then the file named by SECRET_KEY_FILE, then
+    instance/secret_key, which is generated once and reused afterwards. The
+    key is written to a temporary file and published with os.link, which
+    fails if the file exists: concurrent workers never see a partly written
+    file and all agree on the first key published.
+    """
+    if os.environ.get('SECRET_KEY'):
+        return os.environ['SECRET_KEY']
+    path = os.environ.get('SECRET_KEY_FILE') or os.path.join(INSTANCE_DIR, 'secret_key')
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    if not os.path.exists(path):
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.secret_key.')  # mode 0600
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(secrets.token_hex(32))
+            os.link(tmp, path)
+        except FileExistsError:
+            pass  # Un autre worker a publié sa clé avant nous
+        finally:
+            os.unlink(tmp)
+    with open(path) as f:
+        key = f.read().strip()
+    if not key:
+        raise RuntimeError(f'Secret key file {path} is empty')
+    return key
+
+
+def database_uri(default='sqlite:///site.db'):
+    """DATABASE_URL from the environment; postgres:// URIs are normalized for SQLAlchemy."""
+    uri = os.environ.get('DATABASE_URL') or default
+    if uri.startswith('postgres://'):
+        uri = 'postgresql://' + uri[len('postgres://'):]
+    return uri
+
+
+def engine_options(uri):
+    """SQLALCHEMY_ENGINE_OPTIONS for the pool; SQLite file databases keep the defaults."""
+    if uri.startswith('sqlite'):
+        return {}
+    return {
+        'pool_size': env_int('DB_POOL_SIZE', 5),
+        'max_overflow': env_int('DB_MAX_OVERFLOW', 10),
+        'pool_timeout': env_int('DB_POOL_TIMEOUT', 30),
+        'pool_recycle': env_int('DB_POOL_RECYCLE', 1800),
+        'pool_pre_ping': True,
+    }
 
 
 class Config:
     """
     Configuration pour l'application Flask.
     """
-    SECRET_KEY = os.environ.get('SECRET_KEY') or secrets.token_hex(16)
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///site.db'  # DB locale SQLite
+    SECRET_KEY = load_secret_key()
+    SQLALCHEMY_DATABASE_URI = database_uri()  # DB locale SQLite par défaut
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Base en lecture seule pour les requêtes GET (app/engine.py), par exemple
+    # un réplica PostgreSQL ou sqlite:///file:/chemin/site.db?mode=ro&uri=true
+    SQLALCHEMY_BINDS = {'replica': os.environ['READ_DATABASE_URL']} if os.environ.get('READ_DATABASE_URL') else {}
+    DB_READ_BIND = 'replica'
+    DB_STICKY_SECONDS = env_int('DB_STICKY_SECONDS', 5)  # Lectures sur le primaire après une écriture
+    # PRAGMAs appliqués à chaque connexion SQLite (voir app/engine.py)
+    SQLITE_PRAGMAS = {
+        'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+        'busy_timeout': env_int('SQLITE_BUSY_TIMEOUT', 5000),  # ms
+        'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+    }
+    IDEAS_PER_PAGE = env_int('IDEAS_PER_PAGE', 50)  # Taille de page des listes
+    IDEAS_MAX_PER_PAGE = 200
+    # ETag/Last-Modified des pages (app/conditional.py) renouvelés au moins
+    # toutes les 30 min, avant l'expiration du jeton CSRF (1 h)
+    CONDITIONAL_GET_WINDOW = 1800
+    API_MAX_BATCH = env_int('API_MAX_BATCH', 10000)  # Idées par requête d'écriture de l'API
+    IMPORT_BATCH_SIZE = env_int('IMPORT_BATCH_SIZE', 1000)  # Idées par transaction d'import
+    EXPORT_BATCH_SIZE = 1000  # Lignes lues par aller-retour (yield_per), exports et ?stream=1
+    # Cache des listes d'idées: 'memory' (un seul worker), 'sqlite' (plusieurs workers) ou 'null'
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'memory')
+    CACHE_DEFAULT_TTL = env_int('CACHE_DEFAULT_TTL', 300)
+    CACHE_MAX_ENTRIES = 1024
+    CACHE_PATH = os.environ.get('CACHE_PATH')  # par défaut instance/cache.db
+    # Sessions côté serveur (app/sessions.py): 'memory' (un seul worker),
+    # 'sqlite' (plusieurs workers) ou 'cookie' (sessions signées de Flask)
+    SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'memory')
+    SESSION_PATH = os.environ.get('SESSION_PATH')  # par défaut instance/sessions.db
+    SESSION_MAX_ENTRIES = 10000  # Sessions connectées gardées en mémoire
+    SESSION_MAX_ANONYMOUS = 10000  # Sessions anonymes (jeton CSRF seul), LRU à part
+    # Durée des sessions anonymes, en secondes; celle du jeton CSRF suffit
+    SESSION_ANONYMOUS_LIFETIME = env_int('SESSION_ANONYMOUS_LIFETIME', 3600)
+    SESSION_SWEEP_EVERY = 1000  # Écritures entre deux purges des sessions expirées
+    SESSION_SWEEP_BATCH = 500
+    # Cache des utilisateurs pour login_manager.user_loader (0 = désactivé);
+    # invalidé dans tous les workers seulement avec CACHE_BACKEND='sqlite'
+    USER_CACHE_TTL = env_int('USER_CACHE_TTL', 60)
+    USER_CACHE_MAX_ENTRIES = 10000
+    # Index des tags pour l'autocomplétion (app/autocomplete.py)
+    TAG_INDEX_TTL = env_int('TAG_INDEX_TTL', 300)
+    TAG_INDEX_MAX_USERS = 1000
+    # Détection des quasi-doublons (app/dedup.py): similarité de Jaccard estimée
+    DEDUP_THRESHOLD = float(os.environ.get('DEDUP_THRESHOLD', 0.6))
+    DEDUP_MAX_CANDIDATES = 200  # Idées comparées au plus par recherche
+    # Fichiers statiques empreintés (app/assets.py) et compression gzip des pages
+    ASSETS_MAX_AGE = 365 * 24 * 3600  # secondes; le nom change avec le contenu
+    # Refuser de démarrer si `flask assets vendor` n'a pas été lancé (sinon Bootstrap vient du CDN)
+    ASSETS_REQUIRE_VENDORED = env_bool('ASSETS_REQUIRE_VENDORED', False)
+    COMPRESS_MIMETYPES = ('text/html',)  # sauf pages avec jeton CSRF ou paramètres (BREACH)
+    COMPRESS_MIN_SIZE = env_int('COMPRESS_MIN_SIZE', 1024)  # octets
+    COMPRESS_LEVEL = env_int('COMPRESS_LEVEL', 6)
+    # Instrumentation (app/metrics.py): seuils des logs lents, en ms
+    SLOW_QUERY_MS = env_int('SLOW_QUERY_MS', 200)
+    SLOW_REQUEST_MS = env_int('SLOW_REQUEST_MS', 1000)
+    DEBUG_METRICS = env_bool('DEBUG_METRICS', False)  # expose /debug/metrics
+    # Hachage des mots de passe (app/passwords.py); changer la méthode
+    # re-hache les anciens mots de passe à la connexion suivante
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    PASSWORD_HASH_POOL = os.environ.get('PASSWORD_HASH_POOL', 'thread')  # ou 'process'
+    PASSWORD_HASH_WORKERS = env_int('PASSWORD_HASH_WORKERS', os.cpu_count() or 1)
+    PASSWORD_HASH_MAX_PENDING = env_int('PASSWORD_HASH_MAX_PENDING', 0)  # 0 = 4 x workers
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 2))  # secondes
+
+
+class DevelopmentConfig(Config):
+    DEBUG = True
+    DEBUG_METRICS = env_bool('DEBUG_METRICS', True)
+
+
+class ProductionConfig(Config):
+    DEBUG = False
+    SESSION_COOKIE_SECURE = env_bool('SESSION_COOKIE_SECURE', True)
+    SESSION_COOKIE_HTTPONLY = True
+    REMEMBER_COOKIE_SECURE = SESSION_COOKIE_SECURE
+    # Avec plusieurs workers le cache et les sessions en mémoire ne sont pas partagés
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'sqlite')
+    SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'sqlite')
+
+
+class TestingConfig(Config):
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL', 'sqlite://')
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    CACHE_BACKEND = 'null'
+    USER_CACHE_TTL = 0
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'  # rapide pour les tests
+    PASSWORD_HASH_WORKERS = 0
+
+
+config_by_name = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+}
+
+
+def get_config(name=None):
+    """Configuration class for a profile name, or for APP_ENV (default: development)."""
+    name = name or os.environ.get('APP_ENV', 'development')
+    try:
+        return config_by_name[name]
+    except KeyError:
+        raise ValueError(f'Unknown APP_ENV profile: {name}') from None
@@ -0,0 +1,44 @@
+"""Pytest fixtures: an app on a fresh, fully migrated SQLite file per test."""
+import pytest
+from flask_migrate import upgrade
+from config import TestingConfig
+from app import create_app, db
+
+
+@pytest.fixture
+def app(tmp_path):
+    class Config(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path}/test.db'
+        SECRET_KEY = 'test'
+
+    app = create_app(Config)
+    with app.app_context():
+        upgrade()
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def register(client, username='alice', password='secret1'):
+    client.post('/register', data={'username': username, 'password': password})
+
+
+def login(client, username='alice', password='secret1'):
+    return client.post('/login', data={'username': username, 'password': password})
+
+
+def add_idea(client, title, tags='', description=''):
+    return client.post('/idea/new', data={'title': title, 'description': description, 'tags': tags})
+
+
+@pytest.fixture
+def user(client):
+    """Registered and logged in as alice; returns the User."""
+    from app.models import User
+    register(client)
+    login(client)
+    return User.query.filter_by(username='alice').one()
@@ -0,0 +1,57 @@
+"""Added idea_fts full-text index
+
+Revision ID: 8c41e5a9d2b7
+Revises: 62be2d7717d0
+Create Date: 2026-10-19 12:05:41.512094
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8c41e5a9d2b7'
+down_revision = '62be2d7717d0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # FTS5 is SQLite only; other engines use the LIKE fallback in app/search.py.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute(
+        "CREATE VIRTUAL TABLE idea_fts USING fts5("
+        "title, description, content='idea', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        "CREATE TRIGGER idea_fts_ai AFTER INSERT ON idea BEGIN "
+        "INSERT INTO idea_fts(rowid, title, description) "
+        "VALUES (new.id, new.title, new.description); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER idea_fts_ad AFTER DELETE ON idea BEGIN "
+        "INSERT INTO idea_fts(idea_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER idea_fts_au AFTER UPDATE OF title, description ON idea BEGIN "
+        "INSERT INTO idea_fts(idea_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        "INSERT INTO idea_fts(rowid, title, description) "
+        "VALUES (new.id, new.title, new.description); "
+        "END"
+    )
+    # Index the ideas that already exist.
+    op.execute("INSERT INTO idea_fts(idea_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute("DROP TRIGGER IF EXISTS idea_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS idea_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS idea_fts_ai")
+    op.execute("DROP TABLE IF EXISTS idea_fts")
@@ -1,8 +1,8 @@
-"""Run the application."""
+"""Run the application (profile chosen with APP_ENV, see config.get_config)."""
 from app import create_app
 
 app = create_app()
 
 if __name__ == '__main__':
 
-    app.run(debug=True)
+    app.run(debug=app.config.get('DEBUG', False))
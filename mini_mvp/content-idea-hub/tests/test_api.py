@@ -0,0 +1,83 @@
+from app.models import Idea, Tag
+from conftest import login, register
+
+API = '/api/v1/ideas'
+
+
+def create(client, *items):
+    return client.post(API, json=list(items))
+
+
+def test_requires_login_with_a_json_401(client):
+    response = client.get(API)
+    assert response.status_code == 401
+    assert response.get_json() == {'error': 'Authentication required'}
+
+
+def test_create_batch_links_tags(client, user):
+    response = create(client, {'title': 'One', 'tags': ['Video', 'tech']}, {'title': 'Two', 'tags': 'tech'})
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['created'] == 2 and len(body['ids']) == 2
+    assert sorted(t.name for t in Tag.query.filter_by(user_id=user.id)) == ['tech', 'video']
+    assert Idea.query.get(body['ids'][0]).tags == 'Video,tech'
+
+
+def test_invalid_batch_writes_nothing(client, user):
+    response = create(client, {'title': 'Fine'}, {'title': ''}, {'title': 'x', 'color': 'red'})
+    assert response.status_code == 400
+    assert set(response.get_json()['errors']) == {'1', '2'}
+    assert Idea.query.count() == 0
+
+
+def test_batch_size_is_limited(app, client, user):
+    app.config['API_MAX_BATCH'] = 2
+    assert create(client, {'title': 'a'}, {'title': 'b'}, {'title': 'c'}).status_code == 413
+    assert client.post(API, json={'ideas': []}).status_code == 400
+
+
+def test_list_pages_and_selects_fields(client, user):
+    create(client, *({'title': f'idea {i}', 'description': 'text'} for i in range(5)))
+    first = client.get(f'{API}?per_page=3&fields=title').get_json()
+    assert [set(item) for item in first['items']] == [{'title'}] * 3
+    second = client.get(f"{API}?per_page=3&fields=title&after={first['next_cursor']}").get_json()
+    assert len(second['items']) == 2 and second['next_cursor'] is None
+    titles = {item['title'] for item in first['items'] + second['items']}
+    assert titles == {f'idea {i}' for i in range(5)}
+    assert client.get(f'{API}?fields=password').status_code == 400
+
+
+def test_other_users_ideas_are_not_found(client, user):
+    idea_id = create(client, {'title': 'Private'}).get_json()['ids'][0]
+    client.get('/logout')
+    register(client, 'bobby')
+    login(client, 'bobby')
+    assert client.get(f'{API}/{idea_id}').status_code == 404
+    response = client.patch(API, json=[{'id': idea_id, 'title': 'Mine now'}])
+    assert response.status_code == 404 and response.get_json()['missing'] == [idea_id]
+    assert client.delete(API, json=[idea_id]).status_code == 404
+    assert Idea.query.get(idea_id).title == 'Private'
+
+
+def test_patch_updates_fields_and_tags(client, user):
+    idea_id = create(client, {'title': 'Draft', 'tags': 'tech'}).get_json()['ids'][0]
+    response = client.patch(API, json=[{'id': idea_id, 'title': 'Final', 'tags': ['audio']}])
+    assert response.get_json() == {'updated': 1}
+    idea = client.get(f'{API}/{idea_id}').get_json()
+    assert idea['title'] == 'Final' and idea['tags'] == ['audio']
+    assert 'Final' not in client.get(f'{API}?tags=tech').get_data(as_text=True)
+
+
+def test_delete_removes_ideas(client, user):
+    ids = create(client, {'title': 'a', 'tags': 'x'}, {'title': 'b'}).get_json()['ids']
+    assert client.delete(API, json={'ids': ids}).get_json() == {'deleted': 2}
+    assert Idea.query.count() == 0
+    assert client.delete(API, json=['1']).status_code == 400
+
+
+def test_create_flags_near_duplicates(client, user):
+    text = 'a long description of a video about cooking pasta at home with friends'
+    first = create(client, {'title': 'Pasta video', 'description': text}).get_json()['ids'][0]
+    body = create(client, {'title': 'Pasta video', 'description': text + '!'}, {'title': 'Something else'}).get_json()
+    assert [match['id'] for match in body['duplicates']['0']] == [first]
+    assert '1' not in body['duplicates']
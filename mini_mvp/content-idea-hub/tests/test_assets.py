@@ -0,0 +1,116 @@
+import gzip
+import logging
+import os
+import pytest
+from flask import Flask, render_template_string, request
+from flask_wtf.csrf import generate_csrf
+from app.assets import VENDOR, Assets, build, minify_css, minify_js
+
+BOOTSTRAP_CSS = 'vendor/bootstrap/css/bootstrap.min.css'
+
+
+def make_app(static_folder, **config):
+    app = Flask(__name__, static_folder=str(static_folder), static_url_path='/static')
+    app.config.update(SECRET_KEY='test', COMPRESS_MIN_SIZE=100, **config)
+    assets = Assets()
+    assets.init_app(app)
+
+    @app.route('/page', methods=['GET', 'POST'])
+    def page():
+        return '<p>' + 'hello ' * 100 + request.values.get('q', '') + '</p>'
+
+    @app.route('/form')
+    def form():
+        return render_template_string('<input value="{{ csrf_token() }}">' + 'hello ' * 100,
+                                      csrf_token=generate_csrf)
+
+    return app, assets
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def test_minify_css_keeps_descendant_pseudo_class_selectors():
+    css = b'/* comment */\na :hover ,\nb > c {\n  color : red ;\n  margin: 0;\n}\n/*! licence */'
+    assert minify_css(css) == b'a :hover,b>c{color:red;margin:0}/*! licence */'
+    assert minify_css(b'@media (max-width: 600px) {\n .x :focus { top : 0 }\n}') \
+        == b'@media (max-width: 600px){.x :focus{top:0}}'
+
+
+def test_minify_js_keeps_line_breaks():
+    assert minify_js(b'// header\nfunction f() {\n    return 1\n}\n\n') == b'function f() {\nreturn 1\n}'
+
+
+def test_missing_vendored_files_come_from_the_cdn(tmp_path):
+    app, assets = make_app(tmp_path)
+    with app.test_request_context():
+        assert assets.url(BOOTSTRAP_CSS) == VENDOR[BOOTSTRAP_CSS][0]
+        assert f'integrity="{VENDOR[BOOTSTRAP_CSS][1]}"' in assets.sri(BOOTSTRAP_CSS)
+
+    write(tmp_path / BOOTSTRAP_CSS, b'.btn{}')
+    app, assets = make_app(tmp_path)
+    with app.test_request_context():
+        assert assets.url(BOOTSTRAP_CSS) == '/static/' + BOOTSTRAP_CSS
+        assert assets.sri(BOOTSTRAP_CSS) == ''
+
+
+def test_missing_vendored_files_are_an_error_outside_development(tmp_path, caplog, monkeypatch):
+    # Alembic's fileConfig in migrations/env.py disables the loggers that exist already.
+    monkeypatch.setattr(logging.getLogger('app.assets'), 'disabled', False)
+    with caplog.at_level(logging.WARNING, 'app.assets'):
+        make_app(tmp_path)
+    errors = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+    assert len(errors) == 1 and BOOTSTRAP_CSS in errors[0]
+    with pytest.raises(RuntimeError, match='flask assets vendor'):
+        make_app(tmp_path, ASSETS_REQUIRE_VENDORED=True)
+
+
+def test_built_assets_are_hashed_and_precompressed(tmp_path):
+    write(tmp_path / 'css' / 'site.css', b'a :hover {\n  color : red;\n}\n')
+    manifest = build(str(tmp_path))
+    assert manifest['css/site.css'].startswith('css/site.') and manifest['css/site.css'] != 'css/site.css'
+
+    app, assets = make_app(tmp_path)
+    client = app.test_client()
+    with app.test_request_context():
+        url = assets.url('css/site.css')
+    assert url == '/assets/' + manifest['css/site.css']
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert response.content_encoding == 'gzip'
+    assert gzip.decompress(response.get_data()) == b'a :hover{color:red}'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert client.get(url).get_data() == b'a :hover{color:red}'
+    assert client.get('/assets/manifest.json').status_code == 404
+
+
+def test_html_is_gzipped_on_the_fly(tmp_path):
+    app, assets = make_app(tmp_path)
+    client = app.test_client()
+    response = client.get('/page', headers={'Accept-Encoding': 'gzip'})
+    assert response.content_encoding == 'gzip'
+    assert gzip.decompress(response.get_data()).startswith(b'<p>hello')
+    assert client.get('/page').content_encoding is None
+    assert assets.compressed == 1 and assets.bytes_saved > 0
+
+
+def test_pages_open_to_breach_are_not_compressed(tmp_path):
+    app, assets = make_app(tmp_path)
+    client = app.test_client()
+    gzip_ok = {'Accept-Encoding': 'gzip'}
+    with_token = client.get('/form', headers=gzip_ok)
+    assert with_token.content_encoding is None and 'Accept-Encoding' in with_token.vary
+    assert client.get('/page?q=guess', headers=gzip_ok).content_encoding is None
+    assert client.post('/page', data={'q': 'guess'}, headers=gzip_ok).content_encoding is None
+    assert client.get('/page', headers=gzip_ok).content_encoding == 'gzip'
+    assert assets.compressed == 1
+
+
+def test_pages_link_the_stylesheet(app, client):
+    html = client.get('/login').get_data(as_text=True)
+    if os.path.exists(os.path.join(app.static_folder, BOOTSTRAP_CSS)):
+        assert '/static/' + BOOTSTRAP_CSS in html
+    else:
+        assert f'href="{VENDOR[BOOTSTRAP_CSS][0]}" integrity="{VENDOR[BOOTSTRAP_CSS][1]}"' in html
@@ -0,0 +1,66 @@
+import pytest
+from app import db, tag_index
+from app.autocomplete import TagVocabulary
+from app.models import Idea
+from conftest import add_idea
+
+
+@pytest.fixture
+def index(app):
+    tag_index._vocabularies.clear()  # the index outlives each test's app
+    yield tag_index
+    tag_index._vocabularies.clear()
+
+
+def suggest(client, prefix, limit=10):
+    response = client.get(f'/api/v1/tags?prefix={prefix}&limit={limit}')
+    assert response.status_code == 200
+    return [(tag['name'], tag['count']) for tag in response.get_json()['tags']]
+
+
+def test_prefix_matching_ranks_by_count_then_name():
+    vocabulary = TagVocabulary({'video': 3, 'vlog': 3, 'viral': 5, 'tech': 9, 'gone': 0})
+    assert vocabulary.suggest('v', 10) == [('viral', 5), ('video', 3), ('vlog', 3)]
+    assert vocabulary.suggest('vi', 1) == [('viral', 5)]
+    assert vocabulary.suggest('x', 10) == [] and vocabulary.suggest('go', 10) == []
+    assert vocabulary.suggest('', 2) == [('tech', 9), ('viral', 5)]
+
+
+def test_api_suggests_the_users_tags(client, user, index):
+    add_idea(client, 'One', 'video, tech')
+    add_idea(client, 'Two', 'video, vlog')
+    add_idea(client, 'Three', 'VIDEO')
+    assert suggest(client, 'v') == [('video', 3), ('vlog', 1)]
+    assert suggest(client, ' VI ') == [('video', 3)]
+    assert suggest(client, 'v', limit=1) == [('video', 3)]
+
+
+def test_writes_update_a_built_index_after_commit(client, user, index):
+    add_idea(client, 'One', 'video, tech')
+    assert suggest(client, '') == [('tech', 1), ('video', 1)]
+    vocabulary = index._vocabularies[user.id]
+
+    add_idea(client, 'Two', 'tech, talk')
+    idea = Idea.query.filter_by(title='One').one()
+    client.post(f'/idea/{idea.id}/edit', data={'title': 'One', 'description': '', 'tags': 'tech'})
+    assert index._vocabularies[user.id] is vocabulary  # updated in place, not rebuilt
+    assert suggest(client, 't') == [('tech', 2), ('talk', 1)]
+    assert suggest(client, 'v') == []
+
+    two = Idea.query.filter_by(title='Two').one()
+    client.post(f'/idea/{two.id}/delete')
+    assert suggest(client, '') == [('tech', 1)]
+    assert index._vocabularies[user.id] is vocabulary
+
+
+def test_rollback_leaves_the_index_unchanged(client, user, index):
+    add_idea(client, 'One', 'video')
+    before = suggest(client, '')
+    idea = Idea.query.filter_by(title='One').one()
+    idea.tags = 'other'
+    db.session.add(Idea(title='Two', tags='video, extra', user_id=user.id))
+    db.session.flush()
+    db.session.rollback()
+    assert suggest(client, '') == before == [('video', 1)]
+    add_idea(client, 'Three', 'tech')  # the next commit must not replay the rolled back changes
+    assert suggest(client, '') == [('tech', 1), ('video', 1)]
@@ -0,0 +1,63 @@
+from flask import Flask
+from app import cache
+from app.cache import Cache, MemoryBackend
+from conftest import add_idea
+
+
+def make_cache(tmp_path, **config):
+    app = Flask(__name__, instance_path=str(tmp_path))
+    app.config.update(config)
+    return Cache(app)
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(max_entries=2)
+    backend.set('a', 1)
+    backend.set('b', 2)
+    backend.get('a')
+    backend.set('c', 3)
+    assert (backend.get('a'), backend.get('b'), backend.get('c')) == (1, None, 3)
+
+
+def test_memory_backend_expires_entries():
+    backend = MemoryBackend()
+    backend.set('a', 1, ttl=-1)
+    assert backend.get('a') is None
+
+
+def test_bump_changes_the_user_keys(tmp_path):
+    store = make_cache(tmp_path, CACHE_BACKEND='memory')
+    key = store.user_key(1, 'ideas')
+    assert store.user_key(1, 'ideas') == key
+    assert store.user_key(2, 'ideas') != key
+    store.bump_user_version(1)
+    assert store.user_key(1, 'ideas') != key
+
+
+def test_versions_survive_fragment_eviction(tmp_path):
+    store = make_cache(tmp_path, CACHE_BACKEND='memory', CACHE_MAX_ENTRIES=4)
+    key = store.user_key(1, 'ideas')
+    for i in range(50):  # another user's fragments fill the LRU
+        store.set(store.user_key(2, 'page', i), 'html')
+    assert store.user_key(1, 'ideas') == key
+
+
+def test_sqlite_versions_are_shared_between_workers(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    first = make_cache(tmp_path, CACHE_BACKEND='sqlite', CACHE_PATH=path)
+    second = make_cache(tmp_path, CACHE_BACKEND='sqlite', CACHE_PATH=path)
+    key = first.user_key(1, 'ideas')
+    assert second.user_key(1, 'ideas') == key
+    second.bump_user_version(1)
+    assert first.user_key(1, 'ideas') != key
+
+
+def test_idea_list_is_cached_until_the_next_write(app, client, user):
+    app.config['CACHE_BACKEND'] = 'memory'
+    cache.init_app(app)
+    add_idea(client, 'First')
+    assert 'First' in client.get('/').get_data(as_text=True)
+    key = cache.user_key(user.id, 'ideas')
+    add_idea(client, 'Second')
+    assert cache.user_key(user.id, 'ideas') != key
+    assert 'Second' in client.get('/').get_data(as_text=True)
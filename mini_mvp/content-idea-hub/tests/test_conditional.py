@@ -0,0 +1,85 @@
+import re
+from datetime import datetime
+from flask import g
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import text, update
+from app import db
+from app.models import Idea
+from conftest import add_idea
+
+
+def settle(client, title):
+    add_idea(client, title)
+    client.get('/')  # shows the flash message: pages with one are never cached
+
+
+def revalidate(client, url, response):
+    return client.get(url, headers={'If-None-Match': response.headers['ETag']})
+
+
+def csrf_token(client, url):
+    # The fixture's app context outlives requests: drop the token Flask-WTF keeps on g.
+    g.pop('csrf_token', None)
+    html = client.get(url).get_data(as_text=True)
+    return re.search(r'name="csrf_token" type="hidden" value="([^"]+)"', html).group(1)
+
+
+def test_unchanged_page_is_not_modified_without_a_cache(client, user):
+    settle(client, 'Cached nowhere')
+    first = client.get('/')
+    assert first.status_code == 200 and first.headers['ETag']
+    second = revalidate(client, '/', first)
+    assert second.status_code == 304 and second.get_data() == b''
+    assert client.get('/', headers={'If-Modified-Since': first.headers['Last-Modified']}).status_code == 200
+
+
+def test_writes_change_the_etag(client, user):
+    settle(client, 'First')
+    page = client.get('/')
+    idea_id = Idea.query.one().id
+    client.patch('/api/v1/ideas', json=[{'id': idea_id, 'title': 'Renamed'}])
+    page = client.get('/', headers={'If-None-Match': page.headers['ETag']})
+    assert page.status_code == 200 and 'Renamed' in page.get_data(as_text=True)
+    client.post(f'/idea/{idea_id}/delete')
+    client.get('/')  # consumes the flash message
+    assert revalidate(client, '/', page).status_code == 200
+
+
+def test_write_by_another_worker_is_seen(client, user):
+    settle(client, 'Shared')
+    page = client.get('/')
+    # Another process writes: no cache version is bumped here.
+    db.session.execute(update(Idea).values(title='Changed elsewhere'))
+    db.session.commit()
+    assert revalidate(client, '/', page).status_code == 200
+
+
+def test_new_session_is_not_revalidated(app, client):
+    app.config['WTF_CSRF_ENABLED'] = True
+    client.post('/register', data={'username': 'alice', 'password': 'secret1',
+                                   'csrf_token': csrf_token(client, '/register')})
+    credentials = {'username': 'alice', 'password': 'secret1'}
+    client.post('/login', data=dict(credentials, csrf_token=csrf_token(client, '/login')))
+    client.post('/idea/new', data={'title': 'Edit me', 'csrf_token': csrf_token(client, '/idea/new')})
+    client.get('/')
+    url = f'/idea/{Idea.query.one().id}/edit'
+    form = client.get(url)
+    assert revalidate(client, url, form).status_code == 304
+
+    client.get('/logout')
+    client.post('/login', data=dict(credentials, csrf_token=csrf_token(client, '/login')))
+    g.pop('csrf_token', None)
+    fresh = revalidate(client, url, form)
+    assert fresh.status_code == 200
+    token = re.search(r'name="csrf_token" type="hidden" value="([^"]+)"', fresh.get_data(as_text=True)).group(1)
+    assert client.post(url, data={'title': 'Edited', 'csrf_token': token}).status_code == 302
+    assert Idea.query.one().title == 'Edited'
+
+
+def test_updated_at_is_backfilled(app, user):
+    downgrade(revision='0dc12fc71ea3')
+    db.session.execute(text("INSERT INTO idea (title, timestamp, user_id) VALUES ('old', '2024-05-06 07:08:09', :u)"),
+                       {'u': user.id})
+    db.session.commit()
+    upgrade()
+    assert Idea.query.one().updated_at == datetime(2024, 5, 6, 7, 8, 9)
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+import threading
+import config
+
+IMPORT_KEY = 'import config; print(config.Config.SECRET_KEY)'
+
+
+def test_concurrent_imports_agree_on_one_key(tmp_path):
+    env = {k: v for k, v in os.environ.items() if k != 'SECRET_KEY'}
+    for round in range(5):
+        env['SECRET_KEY_FILE'] = str(tmp_path / f'round{round}' / 'secret_key')
+        workers = [
+            subprocess.Popen([sys.executable, '-c', IMPORT_KEY], cwd=config.BASE_DIR, env=env,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            for _ in range(12)
+        ]
+        outputs = [worker.communicate() for worker in workers]
+        assert [err for _, err in outputs if err] == []
+        keys = {out.strip() for out, _ in outputs}
+        assert len(keys) == 1 and len(keys.pop()) == 64
+
+
+def test_racing_loads_never_read_a_partial_key(tmp_path, monkeypatch):
+    monkeypatch.delenv('SECRET_KEY', raising=False)
+    for round in range(30):
+        monkeypatch.setenv('SECRET_KEY_FILE', str(tmp_path / f'round{round}' / 'secret_key'))
+        start, keys, errors = threading.Barrier(12), [], []
+
+        def load():
+            start.wait()
+            try:
+                keys.append(config.load_secret_key())
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=load) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == [] and len(set(keys)) == 1
+        assert os.listdir(tmp_path / f'round{round}') == ['secret_key']
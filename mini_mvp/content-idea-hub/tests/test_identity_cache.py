@@ -0,0 +1,95 @@
+import pytest
+from flask import g
+from sqlalchemy import event
+from app import cache, db, identity_cache
+from app.cache import IdentityCache, MemoryBackend, SQLiteBackend
+from app.models import User
+
+
+@pytest.fixture
+def cached(app, tmp_path, user):
+    """The app's identity cache on, with version tokens in a shared sqlite cache."""
+    app.config.update(USER_CACHE_TTL=60, CACHE_BACKEND='sqlite', CACHE_PATH=str(tmp_path / 'cache.db'))
+    cache.init_app(app)
+    identity_cache.init_app(app, User, cache)
+    identity_cache.hits = identity_cache.misses = 0
+    yield identity_cache
+    app.config.update(USER_CACHE_TTL=0, CACHE_BACKEND='null')
+    cache.init_app(app)
+    identity_cache.init_app(app, User, cache)
+
+
+def other_worker(tmp_path):
+    worker = IdentityCache()
+    worker.ttl, worker.model = 60, User
+    worker.backend = MemoryBackend()
+    worker.versions = SQLiteBackend(str(tmp_path / 'cache.db'))
+    return worker
+
+
+def count_user_selects():
+    selects = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('SELECT') and 'FROM user' in statement:
+            selects.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    return selects, lambda: event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def test_second_load_is_a_hit_without_a_query(cached, user):
+    db.session.expunge_all()
+    assert cached.load(db.session, user.id).username == 'alice'
+    db.session.expunge_all()
+    selects, stop = count_user_selects()
+    assert cached.load(db.session, user.id).username == 'alice'
+    stop()
+    assert selects == []
+    assert cached.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+
+def test_requests_load_the_user_from_the_cache(cached, client):
+    for _ in range(2):
+        g.pop('_login_user', None)  # the fixture's app context outlives requests
+        client.get('/')
+    assert cached.hits >= 1
+
+
+def test_update_and_delete_invalidate(cached, user):
+    user_id = user.id
+    cached.load(db.session, user_id)
+    user.username = 'alicia'
+    db.session.commit()
+    db.session.expunge_all()
+    assert cached.load(db.session, user_id).username == 'alicia'
+    assert cached.misses == 2
+
+    db.session.delete(db.session.get(User, user_id))
+    db.session.commit()
+    assert cached.load(db.session, user_id) is None
+
+
+def test_other_workers_see_changes_through_the_shared_token(cached, user, tmp_path):
+    user_id = user.id
+    worker = other_worker(tmp_path)
+    worker.load(db.session, user_id)
+    worker.load(db.session, user_id)
+    assert worker.hits == 1
+
+    user.set_password('changed1')
+    db.session.commit()
+    db.session.expunge_all()
+    fresh = worker.load(db.session, user_id)
+    assert worker.misses == 2 and fresh.check_password('changed1')
+
+
+def test_rollback_keeps_the_token(cached, user, tmp_path):
+    user_id = user.id
+    worker = other_worker(tmp_path)
+    worker.load(db.session, user_id)
+    user.username = 'not kept'
+    db.session.flush()
+    db.session.rollback()
+    worker.load(db.session, user_id)
+    assert worker.hits == 1
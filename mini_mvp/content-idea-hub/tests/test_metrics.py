@@ -0,0 +1,43 @@
+import re
+from flask_migrate import upgrade
+from config import ProductionConfig, TestingConfig
+from app import create_app
+from conftest import add_idea
+
+TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries", tpl;dur=[\d.]+, app;dur=[\d.]+')
+
+
+def test_pages_carry_server_timing(client, user):
+    add_idea(client, 'Timed idea', 'x')
+    response = client.get('/')
+    match = TIMING.fullmatch(response.headers['Server-Timing'])
+    assert match and int(match.group(1)) >= 1
+
+
+def test_debug_metrics_is_off_in_production(tmp_path):
+    class Config(ProductionConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path}/metrics.db'
+        CACHE_PATH = str(tmp_path / 'cache.db')
+        SESSION_PATH = str(tmp_path / 'sessions.db')
+        DEBUG_METRICS = False
+
+    app = create_app(Config)
+    assert 'debug_metrics' not in app.view_functions
+    assert app.test_client().get('/debug/metrics').status_code == 404
+
+
+def test_debug_metrics_when_enabled(tmp_path):
+    class Config(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path}/metrics.db'
+        DEBUG_METRICS = True
+
+    app = create_app(Config)
+    with app.app_context():
+        upgrade()
+        client = app.test_client()
+        client.get('/login')
+        response = client.get('/debug/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    assert 'http_requests_total{endpoint="main.login",method="GET",status="200"}' in response.text
+    assert '# TYPE db_query_duration_seconds histogram' in response.text
@@ -0,0 +1,98 @@
+import sys
+import pytest
+import sqlalchemy as sa
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import text
+from app import db
+from app.dedup import band_rows, signature
+from app.search import search_ideas
+from conftest import add_idea
+
+FTS_TRIGGERS = ['idea_fts_ad', 'idea_fts_ai', 'idea_fts_au']
+
+
+def triggers():
+    return db.session.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'idea' ORDER BY name"
+    )).scalars().all()
+
+
+def test_downgrade_and_upgrade_keep_the_search_triggers(app, client, user):
+    add_idea(client, 'Before the round trip')
+    downgrade(revision='07807af39d15')
+    assert triggers() == FTS_TRIGGERS
+    upgrade()
+    assert triggers() == FTS_TRIGGERS
+    add_idea(client, 'Searchable after the round trip')
+    found = {idea.title for idea, _, _ in search_ideas(user.id, 'round trip')}
+    assert found == {'Before the round trip', 'Searchable after the round trip'}
+
+
+def fail_after(monkeypatch, batches):
+    """Make the backfill crash once `batches` batches of 2 rows are committed."""
+    backfill_module = sys.modules['app.backfill']
+    save = backfill_module._save_checkpoint
+    calls = []
+
+    def failing(connection, *args):
+        calls.append(args)
+        if len(calls) > batches:
+            raise RuntimeError('interrupted')
+        save(connection, *args)
+
+    monkeypatch.setattr(backfill_module, 'BATCH_SIZE', 2)
+    monkeypatch.setattr(backfill_module, '_save_checkpoint', failing)
+    with pytest.raises((SystemExit, RuntimeError)):
+        upgrade()
+    monkeypatch.setattr(backfill_module, '_save_checkpoint', save)
+
+
+def insert_ideas(user_id, *rows):
+    for title, tags in rows:
+        db.session.execute(text('INSERT INTO idea (title, tags, timestamp, user_id) '
+                                "VALUES (:title, :tags, '2024-01-01 10:00:00', :user_id)"),
+                           {'title': title, 'tags': tags, 'user_id': user_id})
+    db.session.commit()
+
+
+def test_interrupted_backfill_resumes_over_rows_the_app_wrote(app, user, monkeypatch):
+    downgrade(revision='07807af39d15')
+    insert_ideas(user.id, *((f'idea number {i}', None) for i in range(7)))
+    fail_after(monkeypatch, 2)
+    assert db.session.execute(text('SELECT count(DISTINCT idea_id) FROM idea_band')).scalar() == 4
+
+    # Meanwhile the new code indexes the last idea itself.
+    last_id = db.session.execute(text('SELECT max(id) FROM idea')).scalar()
+    sig = signature('idea number 6')
+    db.session.execute(text('UPDATE idea SET minhash = :sig WHERE id = :id'), {'sig': sig, 'id': last_id})
+    for row in band_rows(last_id, user.id, sig):
+        db.session.execute(text('INSERT INTO idea_band VALUES (:idea_id, :band, :bucket, :user_id)'), row)
+    db.session.commit()
+
+    upgrade()
+    assert db.session.execute(text('SELECT count(*) FROM idea_band')).scalar() == 7 * 16
+    assert 'migration_checkpoint' not in sa.inspect(db.engine).get_table_names()
+
+
+def test_tag_stats_backfill_replaces_counts_the_app_wrote(app, user, monkeypatch):
+    downgrade(revision='bcb1f9aa0f49')
+    ideas = {'a': ['x'], 'b': ['x'], 'c': ['x', 'y'], 'd': ['y']}
+    insert_ideas(user.id, *((title, ', '.join(tags)) for title, tags in ideas.items()))
+    for title, tags in ideas.items():
+        for name in tags:
+            db.session.execute(text('INSERT OR IGNORE INTO tag (name, user_id) VALUES (:name, :user_id)'),
+                               {'name': name, 'user_id': user.id})
+            db.session.execute(text('INSERT INTO idea_tag SELECT idea.id, tag.id FROM idea, tag '
+                                    'WHERE idea.title = :title AND tag.name = :name'),
+                               {'title': title, 'name': name})
+    db.session.commit()
+    fail_after(monkeypatch, 0)
+
+    # A new idea tagged x while the tables exist but are still empty: the app adds its delta.
+    db.session.execute(text('INSERT INTO tag_stats SELECT id, user_id, 1, NULL FROM tag WHERE name = :n'), {'n': 'x'})
+    db.session.commit()
+    upgrade()
+    counts = dict(db.session.execute(text(
+        'SELECT tag.name, tag_stats.idea_count FROM tag_stats JOIN tag ON tag.id = tag_stats.tag_id'
+    )).all())
+    assert counts == {'x': 3, 'y': 2}
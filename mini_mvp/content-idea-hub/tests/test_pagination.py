@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from app import db
+from app.models import Idea
+from app.pagination import decode_cursor, encode_cursor, paginate_ideas
+
+
+def add_ideas(user, count, same_timestamp=False):
+    start = datetime(2026, 1, 1)
+    ideas = [
+        Idea(title=f'idea {i}', user_id=user.id,
+             timestamp=start if same_timestamp else start + timedelta(minutes=i))
+        for i in range(count)
+    ]
+    db.session.add_all(ideas)
+    db.session.commit()
+    return ideas
+
+
+def walk(user, per_page):
+    query = Idea.query.filter_by(user_id=user.id)
+    pages, page = [], paginate_ideas(query, per_page)
+    while True:
+        pages.append(page)
+        if not page.has_next:
+            return pages
+        page = paginate_ideas(query, per_page, after=page.next_cursor)
+
+
+def test_cursor_round_trip_and_tampering(user):
+    idea = add_ideas(user, 1)[0]
+    assert decode_cursor(encode_cursor(idea)) == (idea.timestamp, idea.id)
+    assert decode_cursor('not a cursor') is None
+    assert decode_cursor(None) is None
+
+
+def test_pages_cover_every_idea_once_newest_first(user):
+    ideas = add_ideas(user, 23)
+    pages = walk(user, 5)
+    titles = [idea.title for page in pages for idea in page.items]
+    assert titles == [idea.title for idea in reversed(ideas)]
+    assert [len(page.items) for page in pages] == [5, 5, 5, 5, 3]
+    assert not pages[0].has_prev and pages[1].has_prev
+
+
+def test_ties_on_timestamp_are_broken_by_id(user):
+    add_ideas(user, 12, same_timestamp=True)
+    ids = [idea.id for page in walk(user, 5) for idea in page.items]
+    assert ids == sorted(ids, reverse=True) and len(set(ids)) == 12
+
+
+def test_before_cursor_goes_back_to_the_previous_page(user):
+    add_ideas(user, 12)
+    query = Idea.query.filter_by(user_id=user.id)
+    first = paginate_ideas(query, 5)
+    second = paginate_ideas(query, 5, after=first.next_cursor)
+    back = paginate_ideas(query, 5, before=second.prev_cursor)
+    assert [i.id for i in back.items] == [i.id for i in first.items]
+    assert not back.has_prev and back.next_cursor == first.next_cursor
+
+
+def test_index_links_to_the_next_page(client, user):
+    add_ideas(user, 7)
+    page = client.get('/?per_page=5').get_data(as_text=True)
+    assert 'idea 6' in page and 'idea 1' not in page and 'after=' in page
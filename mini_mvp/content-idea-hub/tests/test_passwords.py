@@ -0,0 +1,79 @@
+import sys
+import pytest
+from flask import g
+from werkzeug.security import check_password_hash, generate_password_hash
+from app import db, passwords
+from app.models import User
+from app.passwords import HasherBusy
+from conftest import login, register
+
+
+@pytest.fixture
+def saturated(app):
+    """A one-slot hasher whose slot is taken."""
+    app.config.update(PASSWORD_HASH_MAX_PENDING=1, PASSWORD_HASH_TIMEOUT=0.01)
+    passwords.init_app(app)
+    passwords._slots.acquire()
+    yield passwords
+    passwords._slots.release()
+    app.config.update(PASSWORD_HASH_MAX_PENDING=0, PASSWORD_HASH_TIMEOUT=2)
+    passwords.init_app(app)
+
+
+@pytest.fixture
+def verifies(monkeypatch):
+    calls = []
+
+    def counting(pwhash, password):
+        calls.append(pwhash)
+        return check_password_hash(pwhash, password)
+
+    monkeypatch.setattr(sys.modules['app.passwords'], 'check_password_hash', counting)
+    return calls
+
+
+def test_saturated_pool_raises_busy(saturated):
+    rejected = saturated.rejected
+    with pytest.raises(HasherBusy):
+        saturated.hash('secret1')
+    with pytest.raises(HasherBusy):
+        saturated.verify(None, 'secret1')
+    assert saturated.rejected == rejected + 2
+    assert saturated.in_flight == 0
+
+
+def test_saturated_login_answers_503(client, saturated):
+    response = login(client)
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+    assert b'The server is busy' in response.data
+    assert client.post('/register', data={'username': 'bobby', 'password': 'secret1'}).status_code == 503
+    assert User.query.filter_by(username='bobby').first() is None
+
+
+def test_needs_rehash_spots_other_parameters(app):
+    assert not passwords.needs_rehash(passwords.hash('secret1'))
+    assert passwords.needs_rehash(generate_password_hash('secret1', 'pbkdf2:sha256:500'))
+    assert passwords.needs_rehash(generate_password_hash('secret1', 'scrypt'))
+
+
+def test_login_upgrades_an_outdated_hash(client):
+    register(client)
+    user = User.query.filter_by(username='alice').one()
+    user.password_hash = generate_password_hash('secret1', 'pbkdf2:sha256:500')
+    db.session.commit()
+    g.pop('_login_user', None)  # the fixture's app context outlives requests
+    assert login(client).status_code == 302
+    db.session.expire_all()
+    assert user.password_hash.startswith('pbkdf2:sha256:1000$')
+    assert check_password_hash(user.password_hash, 'secret1')
+
+
+def test_unknown_user_costs_one_verify(client, verifies):
+    register(client)
+    verifies.clear()
+    login(client, username='nobody')
+    assert verifies == [passwords._dummy]
+    verifies.clear()
+    login(client, password='wrong12')
+    assert len(verifies) == 1
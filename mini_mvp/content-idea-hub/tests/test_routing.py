@@ -0,0 +1,63 @@
+import shutil
+import pytest
+from flask_migrate import upgrade
+from sqlalchemy import select, text
+from config import TestingConfig
+from app import create_app, db
+from app.models import Idea, User
+from conftest import login
+
+
+@pytest.fixture
+def routed(tmp_path):
+    """App whose replica is a copy of the primary taken before 'primary only' was added."""
+    class Config(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path}/primary.db'
+        SQLALCHEMY_BINDS = {'replica': f'sqlite:///{tmp_path}/replica.db'}
+        SECRET_KEY = 'test'
+    app = create_app(Config)
+    with app.app_context():
+        upgrade()
+        user = User(username='alice')
+        user.set_password('secret1')
+        db.session.add(user)
+        db.session.add(Idea(title='on both', author=user))
+        db.session.commit()
+        user_id = user.id
+        db.session.execute(text('PRAGMA wal_checkpoint(TRUNCATE)'))
+        db.session.remove()
+        db.engine.dispose()
+        shutil.copy(tmp_path / 'primary.db', tmp_path / 'replica.db')
+        db.session.add(Idea(title='primary only', user_id=user_id))
+        db.session.commit()
+    return app
+
+
+def titles(client):
+    return sorted(item['title'] for item in client.get('/api/v1/ideas?fields=title').get_json()['items'])
+
+
+def test_reads_go_to_the_replica_once_the_session_is_not_sticky(routed):
+    router = routed.extensions['db_router']
+    router.sticky = 0
+    client = routed.test_client()
+    login(client)
+    assert titles(client) == ['on both']
+    assert router.replica_requests >= 1
+
+
+def test_reads_after_a_write_stay_on_the_primary(routed):
+    client = routed.test_client()
+    login(client)  # a POST: sticky for DB_STICKY_SECONDS
+    assert titles(client) == ['on both', 'primary only']
+
+
+def test_a_flush_moves_the_session_to_the_primary(routed):
+    with routed.test_request_context():
+        db.session.info.update(read_only=True, replica=db.engines['replica'])
+        assert db.session.scalars(select(Idea.title)).all() == ['on both']
+        db.session.add(Idea(title='written', user_id=1))
+        db.session.flush()
+        assert db.session.info['read_only'] is False
+        assert sorted(db.session.scalars(select(Idea.title))) == ['on both', 'primary only', 'written']
+        db.session.rollback()
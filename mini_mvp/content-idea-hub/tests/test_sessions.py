@@ -0,0 +1,135 @@
+import time
+import pytest
+from flask import Flask, g, session
+from app import sessions
+from app.sessions import MemorySessionStore, SQLiteSessionStore, ServerSessions
+from conftest import login, register
+
+
+def store():
+    return sessions.interface.store
+
+
+def test_login_gets_a_new_session_id(client):
+    register(client)
+    with client.session_transaction() as data:
+        data['seen'] = True
+    before = client.get_cookie('session').value
+    login(client)
+    after = client.get_cookie('session').value
+    assert after != before
+    assert store().load(before) is None and store().load(after) is not None
+
+
+def test_reads_do_not_resend_the_cookie(client, user):
+    response = client.get('/')
+    assert response.status_code == 200
+    assert 'Set-Cookie' not in response.headers
+    assert 'Cookie' in response.vary
+
+
+def test_logout_deletes_the_stored_session(client, user):
+    sid = client.get_cookie('session').value
+    client.get('/logout')
+    assert store().load(sid) is None
+    assert client.get('/').status_code == 302
+
+
+def test_revoke_ends_every_session_of_a_user(app, client, user):
+    other = app.test_client()
+    g.pop('_login_user', None)  # the fixture's app context outlives requests
+    login(other)
+    assert sessions.revoke_user(user.id) == 2
+    for each in (client, other):
+        g.pop('_login_user', None)
+        assert each.get('/').status_code == 302
+
+
+@pytest.mark.parametrize('make_store', [
+    lambda tmp_path: MemorySessionStore(),
+    lambda tmp_path: SQLiteSessionStore(str(tmp_path / 'sessions.db')),
+])
+def test_sweep_removes_expired_sessions(tmp_path, make_store):
+    sessions_store = make_store(tmp_path)
+    now = time.time()
+    for i in range(5):
+        sessions_store.save(f'old{i}', '{}', now - 1, '1')
+    sessions_store.save('live', '{}', now + 60, '1')
+    assert sessions_store.load('old0') is None
+    assert sessions_store.sweep(batch=2) == 5
+    assert sessions_store.load('live') == ('{}', now + 60)
+
+
+def make_app(tmp_path):
+    app = Flask(__name__)
+    app.config.update(SECRET_KEY='test', SESSION_BACKEND='sqlite', SESSION_PATH=str(tmp_path / 'sessions.db'))
+    ServerSessions().init_app(app)
+
+    @app.route('/set/<value>')
+    def set_value(value):
+        session['value'] = value
+        return ''
+
+    @app.route('/get')
+    def get_value():
+        return session.get('value', '')
+
+    return app
+
+
+def test_sqlite_sessions_are_shared_between_workers(tmp_path):
+    first, second = make_app(tmp_path).test_client(), make_app(tmp_path).test_client()
+    first.get('/set/shared')
+    second.set_cookie('session', first.get_cookie('session').value)
+    assert second.get('/get').get_data(as_text=True) == 'shared'
+    assert first.get('/get').headers.get('Set-Cookie') is None
+
+
+@pytest.fixture
+def small_store(app):
+    """Room for 2 logged-in and 3 anonymous sessions in memory."""
+    app.config.update(SESSION_MAX_ENTRIES=2, SESSION_MAX_ANONYMOUS=3, WTF_CSRF_ENABLED=False)
+    sessions.init_app(app)
+    yield store()
+    app.config.update(SESSION_MAX_ENTRIES=10000, SESSION_MAX_ANONYMOUS=10000)
+    sessions.init_app(app)
+
+
+def visit_login_page(app):
+    visitor = app.test_client()
+    g.pop('csrf_token', None)  # the fixture's app context outlives requests
+    g.pop('_login_user', None)
+    app.config['WTF_CSRF_ENABLED'] = True
+    visitor.get('/login')
+    app.config['WTF_CSRF_ENABLED'] = False
+    return visitor.get_cookie('session').value
+
+
+def test_anonymous_sessions_do_not_evict_logged_in_ones(app, client, small_store):
+    register(client)
+    login(client)
+    sid = client.get_cookie('session').value
+    visitors = [visit_login_page(app) for _ in range(20)]
+    assert small_store.load(sid) is not None
+    assert [small_store.load(v) is not None for v in visitors[-4:]] == [False, True, True, True]
+    g.pop('_login_user', None)
+    assert client.get('/').status_code == 200
+
+
+def test_anonymous_sessions_expire_sooner(tmp_path):
+    app = make_app(tmp_path)
+    app.config['SESSION_ANONYMOUS_LIFETIME'] = 600
+    ServerSessions().init_app(app)
+
+    @app.route('/login-as/<user_id>')
+    def login_as(user_id):
+        session['_user_id'] = user_id
+        return ''
+
+    client, now = app.test_client(), time.time()
+    client.get('/set/anonymous')
+    anonymous = app.session_interface.store.load(client.get_cookie('session').value)
+    assert now + 600 <= anonymous[1] < now + 660
+    client.get('/login-as/7')
+    logged_in = app.session_interface.store.load(client.get_cookie('session').value)
+    assert logged_in[1] >= now + app.permanent_session_lifetime.total_seconds()
@@ -0,0 +1,51 @@
+import re
+from datetime import datetime, timedelta
+from app import db
+from app.models import Idea
+from conftest import add_idea
+
+ROW = re.compile(r'<tr>\s*<td>.*?</tr>', re.S)
+
+
+def rows(response):
+    assert response.status_code == 200
+    return [re.sub(r'\s+', ' ', row) for row in ROW.findall(response.get_data(as_text=True))]
+
+
+def add_ideas(user, count):
+    start = datetime(2026, 1, 1)
+    db.session.add_all(
+        Idea(title=f'idea {i}', user_id=user.id, timestamp=start + timedelta(minutes=i))
+        for i in range(count)
+    )
+    db.session.commit()
+
+
+def test_streamed_list_matches_the_page(client, user):
+    add_ideas(user, 7)
+    page = client.get('/?per_page=50')
+    streamed = client.get('/?stream=1')
+    assert streamed.is_streamed
+    assert len(rows(page)) == 7 and rows(streamed) == rows(page)
+    assert 'Paginated view' in streamed.text and 'Show all ideas' in page.text
+
+
+def test_streamed_list_is_the_pages_joined(client, user):
+    add_ideas(user, 12)
+    first = client.get('/?per_page=5')
+    assert len(rows(first)) == 5 and 'Older &raquo;' in first.text
+    after = re.search(r'after=([^&"]+)', first.text).group(1)
+    second = client.get(f'/?per_page=5&after={after}')
+    assert rows(client.get('/?stream=1&per_page=5'))[:10] == rows(first) + rows(second)
+    assert len(rows(client.get('/?stream=1&per_page=5'))) == 12
+
+
+def test_tag_filter_applies_to_the_stream(client, user):
+    add_idea(client, 'Tagged video', 'video,funny')
+    add_idea(client, 'Other video', 'video')
+    add_idea(client, 'Untagged', '')
+    client.get('/')  # consume the flashed messages
+    streamed = rows(client.get('/?stream=1&tags=funny,video'))
+    assert len(streamed) == 1 and 'Tagged video' in streamed[0]
+    assert streamed == rows(client.get('/?tags=funny,video'))
+    assert len(rows(client.get('/ideas?stream=1'))) == 3
@@ -0,0 +1,45 @@
+from app import db
+from app.models import Idea, Tag, parse_tags
+from conftest import add_idea, login, register
+
+
+def test_parse_tags_normalizes_and_deduplicates():
+    assert parse_tags(' Video, funny,,VIDEO , tech ') == ['video', 'funny', 'tech']
+    assert parse_tags(None) == []
+
+
+def test_tags_are_shared_between_ideas_of_a_user(client, user):
+    add_idea(client, 'First', 'Video, tech')
+    add_idea(client, 'Second', 'tech,funny')
+    names = sorted(tag.name for tag in Tag.query.filter_by(user_id=user.id))
+    assert names == ['funny', 'tech', 'video']
+    second = Idea.query.filter_by(title='Second').one()
+    assert sorted(tag.name for tag in second.tag_list) == ['funny', 'tech']
+
+
+def test_tags_are_per_user(app, client, user):
+    add_idea(client, 'Mine', 'tech')
+    client.get('/logout')
+    register(client, 'bobby')
+    login(client, 'bobby')
+    add_idea(client, 'Theirs', 'tech')
+    assert Tag.query.filter_by(name='tech').count() == 2
+
+
+def test_filter_matches_whole_tags_and_requires_all_of_them(client, user):
+    add_idea(client, 'Gadgets', 'tech, video')
+    add_idea(client, 'Labs', 'biotech')
+    add_idea(client, 'Podcast', 'tech')
+    page = client.get('/?tags=tech').get_data(as_text=True)
+    assert 'Gadgets' in page and 'Podcast' in page and 'Labs' not in page
+    page = client.get('/?tags=video,TECH').get_data(as_text=True)
+    assert 'Gadgets' in page and 'Podcast' not in page
+
+
+def test_editing_tags_relinks_the_idea(client, user):
+    add_idea(client, 'Gadgets', 'tech, video')
+    idea = Idea.query.filter_by(title='Gadgets').one()
+    client.post(f'/idea/{idea.id}/edit', data={'title': 'Gadgets', 'tags': 'audio'})
+    db.session.expire_all()
+    assert [tag.name for tag in db.session.get(Idea, idea.id).tag_list] == ['audio']
+    assert 'Gadgets' not in client.get('/?tags=tech').get_data(as_text=True)
@@ -0,0 +1,52 @@
+from contextlib import contextmanager
+from sqlalchemy import event, select
+from app import db
+from app.models import Idea, IdeaBand, Tag, TagPair, TagStat
+from conftest import add_idea
+
+
+@contextmanager
+def statements():
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        yield executed
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def counts():
+    return dict(db.session.execute(
+        select(Tag.name, TagStat.idea_count).join(TagStat, TagStat.tag_id == Tag.id)
+    ).all())
+
+
+def test_creating_an_idea_takes_a_fixed_number_of_statements(client, user):
+    add_idea(client, 'warm up', 'old')
+    client.get('/')
+    with statements() as few:
+        add_idea(client, 'Two tags', 'old, new1', 'a first description')
+    client.get('/')  # loads the user again, outside of the measure
+    with statements() as many:
+        add_idea(client, 'Eight tags', 'old, ' + ', '.join(f'more{i}' for i in range(7)), 'nothing like the others')
+    assert len(many) == len(few) <= 9
+    assert sum(s.startswith('INSERT INTO tag ') for s in many) == 1
+    assert not any(s.startswith('DELETE') for s in many)
+    assert db.session.query(IdeaBand).count() == 3 * 16
+
+
+def test_stats_follow_creates_edits_and_deletes(client, user):
+    add_idea(client, 'one', 'a, b')
+    add_idea(client, 'two', 'a, c')
+    assert counts() == {'a': 2, 'b': 1, 'c': 1}
+    idea = Idea.query.filter_by(title='one').one()
+    client.post(f'/idea/{idea.id}/edit', data={'title': 'one', 'tags': 'a, c'})
+    assert counts() == {'a': 2, 'c': 2}
+    assert [pair.count for pair in TagPair.query] == [2]
+    client.post(f'/idea/{idea.id}/delete')
+    assert counts() == {'a': 1, 'c': 1}
+    assert [pair.count for pair in TagPair.query] == [1]
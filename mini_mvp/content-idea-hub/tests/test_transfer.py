@@ -0,0 +1,61 @@
+import io
+import json
+import re
+from app.models import Idea
+
+IMPORT = '/api/v1/ideas/import'
+
+
+def progress(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_import_reports_progress_and_errors(app, client, user):
+    app.config['IMPORT_BATCH_SIZE'] = 2
+    body = '\n'.join([
+        json.dumps({'title': 'one', 'tags': 'a'}),
+        json.dumps({'title': 'two'}),
+        'not json',
+        json.dumps({'title': ''}),
+        json.dumps({'title': 'three', 'timestamp': '2024-01-02T03:04:05+01:00'}),
+    ])
+    lines = progress(client.post(IMPORT, data=body, content_type='application/x-ndjson'))
+    assert [line['done'] for line in lines] == [False, True]
+    assert lines[-1]['imported'] == 3 and lines[-1]['failed'] == 2
+    assert [error['line'] for error in lines[-1]['errors']] == [3, 4]
+    assert Idea.query.filter_by(title='three').one().timestamp.hour == 2
+
+
+def test_export_can_be_imported_back(client, user):
+    client.post(IMPORT, data={'file': (io.BytesIO(b'title,tags\nfirst,"a,b"\nsecond,\n'), 'ideas.csv')})
+    exported = client.get('/api/v1/ideas/export?format=csv').get_data()
+    assert exported.splitlines()[0] == b'id,title,description,tags,timestamp'
+    lines = progress(client.post(IMPORT, data={'file': (io.BytesIO(exported), 'again.csv')}))
+    assert lines[-1]['imported'] == 2
+    assert sorted(i.title for i in Idea.query.filter_by(tags='a,b')) == ['first', 'first']
+
+
+def test_import_requires_the_csrf_token(app, client, user):
+    app.config['WTF_CSRF_ENABLED'] = True
+    upload = {'file': (io.BytesIO(b'title\ncsrf\n'), 'ideas.csv')}
+    assert client.post(IMPORT, data=upload).status_code == 400
+    assert client.post(IMPORT, data='title\ncsrf\n', content_type='text/plain').status_code == 400
+    assert client.post(IMPORT, data='title\ncsrf\n', content_type='text/plain',
+                       headers={'X-CSRFToken': 'forged'}).status_code == 400
+    assert Idea.query.count() == 0
+
+    token = client.get('/api/v1/csrf-token').get_json()['csrf_token']
+    response = client.post(IMPORT, data='title\ncsrf\n', content_type='text/plain',
+                           headers={'X-CSRFToken': token})
+    assert progress(response)[-1]['imported'] == 1
+    upload = {'file': (io.BytesIO(b'title\nform\n'), 'ideas.csv'), 'csrf_token': token}
+    assert progress(client.post(IMPORT, data=upload))[-1]['imported'] == 1
+
+
+def test_csrf_token_matches_the_forms(app, client, user):
+    app.config['WTF_CSRF_ENABLED'] = True
+    client.get('/api/v1/csrf-token')
+    form = client.get('/idea/new').get_data(as_text=True)
+    token = re.search(r'name="csrf_token" type="hidden" value="([^"]+)"', form).group(1)
+    response = client.post(IMPORT, data='title\nx\n', content_type='text/plain', headers={'X-CSRFToken': token})
+    assert response.status_code == 200